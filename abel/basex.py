@@ -70,7 +70,7 @@ from abel.tools.polynomial import PiecewisePolynomial
 
 
 def basex_transform(data, sigma=1.0, reg=0.0, correction=True, basis_dir='',
-                    dr=1.0, verbose=True, direction='inverse'):
+                    dr=1.0, verbose=True, direction='inverse', var=None):
     """
     This function performs the :doc:`BASEX (BAsis Set EXpansion)
     <transform_methods/basex>` Abel transform. It works on a "right side"
@@ -116,11 +116,19 @@ def basex_transform(data, sigma=1.0, reg=0.0, correction=True, basis_dir='',
         determines whether statements should be printed
     direction : str: ``'forward'`` or ``'inverse'``
         type of Abel transform to be performed
+    var : m × n numpy array, optional
+        variances of the input image pixels (for example, ``var=data`` for
+        Poisson statistics), assumed to be independent. If given, the
+        variances of the transformed image are also calculated by linear
+        error propagation, at the cost of about one additional transform.
 
     Returns
     -------
     recon : m × n numpy array
         the transformed (half) image
+    recon_var : m × n numpy array
+        variances of the transformed image pixels (returned only if **var** is
+        given)
     """
 
     # make sure that the data is the right shape (1D must be converted to 2D):
@@ -144,13 +152,20 @@ def basex_transform(data, sigma=1.0, reg=0.0, correction=True, basis_dir='',
 
     # do the actual transform
     recon = basex_core_transform(data, A)
+    if var is not None:
+        # each output pixel is a linear combination of input pixels in the
+        # same row, thus its variance is that with squared coefficients
+        recon_var = basex_core_transform(np.atleast_2d(var),
+                                         _get_A2(A, direction))
 
     if data_ndim == 1:  # taking the middle row, since the rest are zeroes
         recon = recon[recon.shape[0] - recon.shape[0]//2 - 1]  # ??
-    if h == 1:
+        if var is not None:
+            recon_var = recon_var[0]
+    if var is None:
         return recon
     else:
-        return recon
+        return recon, recon_var
 
 
 def basex_core_transform(rawdata, A):
@@ -236,6 +251,9 @@ _trf = None      # Af
 # inverse transform
 _tri_prm = None  # [reg, correction, dr]
 _tri = None      # Ai
+# element-wise squared transform matrices (for variance propagation)
+_trf2 = None     # [Af, Af^2]
+_tri2 = None     # [Ai, Ai^2]
 
 def get_bs_cached(n, sigma=1.0, reg=0.0, correction=True, basis_dir='', dr=1.0,
                   verbose=False, direction='inverse'):
@@ -403,6 +421,24 @@ def get_bs_cached(n, sigma=1.0, reg=0.0, correction=True, basis_dir='', dr=1.0,
     return A
 
 
+def _get_A2(A, direction):
+    """ Internal helper function.
+        Gets the element-wise squared transform matrix A (from cache or
+        calculates and caches it).
+    """
+    global _trf2, _tri2
+
+    A2 = _trf2 if direction == 'forward' else _tri2
+    if A2 is not None and A2[0] is A:
+        return A2[1]
+    A2 = [A, A**2]
+    if direction == 'forward':
+        _trf2 = A2
+    else:  # 'inverse'
+        _tri2 = A2
+    return A2[1]
+
+
 def cache_cleanup(select='all'):
     """
     Utility function.
@@ -427,7 +463,7 @@ def cache_cleanup(select='all'):
     -------
     None
     """
-    global _bs_prm, _bs, _trf_prm, _trf, _tri_prm, _tri
+    global _bs_prm, _bs, _trf_prm, _trf, _tri_prm, _tri, _trf2, _tri2
 
     if select == 'all':
         _bs_prm = None
@@ -435,9 +471,11 @@ def cache_cleanup(select='all'):
     if select in ('all', 'forward'):
         _trf_prm = None
         _trf = None
+        _trf2 = None
     if select in ('all', 'inverse'):
         _tri_prm = None
         _tri = None
+        _tri2 = None
 
 
 def basis_dir_cleanup(basis_dir=''):
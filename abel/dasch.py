@@ -49,7 +49,8 @@ _dasch_parameter_docstring = \
     direction : str
         ``'forward'`` or ``'inverse'`` Abel transform. Default: ``'inverse'``.
         (The forward transform is implemented by inverting the deconvolution
-        operator.)
+        operator; for the "three_point" method, the inverted operator is also
+        cached and saved to **basis_dir**.)
 
     verbose : bool
         trace printing
@@ -64,6 +65,9 @@ _dasch_parameter_docstring = \
 _D = None
 _method = None
 _source = None   # 'cache', 'generated', or 'file', for unit testing
+# cache forward-transform operator array (for three_point)
+_F = None
+_F_cols = None
 
 
 def two_point_transform(IM, basis_dir='', dr=1, direction="inverse",
@@ -111,10 +115,13 @@ def _dasch_transform(IM, basis_dir='', dr=1, direction="inverse",
     if cols < 3 and method == "three_point":
         raise ValueError('"three_point" requires image width (cols) > 3')
 
-    D = get_bs_cached(method, cols, basis_dir=basis_dir, verbose=verbose)
+    D = get_bs_cached(method, cols, basis_dir=basis_dir, verbose=verbose,
+                      direction=direction)
 
     if direction == 'inverse':
         tr_IM = dasch_transform(IM, D) / dr
+    elif method == 'three_point':  # D is the forward-transform operator
+        tr_IM = dasch_transform(IM, D) * dr
     else:
         tr_IM = dasch_transform_forward(IM, D) * dr
 
@@ -307,7 +314,8 @@ def _bs_onion_peeling(cols):
     return D
 
 
-def get_bs_cached(method, cols, basis_dir='', verbose=False):
+def get_bs_cached(method, cols, basis_dir='', verbose=False,
+                  direction='inverse'):
     """Load Dasch method deconvolution operator array from cache, or disk.
     Generate and store if not available.
 
@@ -336,6 +344,14 @@ def get_bs_cached(method, cols, basis_dir='', verbose=False):
     verbose: boolean
         print information (mainly for debugging purposes)
 
+    direction : str
+        ``'inverse'`` (default) or ``'forward'``. For the ``three_point``
+        method, ``'forward'`` gives the forward-transform operator array
+        (inverse of the deconvolution operator array, which is not
+        triangular), cached and saved to ``three_point_forward_{cols}.npy``.
+        For the other methods, the deconvolution operator array is
+        triangular and is returned for both directions.
+
     Returns
     -------
     D: numpy 2D array of shape (cols, cols)
@@ -349,6 +365,9 @@ def get_bs_cached(method, cols, basis_dir='', verbose=False):
 
     global _D, _method, _source
 
+    if direction == 'forward' and method == 'three_point':
+        return _get_forward_cached(method, cols, basis_dir, verbose)
+
     # check whether the deconvolution operator array is cached
     if _D is not None:
         if _D.shape[0] >= cols and _method == method:
@@ -401,6 +420,53 @@ def get_bs_cached(method, cols, basis_dir='', verbose=False):
     return _D
 
 
+def _get_forward_cached(method, cols, basis_dir='', verbose=False):
+    """
+    Internal function.
+
+    Load the forward-transform operator array (inverse of the deconvolution
+    operator array) from cache or disk, or generate and store it.
+    Unlike the deconvolution operator arrays, its inverse cannot be sliced to
+    smaller sizes, so only exact matches are used.
+    """
+    global _F, _F_cols, _source
+
+    if _F is not None and _F_cols == cols:
+        if verbose:
+            print('Using memory cached forward operator array')
+        _source = 'cache'
+        return _F
+
+    if basis_dir == '':
+        basis_dir = abel.transform.get_basis_dir(make=True)
+
+    F_name = f'{method}_forward_{cols}.npy'
+    if basis_dir is not None:
+        path_to_file = os.path.join(basis_dir, F_name)
+        if os.path.exists(path_to_file):
+            if verbose:
+                print('Loading forward operator array from file',
+                      path_to_file)
+            _F = np.load(path_to_file)
+            _F_cols = cols
+            _source = 'file'
+            return _F
+
+    D = get_bs_cached(method, cols, basis_dir=basis_dir, verbose=verbose)
+    if verbose:
+        print('Inverting deconvolution operator array...')
+    _F = inv(D)
+    _F_cols = cols
+    _source = 'generated'
+
+    if basis_dir is not None:
+        np.save(path_to_file, _F)
+        if verbose:
+            print(f'forward operator array saved to "{path_to_file}"')
+
+    return _F
+
+
 def cache_cleanup():
     """
     Utility function.
@@ -418,11 +484,13 @@ def cache_cleanup():
     None
     """
 
-    global _D, _method, _source
+    global _D, _method, _source, _F, _F_cols
 
     _D = None
     _method = None
     _source = None
+    _F = None
+    _F_cols = None
 
 
 def basis_dir_cleanup(method, basis_dir=''):
@@ -454,6 +522,7 @@ def basis_dir_cleanup(method, basis_dir=''):
     if method not in ['onion_peeling', 'three_point', 'two_point']:
         raise ValueError(f'Incorrect method "{method}"!')
 
-    files = glob(os.path.join(basis_dir, method + '_basis_*.npy'))
+    files = glob(os.path.join(basis_dir, method + '_basis_*.npy')) + \
+            glob(os.path.join(basis_dir, method + '_forward_*.npy'))
     for fname in files:
         os.remove(fname)
@@ -4,9 +4,9 @@ from glob import glob
 
 import numpy as np
 from scipy.linalg import inv, toeplitz, solve_banded, solve_triangular
-from scipy.optimize import nnls
 
 import abel
+from abel.tools.math import nnls
 
 
 def daun_transform(data, reg=0.0, degree=0, dr=1.0, direction='inverse',
@@ -51,8 +51,8 @@ def daun_transform(data, reg=0.0, degree=0, dr=1.0, direction='inverse',
         ``'nonneg'``:
             non-negative least-squares solution.
 
-            `Warning: this regularization method is very slow, typically taking
-            up to a minute for a megapixel image.`
+            `Warning: this regularization method is iterative and thus much
+            slower than the linear ones.`
     degree : int
         degree of basis-function polynomials:
 
@@ -110,20 +110,26 @@ def daun_transform(data, reg=0.0, degree=0, dr=1.0, direction='inverse',
         if verbose:
             print('Solving NNLS equations...')
             sys.stdout.flush()
-        recon = np.empty_like(data)
-        # transform row by row
-        for i in range(h):
-            if verbose:
-                print(f'\r{1 + i}/{h}', end='')
-                sys.stdout.flush()
-            recon[i] = nnls(M.T, data[i])[0]
+        # start from clipped unconstrained solutions (here M is forward)
+        if degree != 3:
+            recon = solve_triangular(M.T, data.T).T
+        else:
+            recon = np.linalg.solve(M.T, data.T).T
+        # solve for all rows together
+        recon = nnls(M.T, data, recon)
         if verbose:
-            print('\nDone!')
+            print('Done!')
     else:
         # do the linear transform
-        if direction == 'inverse' and strength == 0 and degree != 3:
+        if direction == 'inverse' and strength == 0:
             # (this is faster than general-purpose multiplication by inverse)
-            recon = solve_triangular(M.T, data.T).T  # (here M is forward)
+            if degree != 3:
+                recon = solve_triangular(M.T, data.T).T  # (here M is forward)
+            else:  # M = U L, with factors cached in _tr
+                U, L = _tr
+                # (recon U) L = data
+                recon = solve_triangular(L.T, data.T)
+                recon = solve_banded((len(U) - 1, 0), U, recon).T
         else:
             recon = data.dot(M)
 
@@ -145,6 +151,7 @@ _bs = None  # basis set
 _bs_prm = None  # [size, degree]
 _tr = None  # inverse-transform matrix
 _tr_prm = None  # [size, type, strength]
+_chunk = 2**20  # max. number of elements in temporary arrays for _bs_daun()
 
 
 def get_bs_cached(n, degree=0, reg_type='diff', strength=0,
@@ -154,8 +161,9 @@ def get_bs_cached(n, degree=0, reg_type='diff', strength=0,
 
     Gets the basis set and calculates the necessary transform matrix (notice
     that inverse direction with ``'nonneg'`` regularization, as well as with
-    **strength** = 0 for **degree** ≠ 3, gives the forward (triangular)
-    matrix, to be used in solvers).
+    **strength** = 0, gives the forward matrix, to be used in solvers; it
+    is triangular for **degree** ≠ 3, and for **degree** = 3 its
+    factorization is cached internally).
 
     Parameters
     ----------
@@ -213,14 +221,14 @@ def get_bs_cached(n, degree=0, reg_type='diff', strength=0,
         if _tr is None or _tr_prm[2] != 0:  # not cached or for strength != 0
             # compute transform matrix (full-sized, just in case)
             if degree == 3:
-                # general-purpose inverse of non-triangular
-                _tr = inv(_bs)
+                # factorization of non-triangular matrix for solvers
+                _tr = _factorize(_bs)
             else:
                 # triangular matrix as is — will be used in solve_triangular,
                 # which is even faster than multiplication by cached inverse
                 _tr = _bs
             _tr_prm = [_bs_prm[0], reg_type, strength]
-        return _tr[:n, :n]  # (cropping if too large — safe for triangular)
+        return _bs[:n, :n]  # (cropping if too large — safe for triangular)
 
     if _tr_prm != [n, reg_type, strength]:
         # square of Tikhonov matrix
@@ -244,6 +252,44 @@ def get_bs_cached(n, degree=0, reg_type='diff', strength=0,
     return _tr
 
 
+def _factorize(A):
+    """
+    Internal function.
+
+    Factorize the degree-3 basis matrix as A = U L, where L is
+    lower-triangular and U is unit upper-triangular banded. The upper part of
+    A comes from the smooth-derivative correction and decays exponentially
+    away from the diagonal, becoming negligible beyond a small bandwidth
+    (~30), so the elimination takes only O(n² · bandwidth) operations instead
+    of O(n³) for the general inverse, and solving with these factors is as
+    fast as with a triangular matrix.
+
+    Returns
+    -------
+    U : (bandwidth + 1) × n numpy array
+        U^T in the lower-banded format of :func:`scipy.linalg.solve_banded`
+    L : n × n numpy array
+        lower-triangular factor
+    """
+    n = A.shape[0]
+    # bandwidth of the significant upper part
+    tol = np.finfo(float).eps * np.abs(np.diag(A)).min()
+    b = 0
+    while b + 1 < n and np.abs(np.diag(A, b + 1)).max() > tol:
+        b += 1
+
+    # eliminate the upper band column by column, from the last
+    L = A.copy()
+    U = np.zeros((b + 1, n))
+    U[0] = 1
+    for k in range(n - 1, 0, -1):
+        i = max(0, k - b)
+        m = L[i:k, k] / L[k, k]
+        L[i:k, :k] -= np.outer(m, L[k, :k])
+        U[k - np.arange(i, k), np.arange(i, k)] = m  # U^T[k, i:k]
+    return U, np.tril(L)
+
+
 def _load_bs(basis_dir, n, degree, verbose=False):
     """
     Internal function.
@@ -316,6 +362,12 @@ def _bs_daun(n, degree=0, verbose=False):
     A : n × n numpy array
         coefficient matrix (transposed projected basis set)
     """
+    if degree not in [0, 1, 2, 3]:
+        raise ValueError(f'Wrong degree={degree!r} (must be 0, 1, 2 or 3).')
+
+    if verbose:
+        print(f'Generating basis projections for {n=}, {degree=}...')
+
     # pixel coordinates
     x = np.arange(float(n))
     # (and common subexpressions for projections)
@@ -323,100 +375,106 @@ def _bs_daun(n, degree=0, verbose=False):
     if degree > 0:
         x2logx = x2 * np.log(x, np.zeros_like(x), where=x > 0)
 
-    # projections (Abel transforms) of given-degree basis functions
+    # Projections of the basis function j are combinations of terms
+    #   P(R) = sum_k a_k(j) U_k(R, x),  nonzero for x < R,
+    # with R = j + offset. Functions U_k are evaluated (for blocks of j, as 2D
+    # arrays) only once for each R and shared by all terms with this R.
+    def Y(R, x2):
+        # sqrt(R^2 - x^2) inside the circle of radius R, 0 outside,
+        # and log(y + R) inside
+        inside = (x2 < R**2) & (R > 0)
+        y = np.sqrt(np.where(inside, R**2 - x2, 0))
+        return y, np.log(y + R, np.zeros_like(y), where=inside)
+
     if degree == 0:
-        def p(j):
-            o = np.zeros(n)
-            o[:j + 1] += np.sqrt((j + 1/2)**2 - x2[:j + 1])
-            if j > 0:
-                o[:j] -= np.sqrt((j - 1/2)**2 - x2[:j])
-            return 2 * o
+        def U(R, x2):
+            return [Y(R, x2)[0]]
+
+        terms = [(1/2, lambda j: [2]),
+                 (-1/2, lambda j: [-2])]
     elif degree == 1:
-        def p(j):
-            def P(R):
-                y = np.sqrt(R**2 - x2[:R])
-                return y * R - x2[:R] * np.log(y + R)
-            o = np.zeros(n)
-            o[:j + 1] += P(j + 1)
-            o[:j] -= 2 * P(j)
-            o[j] += x2logx[j]
-            if j > 0:
-                o[:j - 1] += P(j - 1)
-                o[j - 1] -= x2logx[j - 1]
-            return o
-    elif degree == 2:
-        def p(j):
-            def P(R, a, b, c):
-                x2_R = x2[:int(R + 1/2)]
-                y = np.sqrt(R**2 - x2_R)
-                return y * (a * 2 + b * R + c * 4/3 * (R**2 / 2 + x2_R)) + \
-                       b * x2_R * np.log(y + R)
-            o = np.zeros(n)
-            o[:j + 1] += P(j + 1, 2 * (j + 1)**2, -4 * (j + 1), 2) - \
-                         P(j + 1/2, (2 * j + 1)**2, -4 * (2 * j + 1), 4)
-            if j > 0:
-                o[:j] += P(j - 1/2, (2 * j - 1)**2, -4 * (2 * j - 1), 4)
-                o[j] -= 4 * j * x2logx[j]
-                o[:j - 1] -= P(j - 1, 2 * (j - 1)**2, -4 * (j - 1), 2)
-                o[j - 1] += 4 * (j - 1) * x2logx[j - 1]
-            return o
-    elif degree == 3:
-        def p(j):
-            def P(R, a, b, c, d):
-                y = np.sqrt(R**2 - x2[:R])
-                return y * (a * 2 + (b + (c * 2/3 + d * R / 2) * R) * R +
-                            (d * 3/4 * R + c * 4/3) * x2[:R]) + \
-                       (b + d * 3/4 * x2[:R]) * x2[:R] * np.log(y + R)
-            o = np.zeros(n)
-            o[:j + 1] += P(j + 1,
-                           -j**2 * (2 * j + 3) + 1, 6 * j * (j + 1),
-                           -3 * (2 * j + 1),  2)
-            o[:j] += P(j, 4 * j**3, -12 * j**2, 12 * j, -4)
-            o[j] -= (6 * j * (j + 1) + 3/2 * x2[j]) * x2logx[j]
-            if j > 0:
-                o[:j - 1] -= P(j - 1,
-                               j**2 * (2 * j - 3) + 1, -6 * j * (j - 1),
-                               3 * (2 * j - 1), -2)
-                o[j - 1] += 6 * (j * (j - 1) + x2[j - 1] / 4) * x2logx[j - 1]
-            return o
+        def U(R, x2):
+            y, L = Y(R, x2)
+            return [y * R - x2 * L]
 
+        terms = [(1, lambda j: [1]),
+                 (0, lambda j: [-2]),
+                 (-1, lambda j: [1])]
+    elif degree == 2:
+        def U(R, x2):
+            y, L = Y(R, x2)
+            return [2 * y, y * R + x2 * L, 4/3 * y * (R**2 / 2 + x2)]
+
+        terms = [(1, lambda j: [2 * (j + 1)**2, -4 * (j + 1), 2]),
+                 (1/2, lambda j: [-(2 * j + 1)**2, 4 * (2 * j + 1), -4]),
+                 (-1/2, lambda j: [(2 * j - 1)**2, -4 * (2 * j - 1), 4]),
+                 (-1, lambda j: [-2 * (j - 1)**2, 4 * (j - 1), -2])]
+    else:  # degree == 3
+        def U(R, x2):
+            y, L = Y(R, x2)
+            return [2 * y, y * R + x2 * L, y * (R**2 * 2/3 + x2 * 4/3),
+                    y * R * (R**2 / 2 + x2 * 3/4) + x2**2 * 3/4 * L]
+
+        terms = [(1, lambda j: [-j**2 * (2 * j + 3) + 1, 6 * j * (j + 1),
+                                -3 * (2 * j + 1), 2]),
+                 (0, lambda j: [4 * j**3, -12 * j**2, 12 * j, -4]),
+                 (-1, lambda j: [-j**2 * (2 * j - 3) - 1, 6 * j * (j - 1),
+                                 -3 * (2 * j - 1), 2])]
         # derivative basis functions
-        def q(j):
-            def P(R, a, b, c, d):
-                y = np.sqrt(R**2 - x2[:R])
-                return y * (a * 2 + (b + (c * 2/3 + d * R / 2) * R) * R +
-                            (d * 3/4 * R + c * 4/3) * x2[:R]) + \
-                       (b + d * 3/4 * x2[:R]) * x2[:R] * np.log(y + R)
-            o = np.zeros(n)
-            o[:j + 1] += P(j + 1,
-                           -j * (j * (j + 2) + 1), j * (3 * j + 4) + 1,
-                           -3 * j - 2, 1)
-            o[:j] += P(j, 4 * j**2, -8 * j, 4, 0)
-            o[j] -= (j * (3 * j + 4) + 1 + 3/4 * x2[j]) * x2logx[j]
-            if j > 0:
-                o[:j - 1] -= P(j - 1,
-                               -j * (j * (j - 2) + 1), j * (3 * j - 4) + 1,
-                               -3 * j + 2, 1)
-                o[j - 1] -= (j * (3 * j - 4) + 1 + 3/4 * x2[j - 1]) * \
-                            x2logx[j - 1]
-            return o
-    else:
-        raise ValueError(f'Wrong degree={degree!r} (must be 0, 1, 2 or 3).')
+        dterms = [(1, lambda j: [-j * (j * (j + 2) + 1), j * (3 * j + 4) + 1,
+                                 -3 * j - 2, 1]),
+                  (0, lambda j: [4 * j**2, -8 * j, 4, 0]),
+                  (-1, lambda j: [j * (j * (j - 2) + 1), -j * (3 * j - 4) - 1,
+                                  3 * j - 2, -1])]
 
-    if verbose:
-        print(f'Generating basis projections for {n=}, {degree=}...')
-
-    # fill the coefficient matrix
+    # fill the coefficient matrices (lower-triangular) by blocks of rows
     # (transposed compared to the Daun article, since our data are in rows)
-    A = np.empty((n, n))
-    for j in range(n):
-        A[j] = p(j)
-
+    A = np.zeros((n, n))
     if degree == 3:
         # coefficient matrix for derivative functions
-        B = np.empty((n, n))
-        for j in range(n):
-            B[j] = q(j)
+        B = np.zeros((n, n))
+    step = max(1, _chunk // (4 * n))
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        j = np.arange(float(start), float(stop))[:, None]
+        # U_k for R = j + offset on integer (offset = -1, 0, 1) and
+        # half-integer (offset = -1/2, 1/2) grids, from start - 1 to stop
+        grid = {}
+        for offset, _ in terms:
+            frac = offset % 1
+            if frac not in grid:
+                R = np.arange(start - 1 + frac, stop + 1)[:, None]
+                grid[frac] = U(R, x2[:stop])
+
+        def combine(M, terms):
+            for offset, a in terms:
+                # grid rows for R = j + offset
+                first = int(offset // 1) + 1
+                for ak, Uk in zip(a(j), grid[offset % 1]):
+                    if np.any(ak):
+                        M += ak * Uk[first:first + stop - start]
+
+        combine(A[start:stop, :stop], terms)
+        if degree == 3:
+            combine(B[start:stop, :stop], dterms)
+
+    # corrections at x = j and x = j - 1
+    j = x[1:]
+    diag0 = (np.arange(n), np.arange(n))
+    diag1 = (np.arange(1, n), np.arange(n - 1))
+    if degree == 1:
+        A[diag0] += x2logx
+        A[diag1] -= x2logx[:-1]
+    elif degree == 2:
+        A[diag0] -= 4 * x * x2logx
+        A[diag1] += 4 * (j - 1) * x2logx[:-1]
+    elif degree == 3:
+        A[diag0] -= (6 * x * (x + 1) + 3/2 * x2) * x2logx
+        A[diag1] += 6 * (j * (j - 1) + x2[:-1] / 4) * x2logx[:-1]
+        B[diag0] -= (x * (3 * x + 4) + 1 + 3/4 * x2) * x2logx
+        B[diag1] -= (j * (3 * j - 4) + 1 + 3/4 * x2[:-1]) * x2logx[:-1]
+
+    if degree == 3:
         # solve for smooth derivative and modify A accordingly
         C = solve_banded((1, 1), ([0] + [1] * (n - 2) + [0],
                                   [4] * n,
@@ -23,6 +23,12 @@ except ImportError:
 #    2012: RY first implementation in hedp.math.abel
 ###########################################################################
 
+# Cached integration geometry for the last used r grid
+_r = None
+_geom = None  # (y_1, a, b), see _get_geometry_cached()
+_W = {}  # integration weights, by (backend, correction, dtype)
+
+
 def direct_transform(f, dr=None, r=None, direction='inverse', derivative=None,
                      int_func=_deprecated, integral=None, correction=True,
                      background=0, backend='C', **kwargs):
@@ -83,11 +89,16 @@ def direct_transform(f, dr=None, r=None, direction='inverse', derivative=None,
         select the implementation (case-insensitive):
 
         ``'C'``:
-            compiled Cython extension. Is faster and used by default, with a
-            fallback to ``'Python'`` if the extension is not available.
+            compiled Cython extension, parallelized over rows and columns.
+            Is faster and used by default, with a fallback to ``'Python'`` if
+            the extension is not available. Single-precision (``float32``)
+            input is processed in single precision (about twice faster),
+            other inputs — in double precision.
         ``'Python'``:
             Python, using NumPy. Slower but allows custom **integral** and is
-            always available.
+            always available. The default integration is done by matrix
+            multiplication, other **integral** functions are called for each
+            column.
 
         Both implementations produce identical results (within numerical
         errors).
@@ -99,6 +110,8 @@ def direct_transform(f, dr=None, r=None, direction='inverse', derivative=None,
     """
     f = np.atleast_2d(f)
     cols = f.shape[1]
+    # data type for the C backend
+    dtype = np.float32 if f.dtype == np.float32 else float
     if background is not None:
         f = np.pad(f, ((0, 0), (0, 1)), constant_values=background)
 
@@ -144,8 +157,9 @@ def direct_transform(f, dr=None, r=None, direction='inverse', derivative=None,
             warn('C backend ignores the integral argument; to use it, '
                  'specify backed="Python"',
                  RuntimeWarning, stacklevel=2)
-        g = np.asarray(g, order='C', dtype=float)
-        out = _cabel_direct_integral(g, r, int(correction))
+        g = np.asarray(g, order='C', dtype=dtype)
+        out = _cabel_direct_integral(g, _get_weights_cached(r, correction,
+                                                            dtype))
     elif backend == 'python':
         if int_func is not _deprecated:
             deprecate('abel.direct.direct_transform() argument "int_func" '
@@ -182,7 +196,9 @@ def _pyabel_direct_integral(g, r, correction, integral):
         the singularity is integrated using local linear approximation for
         :math:`g(r)`
     integral : callable
-        function for numerical integration
+        function for numerical integration. For
+        :func:`abel.tools.math.trapezoid`, the integrals are computed by a
+        single multiplication by the (cached) matrix of integration weights.
 
     Returns:
     --------
@@ -190,16 +206,12 @@ def _pyabel_direct_integral(g, r, correction, integral):
         array of the same shape as g, with the integral evaluated for each row
         and each x value from the r array
     """
-    cols = g.shape[1]
+    if integral is trapezoid:
+        W = _get_weights_cached(r, correction, backend='Python')
+        return g.dot(W.T).astype(g.dtype, copy=False)
 
-    x = r[:, None]
-    mask = r > x
-    # y = sqrt(r^2 - x^2)
-    y = np.zeros((cols, cols), dtype=float)
-    y[mask] = np.sqrt((r**2 - x**2)[mask])
-    # y^{-1} = 1 / y
-    y_1 = np.zeros_like(y)
-    y_1[mask] = 1 / y[mask]
+    cols = g.shape[1]
+    y_1, a, b = _get_geometry_cached(r)
 
     out = np.empty_like(g)
 
@@ -210,14 +222,142 @@ def _pyabel_direct_integral(g, r, correction, integral):
 
     # Integration of the segment with r = x, assuming that g is linear there
     if correction:
-        # slopes of g
-        dg = (g[:, 1:] - g[:, :-1]) / (r[1:] - r[:-1])
-        # superdiagonal of y
-        yd = np.sqrt(r[1:]**2 - r[:-1]**2)
-        # hyperbolic arccosines
-        ach = np.append(np.arccosh(r[1] / r[0]) if r[0] else 1,
-                        np.arccosh(r[2:] / r[1:-1]))
         # add integrated segments to previous truncated integrals
-        out[:, :-1] += ach * g[:, :-1] + (yd - ach * r[:-1]) * dg
+        out[:, :-1] += a * g[:, :-1] + b * g[:, 1:]
 
     return out
+
+
+def _get_geometry_cached(r):
+    """
+    Internal function.
+
+    Returns the integration geometry for the grid **r**, computing it only if
+    the grid differs from that in the previous call.
+
+    Parameters
+    ----------
+    r : numpy 1D array
+        coordinates corresponding to columns
+
+    Returns
+    -------
+    y_1 : numpy 2D array
+        :math:`1 / \\sqrt{r^2 - x^2}` for :math:`r > x` (zero otherwise),
+        indexed by (x, r)
+    a, b : numpy 1D arrays
+        coefficients for the analytical integration of the singularity,
+        such that its contribution is ``a * g[:-1] + b * g[1:]``
+    """
+    global _r, _geom, _W
+
+    if _r is not None and _r.shape == r.shape and np.array_equal(_r, r):
+        return _geom
+
+    cols = r.shape[0]
+
+    x = r[:, None]
+    mask = r > x
+    # y^{-1} = 1 / sqrt(r^2 - x^2)
+    y_1 = np.zeros((cols, cols), dtype=float)
+    y_1[mask] = 1 / np.sqrt((r**2 - x**2)[mask])
+
+    # Singularity integrated assuming that g is linear across the segment:
+    #   g = g[j] + (g[j+1] - g[j]) (r - r[j]) / (r[j+1] - r[j])
+    dr = r[1:] - r[:-1]
+    # superdiagonal of y
+    yd = np.sqrt(r[1:]**2 - r[:-1]**2)
+    # hyperbolic arccosines
+    ach = np.append(np.arccosh(r[1] / r[0]) if r[0] else 1,
+                    np.arccosh(r[2:] / r[1:-1])) if cols > 1 else np.empty(0)
+    b = (yd - ach * r[:-1]) / dr
+    a = ach - b
+
+    _r = r.copy()
+    _geom = (y_1, a, b)
+    _W = {}
+
+    return _geom
+
+
+def _get_weights_cached(r, correction, dtype=float, backend='C'):
+    """
+    Internal function.
+
+    Returns the matrix **W** of weights for the trapezoidal-rule integration
+    with the grid **r**, such that the integral for each x = r[j] is
+    ``g.dot(W[j])``. The matrix is computed only if the grid or other
+    parameters differ from those in the previous calls.
+
+    Parameters
+    ----------
+    r : numpy 1D array
+        coordinates corresponding to columns
+    correction : bool
+        include the analytical integration of the singularity
+    dtype : data-type
+        data type of the returned matrix (it is computed in double precision)
+    backend : str
+        ``'C'`` for the weights used in the C backend (the first interval,
+        [r[j+1], r[j+2]], has the weight of [r[j], r[j+1]]), or ``'Python'``
+        for the weights equivalent to :func:`abel.tools.math.trapezoid`
+        integration over r[j+1:]
+
+    Returns
+    -------
+    W : numpy 2D array
+        upper-triangular weight matrix, indexed by (x, r)
+    """
+    y_1, a, b = _get_geometry_cached(r)
+    correction = int(bool(correction))
+    key = (backend, correction, np.dtype(dtype))
+    if key in _W:
+        return _W[key]
+
+    cols = r.shape[0]
+    # trapezoidal weights for the interval [r[j+1], r[-1]]
+    dx = np.zeros(cols)
+    if cols > 2:
+        dx[1:-1] = r[2:] - r[:-2]  # interior points: central difference
+        dx[-1] = r[-1] - r[-2]     # right endpoint: backwards difference
+    W = y_1 * (dx / 2)
+    # left endpoints: difference from x = r[j] (C) or forward difference
+    j = np.arange(cols - 2)
+    if backend == 'C':
+        W[j, j + 1] = y_1[j, j + 1] * (r[j + 1] - r[j]) / 2
+    else:
+        W[j, j + 1] = y_1[j, j + 1] * (r[j + 2] - r[j + 1]) / 2
+    if cols > 1:
+        W[-2, -1] = 0  # (single point has zero integral)
+
+    if correction:
+        j = np.arange(cols - 1)
+        W[j, j] += a
+        W[j, j + 1] += b
+
+    _W[key] = W = W.astype(dtype, copy=False)
+
+    return W
+
+
+def cache_cleanup():
+    """
+    Utility function.
+
+    Frees the memory caches with the integration geometry.
+    This is usually pointless, but might be required after working
+    with very large images, if more RAM is needed for further tasks.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    global _r, _geom, _W
+
+    _r = None
+    _geom = None
+    _W = {}
@@ -1,4 +1,11 @@
+from warnings import warn
+
 import numpy as np
+try:
+    from .lib.hansenlaw import _chansenlaw_recursion
+    cython_ext = True
+except ImportError:
+    cython_ext = False
 
 #############################################################################
 # hansenlaw - a recursive method forward/inverse Abel transform algorithm
@@ -46,9 +53,21 @@ import numpy as np
 #
 #############################################################################
 
+# parameters for Abel transform system model, Table 1.
+_h = np.array([0.318, 0.19, 0.35, 0.82, 1.8, 3.9, 8.3, 19.6, 48.3])
+_lam = np.array([0.0, -2.1, -6.2, -22.4, -92.5, -414.5, -1889.4, -8990.9,
+                 -47391.1])
+
+# Cached system-model coefficients
+_coefs = None  # (phi, B0, B1)
+_coefs_cfg = None  # (width, direction, hold_order)
+# Cached transform operator
+_op = None
+_op_cfg = None  # (cols, direction, hold_order, background is None)
+
 
 def hansenlaw_transform(image, dr=1, direction='inverse', hold_order=0,
-                        background=0, **kwargs):
+                        background=0, backend=None, **kwargs):
     r"""Forward/Inverse Abel transformation using the algorithm from
 
     E. W. Hansen,
@@ -129,36 +148,51 @@ def hansenlaw_transform(image, dr=1, direction='inverse', hold_order=0,
         whole row.
         Default: ``0``.
 
+    backend : str, optional
+        select the implementation of the transform (case-insensitive):
+
+        ``'C'``:
+            compiled Cython extension, parallelized over rows. Is faster, but
+            available only if the Cython extensions were built; otherwise a
+            warning is issued and ``'Python'`` is used instead.
+        ``'Python'``:
+            Python, using NumPy for all rows at once.
+        ``'matrix'``:
+            multiplication by the equivalent transform matrix (see
+            :func:`get_bs_cached`), which is constructed (using the
+            recursion) for the first image and then reused for all images of
+            the same width. Needs memory for the :math:`n \times n` matrix,
+            but is faster for transforming many images.
+
+        All implementations produce identical results (within numerical
+        errors).
+        Default: ``None``, meaning ``'C'`` if the Cython extensions are
+        available and ``'Python'`` otherwise.
+
     Returns
     -------
     aim : 1D or 2D numpy array
         forward/inverse Abel transform half-image
     """
 
-    # state equation integral_r0^r (epsilon/r)^(lamda+a) d\epsilon
-    def I(n, lam, a):
-        integral = np.empty((n.size, lam.size))
-
-        ratio = n/(n-1)
-        if a == 0:
-            integral[:, 0] = -np.log(ratio)  # special case, lam=0
-
-        ra = (n-1)**a
-        k0 = not a  # 0 or 1
-
-        for k, lamk in enumerate((lam+a)[k0:], start=k0):
-            integral[:, k] = ra*(1 - ratio**lamk)/lamk
+    image = np.atleast_2d(image)   # 2D input image
+    rows, cols = image.shape
 
-        return integral
+    if backend is None:
+        backend = 'C' if cython_ext else 'Python'
+    backend = backend.lower()
 
-    # parameters for Abel transform system model, Table 1.
-    h = np.array([0.318, 0.19, 0.35, 0.82, 1.8, 3.9, 8.3, 19.6, 48.3])
-    lam = np.array([0.0, -2.1, -6.2, -22.4, -92.5, -414.5, -1889.4, -8990.9,
-                    -47391.1])
+    if backend == 'matrix':
+        A = get_bs_cached(cols, direction, hold_order, background)
+        aim = image.dot(A[:cols])
+        if background:  # (contribution of the outer edge)
+            aim += background * A[cols]
+        aim *= dr if direction == 'forward' else 1 / dr
+        if rows == 1:
+            aim = aim[0]  # flatten to a vector
+        return aim
 
-    image = np.atleast_2d(image)   # 2D input image
     aim = np.empty_like(image)  # Abel transform array
-    rows, cols = image.shape
 
     if background is not None:
         image = np.pad(image, ((0, 0), (0, 1)), constant_values=background)
@@ -166,7 +200,6 @@ def hansenlaw_transform(image, dr=1, direction='inverse', hold_order=0,
     if direction == 'forward':
         # the driving function, including the Jacobian factor
         drive = -2*dr*np.pi*image
-        a = 1  # integration increases lambda + 1
     else:  # inverse Abel transform
         if hold_order == 0:
             # better suits sharp structure - see issue #249
@@ -175,44 +208,177 @@ def hansenlaw_transform(image, dr=1, direction='inverse', hold_order=0,
         else:
             # hold_order=1 prefers gradient
             drive = np.gradient(image, dr, axis=-1)
-        a = 0  # due to 1/piR factor
 
+    phi, B0, B1 = _get_coefs_cached(image.shape[1], direction, hold_order)
     n = np.arange(image.shape[1] - 1, 1, -1)
 
-    phi = np.empty((n.size, h.size))
-    for k, lamk in enumerate(lam):
+    if backend == 'c' and not cython_ext:
+        warn('Cython extensions were not built, the C backend is not '
+             'available! Falling back to the Python backend...',
+             RuntimeWarning, stacklevel=2)
+        backend = 'python'
+
+    # Hansen Abel transform  --------------------
+    if backend == 'c':
+        if aim.dtype == float and aim.flags.c_contiguous:
+            out = aim
+        else:  # (the kernel works with doubles)
+            out = np.empty(aim.shape)
+        _chansenlaw_recursion(np.asarray(drive, order='C', dtype=float),
+                              phi, B0, B1, out)
+        if out is not aim:
+            aim[:] = out
+    elif backend == 'python':
+        x = np.zeros((_h.size, rows))
+        for indx, col in enumerate(n-1):
+            x = phi[indx][:, None]*x + B0[indx][:, None]*drive[:, col+1]\
+                                     + B1[indx][:, None]*drive[:, col]
+            aim[:, col] = x.sum(axis=0)
+    else:
+        raise ValueError('backend must be "C", "Python" or "matrix" '
+                         f'(got {backend!r})')
+
+    # missing axial column
+    aim[:, 0] = aim[:, 1]
+    if background is None:
+        # edge column is zero
+        aim[:, -1] = 0
+    else:
+        # crop to original size
+        aim = aim[:, :cols]
+
+    if rows == 1:
+        aim = aim[0]  # flatten to a vector
+
+    return aim
+
+
+def _get_coefs_cached(width, direction, hold_order):
+    """
+    Internal function.
+
+    Returns the system-model coefficients (Φ, B0, B1) for the recursion over
+    the driving function of the given width, computing them if the
+    configuration has changed since the previous call.
+    """
+    global _coefs, _coefs_cfg
+
+    cfg = (width, direction, hold_order)
+    if _coefs_cfg == cfg:
+        return _coefs
+
+    # state equation integral_r0^r (epsilon/r)^(lamda+a) d\epsilon
+    def I(n, lam, a):
+        integral = np.empty((n.size, lam.size))
+
+        ratio = n/(n-1)
+        if a == 0:
+            integral[:, 0] = -np.log(ratio)  # special case, lam=0
+
+        ra = (n-1)**a
+        k0 = not a  # 0 or 1
+
+        for k, lamk in enumerate((lam+a)[k0:], start=k0):
+            integral[:, k] = ra*(1 - ratio**lamk)/lamk
+
+        return integral
+
+    # integration increases lambda + 1 for forward; inverse has 1/piR factor
+    a = 1 if direction == 'forward' else 0
+
+    n = np.arange(width - 1, 1, -1)
+
+    phi = np.empty((n.size, _h.size))
+    for k, lamk in enumerate(_lam):
         phi[:, k] = (n/(n-1))**lamk
 
-    gamma0 = I(n, lam, a)*h
+    gamma0 = I(n, _lam, a)*_h
 
     if hold_order == 0:  # Hansen (& Law) zero-order hold approximation
         B1 = gamma0
         B0 = np.zeros_like(gamma0)  # empty array
 
     else:  # Hansen first-order hold approximation
-        gamma1 = I(n, lam, a+1)*h
+        gamma1 = I(n, _lam, a+1)*_h
 
         B0 = gamma1 - gamma0*(n-1)[:, None]  # f_n
         B1 = gamma0*n[:, None] - gamma1  # f_n-1
 
-    # Hansen Abel transform  --------------------
-    x = np.zeros((h.size, rows))
+    _coefs = (phi, B0, B1)
+    _coefs_cfg = cfg
 
-    for indx, col in enumerate(n-1):
-        x = phi[indx][:, None]*x + B0[indx][:, None]*drive[:, col+1]\
-                                 + B1[indx][:, None]*drive[:, col]
-        aim[:, col] = x.sum(axis=0)
+    return _coefs
+
+
+def get_bs_cached(cols, direction='inverse', hold_order=0, background=0):
+    """
+    Internal function.
+
+    Gets the matrix of the linear operator equivalent to the Hansen–Law
+    recursion (with ``dr=1``), such that the transform of a half-image ``IM``
+    with ``cols`` columns is ``IM.dot(A[:cols])`` (+ ``background * A[cols]``).
+    The matrix is computed at the first call and then cached in memory for
+    subsequent calls with the same parameters.
+
+    Parameters
+    ----------
+    cols : int
+        width of the half-image
+    direction : str: ``'forward'`` or ``'inverse'``
+        type of Abel transform
+    hold_order : int 0 or 1
+        the order of the hold approximation
+    background : float or None
+        only distinguishes ``None`` (initial conditions from the edge column)
+        from other values (zero or constant background)
+
+    Returns
+    -------
+    A : 2D numpy array
+        transform matrix of shape (**cols** + 1, **cols**), where the last row
+        is the contribution of unit background outside the image, or
+        (**cols**, **cols**) for **background** = ``None``.
+    """
+    global _op, _op_cfg
+
+    cfg = (cols, direction, hold_order, background is None)
+    if _op_cfg == cfg:
+        return _op
 
-    # missing axial column
-    aim[:, 0] = aim[:, 1]
     if background is None:
-        # edge column is zero
-        aim[:, -1] = 0
+        A = hansenlaw_transform(np.eye(cols), 1, direction, hold_order,
+                                background=None)
     else:
-        # crop to original size
-        aim = aim[:, :cols]
+        # transform the background "column" together with the image columns
+        A = hansenlaw_transform(np.eye(cols + 1), 1, direction, hold_order,
+                                background=None)[:, :cols]
+    # (for cols == 1, the transform is flattened to a vector)
+    _op = A.reshape((-1, cols))
+    _op_cfg = cfg
 
-    if rows == 1:
-        aim = aim[0]  # flatten to a vector
+    return _op
 
-    return aim
+
+def cache_cleanup():
+    """
+    Utility function.
+
+    Frees the memory caches created by :func:`get_bs_cached` and the
+    recursion coefficients.
+    This is usually pointless, but might be required after working
+    with very large images, if more RAM is needed for further tasks.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    global _coefs, _coefs_cfg, _op, _op_cfg
+
+    _coefs = None
+    _coefs_cfg = None
+    _op = None
+    _op_cfg = None
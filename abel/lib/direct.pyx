@@ -5,12 +5,19 @@
 # cython: always_allow_keywords=False, auto_pickle=False, binding=False
 
 import numpy as np
-from libc.math cimport sqrt, log
 from cython.parallel import prange
 
 
-cpdef _cabel_direct_integral(const double[:, ::1] g, const double[::1] r,
-                             const int correction):
+ctypedef fused real:
+    float
+    double
+
+# number of rows in tiles processed by one task
+cdef enum:
+    TILE = 32
+
+
+cpdef _cabel_direct_integral(const real[:, ::1] g, const real[:, ::1] W):
     """
     Calculation of the integral
                ∞
@@ -19,70 +26,76 @@ cpdef _cabel_direct_integral(const double[:, ::1] g, const double[::1] r,
                ⎮   _________
                ⌡  √ r² − x²
                r
-    used in the forward and inverse Abel transforms.
+    used in the forward and inverse Abel transforms, as a weighted sum
+        G[i, j] = Σ_{k ≥ j} g[i, k] W[j, k]
+    with precomputed integration weights (see abel.direct._get_weights_cached).
+
+    The work is split into tasks, each computing one output column for a tile
+    of TILE rows (the weights row is reused from the cache for all rows in the
+    tile, and 4 rows are accumulated together to use vectorized operations),
+    and these tasks are distributed between threads, so that both tall and
+    narrow (down to single-row) inputs are processed in parallel.
 
     Parameters
     ----------
     g : numpy 2D array
         array with function values, indexed by (row, column)
-    r : numpy 1D array
-        array with coordinates corresponding to columns
-    correction : int
-        if zero, the singularity at r = x is skipped; otherwise, the
-        singularity is integrated using local linear approximation for g(r)
+    W : numpy 2D array
+        upper-triangular matrix of integration weights, indexed by (output
+        column = x, input column = r), of the same data type as g (float32 or
+        float64)
 
     Returns:
     --------
     G : numpy 2D array
-        array of the same shape as g, with the integral evaluated for each row
-        and each x value from the r array
+        array of the same shape and data type as g, with the integral evaluated
+        for each row and each x value from the r array
     """
     cdef Py_ssize_t rows = g.shape[0], cols = g.shape[1]
 
-    cdef double[:, ::1] y = np.empty((cols, cols))  # y = sqrt(r^2 - x^2)
-    cdef double[:, ::1] h = np.empty((cols, cols))  # h = Δr / y
-    cdef double[:, ::1] G = np.empty((rows, cols))  # output
-
-    cdef Py_ssize_t i, j, k  # loop indices (row, out col = x, in col = r)
-    cdef double s  # for running sum in integration
-
-    with nogil:
-        # precompute helper arrays
-        for j in range(cols - 1):
-            for k in range(j + 1, cols):
-                y[j, k] = sqrt(r[k]**2 - r[j]**2)
-
-            # left edge (forward difference)
-            h[j, j+1] = (r[j+1] - r[j]) / y[j, j+1]
-            # inner points (central difference)
-            for k in range(j + 2, cols - 1):
-                h[j, k] = (r[k+1] - r[k-1]) / y[j, k]
-            # right edge (backward difference)
-            h[j, cols-1] = (r[cols-1] - r[cols-2]) / y[j, cols-1]
-        # (last output column should skip trapezoidal integration)
-        h[cols-2, cols-1] = 0
+    if W.shape[0] != cols or W.shape[1] != cols:
+        raise ValueError('inconsistent array shapes')
 
-        # Parallelized loop over rows (must use "s = s + ..." instead of
-        # "s += ..." because Cython interprets "+=" as parallel reduction)
-        for i in prange(rows):
-            for j in range(cols):  # loop over output columns (r)
-                # Trapezoidal-rule integration, skipping r = x
-                s = 0
-                for k in range(j + 1, cols):  # loop over input columns (r > x)
-                    s = s + g[i, k] * h[j, k]
-                s /= 2
+    out = np.empty((rows, cols), dtype=np.float32 if real is float else float)
+    cdef real[:, ::1] G = out
 
-                if j + 1 < cols and correction:
-                    # Integration of the singularity at r = x (k = j), assuming
-                    # linear behaviour of g(r) between r[j] and r[j+1]
-                    if r[j] == 0:  # r = 0 ==> j = 0, g[i, 0] = 0
-                        s = s + g[i, 1]
-                    else:
-                        s = s + ((g[i, j] * r[j+1] - g[i, j+1] * r[j]) *
-                                 log((r[j+1] + y[j, j+1]) / r[j]) +
-                                 (g[i, j+1] - g[i, j]) * y[j, j+1]) / \
-                                (r[j+1] - r[j])
+    cdef Py_ssize_t tiles = (rows + TILE - 1) // TILE
+    cdef Py_ssize_t t, i, i1, j, k  # loop indices (task, row, out col = x,
+                                    #               in col = r)
+    cdef real w, s0, s1, s2, s3  # for running sums in integration
 
-                G[i, j] = s
+    # Parallelized loop over tasks = (row tile, output column), with output
+    # columns changing faster (must use "s = s + ..." instead of "s += ..."
+    # because Cython interprets "+=" as parallel reduction)
+    for t in prange(tiles * cols, nogil=True, schedule='guided'):
+        i = (t // cols) * TILE
+        i1 = i + TILE
+        if i1 > rows:
+            i1 = rows
+        j = t % cols
+        # groups of 4 rows
+        while i + 4 <= i1:
+            s0 = 0
+            s1 = 0
+            s2 = 0
+            s3 = 0
+            for k in range(j, cols):  # loop over input columns (r ≥ x)
+                w = W[j, k]
+                s0 = s0 + g[i, k] * w
+                s1 = s1 + g[i + 1, k] * w
+                s2 = s2 + g[i + 2, k] * w
+                s3 = s3 + g[i + 3, k] * w
+            G[i, j] = s0
+            G[i + 1, j] = s1
+            G[i + 2, j] = s2
+            G[i + 3, j] = s3
+            i = i + 4
+        # remaining rows
+        while i < i1:
+            s0 = 0
+            for k in range(j, cols):
+                s0 = s0 + g[i, k] * W[j, k]
+            G[i, j] = s0
+            i = i + 1
 
-    return G.base
+    return out
@@ -0,0 +1,64 @@
+# cython: language_level=3
+# (disable unneeded checks and adjustments to increase performance)
+# cython: boundscheck=False, cdivision=True, wraparound=False
+# (disable unneeded features to reduce compiled size)
+# cython: always_allow_keywords=False, auto_pickle=False, binding=False
+
+from cython.parallel import prange
+
+
+cpdef _chansenlaw_recursion(const double[:, ::1] drive,
+                            const double[:, ::1] phi,
+                            const double[:, ::1] B0,
+                            const double[:, ::1] B1,
+                            double[:, ::1] aim):
+    """
+    Hansen–Law state-space recursion
+        x_n = Φ_n x_{n+1} + B0_n f_{n+1} + B1_n f_n,
+        aim_n = Σ x_n,
+    from the outer edge inwards, for the 9-term system model.
+
+    Parameters
+    ----------
+    drive : numpy 2D array
+        driving function f, indexed by (row, column)
+    phi, B0, B1 : numpy 2D arrays
+        state-transition and input coefficients, indexed by (step, term) for
+        steps corresponding to columns n = drive.shape[1] − 2, ..., 1
+    aim : numpy 2D array
+        output array (with at least drive.shape[1] − 1 columns), columns
+        1, ..., drive.shape[1] − 2 of which are filled with the transform
+
+    Returns:
+    --------
+    None
+    """
+    cdef Py_ssize_t rows = drive.shape[0], steps = phi.shape[0]
+    cdef Py_ssize_t i, j, n  # loop indices (row, step, column)
+    # state vector (thread-private)
+    cdef double x0, x1, x2, x3, x4, x5, x6, x7, x8
+    cdef double f0, f1  # driving function at n and n + 1
+
+    if phi.shape[1] != 9 or B0.shape[1] != 9 or B1.shape[1] != 9:
+        raise ValueError('system model must have 9 terms')
+    if B0.shape[0] != steps or B1.shape[0] != steps or \
+       drive.shape[1] != steps + 2:
+        raise ValueError('inconsistent array shapes')
+
+    # parallelized loop over rows
+    for i in prange(rows, nogil=True):
+        x0 = 0; x1 = 0; x2 = 0; x3 = 0; x4 = 0; x5 = 0; x6 = 0; x7 = 0; x8 = 0
+        for j in range(steps):
+            n = steps - j
+            f0 = drive[i, n]
+            f1 = drive[i, n + 1]
+            x0 = phi[j, 0] * x0 + B0[j, 0] * f1 + B1[j, 0] * f0
+            x1 = phi[j, 1] * x1 + B0[j, 1] * f1 + B1[j, 1] * f0
+            x2 = phi[j, 2] * x2 + B0[j, 2] * f1 + B1[j, 2] * f0
+            x3 = phi[j, 3] * x3 + B0[j, 3] * f1 + B1[j, 3] * f0
+            x4 = phi[j, 4] * x4 + B0[j, 4] * f1 + B1[j, 4] * f0
+            x5 = phi[j, 5] * x5 + B0[j, 5] * f1 + B1[j, 5] * f0
+            x6 = phi[j, 6] * x6 + B0[j, 6] * f1 + B1[j, 6] * f0
+            x7 = phi[j, 7] * x7 + B0[j, 7] * f1 + B1[j, 7] * f0
+            x8 = phi[j, 8] * x8 + B0[j, 8] * f1 + B1[j, 8] * f0
+            aim[i, n] = x0 + x1 + x2 + x3 + x4 + x5 + x6 + x7 + x8
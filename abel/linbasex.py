@@ -3,7 +3,8 @@ from glob import glob
 import numpy as np
 import scipy
 from scipy.special import eval_legendre
-from scipy.ndimage import rotate, shift, gaussian_filter1d
+from scipy.ndimage import shift, gaussian_filter1d
+from scipy.sparse import csr_matrix
 
 import abel
 
@@ -32,6 +33,15 @@ _los = None   # legendre_orders string
 _pas = None   # proj_angles string
 _radial_step = None
 _clip = None
+# cache projection operator
+_proj = None
+_proj_cfg = None  # (cols, proj_angles)
+# cache pseudo-inverse of the basis
+_pinv = None
+_pinv_cfg = None  # (basis, rcond)
+# cache image-synthesis arrays
+_slices = None
+_slices_cfg = None  # (legendre_orders, radial)
 
 
 def linbasex_transform(IM, basis_dir=None, proj_angles=[0, np.pi/2],
@@ -108,7 +118,7 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
                             radial_step=1, smoothing=0,
                             rcond=0.0005, threshold=0.2, clip=0,
                             norm_range=(0, -1), direction="inverse",
-                            verbose=False):
+                            image=True, lazy=False, verbose=False):
     r"""Inverse Abel transform using 1D projections of images.
 
     Th. Gerber, Yu. Liu, G. Knopp, P. Hemberger, A. Bodi, P. Radi, Ya. Sych,
@@ -124,12 +134,15 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
     reconstructed 3D object is obtained by adding all the contributions, from
     which slices are derived.
 
-    This function operates on the whole image.
+    This function operates on the whole image. It also accepts a stack of
+    images (a 3D array or a list of frames), which are then projected and
+    solved together, as one matrix product.
 
     Parameters
     ----------
-    IM : numpy 2D array
-        image data must have square shape of odd size
+    IM : numpy 2D or 3D array
+        image data must have square shape of odd size. For a 3D array (or a
+        list of 2D arrays), images are indexed by the first dimension.
     basis_dir : str or None
         path to the directory for saving / loading the basis sets. Use ``''``
         for the default directory. If ``None`` (default), the basis set will
@@ -154,8 +167,9 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
         convolve **Beta** array with a Gaussian function of :math:`1/e`
         halfwidth equal to **smoothing**.
     rcond : float
-        (default 0.0005) :func:`scipy.linalg.lstsq` fit conditioning value.
-        Use 0 to switch conditioning off.
+        (default 0.0005) least-squares fit conditioning value: relative cutoff
+        for small singular values of the basis (as in
+        :func:`numpy.linalg.lstsq`). Use 0 to switch conditioning off.
         Note: In the presence of noise the equation system may be ill-posed.
         Increasing **rcond** smoothes the result, lowering it beyond a minimum
         renders the solution unstable. Tweak **rcond** to get a "reasonable"
@@ -174,16 +188,27 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
         i, becomes 1.
     direction : str
         Abel transform direction. Only "inverse" is implemented.
+    image : bool
+        construct the inverse Abel transformed image (default). Use ``False``
+        to avoid unnecessary calculations when only **Beta** is needed
+        (**inv_IM** will be ``None``).
+    lazy : bool
+        return the transformed image as a :class:`abel.rbasex.LazyImage`
+        object instead of a numpy array (by default, ``False``). The pixel
+        values are then computed only when the image (or its part) is
+        accessed.
     verbose : bool
         print information about processing (normally used for debugging)
 
     Returns
     -------
-    inv_IM : numpy 2D array
-        inverse Abel transformed image
+    inv_IM : numpy 2D array or LazyImage or None
+        inverse Abel transformed image (for a stack of images: a 3D array or a
+        list of LazyImage objects)
     radial : numpy 1D array
         radii of each Newton sphere
     Beta : numpy 2D array
+        (3D array for a stack of images, indexed by the first dimension)
         contributions of each spherical harmonic :math:`Y_{i0}` to the 3D
         distribution contain all the information one can get from an experiment.
         For the case **legendre_orders** = [0, 2]:
@@ -193,12 +218,15 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
            **Beta[1]** vs **radial** is the anisotropy of each Newton sphere
 
     projections : numpy 2D array
-        projection profiles at angles **proj_angles**
+        projection profiles at angles **proj_angles** (3D array for a stack
+        of images)
     """
 
-    IM = np.atleast_2d(IM)
+    IM = np.asarray(IM)
+    stack = IM.ndim == 3
+    IMs = IM if stack else np.atleast_2d(IM)[np.newaxis]
 
-    rows, cols = IM.shape
+    rows, cols = IMs.shape[1:]
 
     if cols % 2 == 0:
         raise ValueError(f'image width ({cols}) must be odd and equal to the '
@@ -219,91 +247,155 @@ def linbasex_transform_full(IM, basis_dir=None, proj_angles=[0, np.pi/2],
     # How many projections
     proj = len(proj_angles)
 
-    QLz = np.zeros((proj, cols))  # array for projections.
-
-    # Rotate and project VMI-image for each angle (as many as projections)
-    # if proj_angles == [0, np.pi/2]:
-    #     # If coordinates of the detector coincide with the projection
-    #     # directions unnecessary rotations are avoided
-    #     # i.e. proj_angles=[0, np.pi/2] degrees
-    #     QLz[0] = np.sum(IM, axis=1)
-    #     QLz[1] = np.sum(IM, axis=0)
-    # else:
-    for i in range(proj):
-        Rot_IM = rotate(IM, proj_angles[i] * 180 / np.pi, reshape=False)
-        QLz[i, :] = np.sum(Rot_IM, axis=1)
-
-    # arrange all projections for input into "lstsq"
-    bb = np.concatenate(QLz, axis=0)
+    # Project VMI-images for each angle (as many as projections), all
+    # projections of each image arranged in a row for input into "lstsq"
+    bb = _get_proj_cached(cols, proj_angles).dot(
+        IMs.reshape((len(IMs), -1)).T).T
+    QLz = bb.reshape((len(IMs), proj, cols))  # array for projections.
 
+    # (all images are solved together)
     Beta = _beta_solve(Basis, bb, pol, rcond=rcond)
 
     # compensate 1/2-pixel shift (basis issue? see PR #357)
-    Beta = shift(Beta, (0, 0.5 / radial_step), mode='nearest')
+    Beta = shift(Beta, (0, 0, 0.5 / radial_step), mode='nearest')
 
     # reverse the sign for odd orders (the basis is historically upside down)
     for i in range(pol):
         if legendre_orders[i] % 2:
-            Beta[i] = -Beta[i]
+            Beta[:, i] = -Beta[:, i]
 
     R = cols // 2  # outer radius: cols = 2R + 1
-    radial = np.linspace(clip * radial_step + R % radial_step, R, len(Beta[0]))
+    radial = np.linspace(clip * radial_step + R % radial_step, R,
+                         Beta.shape[-1])
+
+    # Convolve Beta with Gaussian smoothing function
+    if smoothing > 0:
+        Beta_convol = gaussian_filter1d(Beta, smoothing, axis=-1,
+                                        mode='constant', cval=0)
+    else:
+        Beta_convol = Beta
 
-    inv_IM, Beta_convol = _Slices(radial, Beta, legendre_orders,
-                                  smoothing=smoothing)
+    if image:
+        inv_IM = [_Slices(radial, B / radial_step, legendre_orders, lazy=lazy)
+                  for B in Beta_convol]
+        if not lazy:
+            inv_IM = np.array(inv_IM)
+    else:
+        inv_IM = None
 
     # normalize
-    Beta = _single_Beta_norm(Beta_convol, threshold=threshold,
-                             norm_range=norm_range)
-    inv_IM /= radial_step
+    Beta = np.array([_single_Beta_norm(B, threshold=threshold,
+                                       norm_range=norm_range)
+                     for B in Beta_convol])
+
+    if not stack:
+        if image:
+            inv_IM = inv_IM[0]
+        Beta, QLz = Beta[0], QLz[0]
 
     # Fix Me! Issue #202 the correct scaling factor for inv_IM intensity?
     return inv_IM, radial, Beta, QLz
 
 
 def _beta_solve(Basis, bb, pol, rcond=0.0005):
-    # set rcond to zero to switch conditioning off
+    """Least-squares solution of Basis · Beta = bb, using the truncated
+    pseudo-inverse of the basis (cached for subsequent calls with the same
+    basis and rcond). Set rcond to zero to switch conditioning off.
+
+    bb can be a 1D array (projections of one image) or a 2D array with
+    projections of several images in its rows, which are then solved together.
+    The returned Beta has the shape (pol, NP) or (images, pol, NP),
+    respectively.
+    """
+    global _pinv, _pinv_cfg
+
+    if _pinv_cfg is None or _pinv_cfg[0] is not Basis or \
+       _pinv_cfg[1] != rcond:
+        # (same cutoff rcond * largest singular value as in lstsq)
+        _pinv = np.linalg.pinv(Basis, rcond)
+        _pinv_cfg = (Basis, rcond)
 
-    # solve equation
-    Sol = np.linalg.lstsq(Basis, bb, rcond)
+    # solve equation(s)
+    Sol = bb.dot(_pinv.T)
 
     # arrange solutions into subarrays for each β
-    Beta = Sol[0].reshape((pol, len(Sol[0]) // pol))
+    Beta = Sol.reshape(Sol.shape[:-1] + (pol, Sol.shape[-1] // pol))
 
     return Beta
 
 
-def _Slices(radial, Beta, legendre_orders, smoothing=0):
-    """Convolve Beta with a Gaussian function of 1/e width smoothing.
-
+def _Slices(radial, Beta, legendre_orders, lazy=False):
+    """Construct the image slice from Beta (using cached geometry arrays, see
+    :func:`_get_slices_cached`), optionally as a lazy image.
     """
     R = int(radial[-1])  # outer radius
-    pol = len(legendre_orders)
-    NP = len(Beta[0])  # number of Newton spheres
+    i0, i1, w0, w1, angular = _get_slices_cached(radial, legendre_orders)
 
-    # Convolve Beta with Gaussian smoothing function
-    if smoothing > 0:
-        Beta_convol = gaussian_filter1d(Beta, smoothing, axis=1,
-                                        mode='constant', cval=0)
-    else:
-        Beta_convol = Beta
+    def half(idx=...):
+        # right half of the image (symmetric) or its part
+        Slice = 0
+        # Sum ordered slices up:
+        for B, ang in zip(Beta, angular):
+            # interpolated β(r), multiplied by normalized angular part
+            Slice = Slice + (B[i0[idx]] * w0[idx] +
+                             B[i1[idx]] * w1[idx]) * ang[idx]
+        return Slice
+
+    if lazy:
+        return abel.rbasex.LazyImage(half, True, R, (2 * R + 1, 2 * R + 1),
+                                     (R, R))
+
+    Slice = half()
+    # combine with left half (mirrored without central column)
+    return np.hstack((Slice[:, :0:-1], Slice))
 
-    Slice = np.zeros((2 * R + 1, 2 * R + 1))  # full image size
-    col = np.arange(-R, R + 1)
-    row = col[:, None]
+
+def _get_slices_cached(radial, legendre_orders):
+    """
+    Internal function.
+
+    Returns arrays for image synthesis (right half) from the Beta array:
+    indices and weights for linear interpolation over the **radial** grid
+    (equivalent to ``np.interp(r, radial, Beta[i], left=0)``) and angular
+    factors (Legendre polynomials of cos θ divided by the sphere area) for
+    each order. The arrays are computed only if the parameters differ from
+    those in the previous call.
+    """
+    global _slices, _slices_cfg
+
+    if _slices_cfg is not None and \
+       _slices_cfg[0] == tuple(legendre_orders) and \
+       np.array_equal(_slices_cfg[1], radial):
+        return _slices
+
+    R = int(radial[-1])  # outer radius
+    NP = len(radial)  # number of Newton spheres
+
+    col = np.arange(R + 1)
+    row = np.arange(-R, R + 1)[:, None]
     r = np.sqrt(row**2 + col**2 + 0.1)  # + 0.1 to avoid division by zero
 
-    # Sum ordered slices up:
-    for i in range(pol):
-        # interpolated β(r), where r=radius
-        BB = np.interp(r, radial, Beta_convol[i, :], left=0)
-        # multiplied by angular part, -row / r = cos θ
-        Slice += BB * eval_legendre(legendre_orders[i], -row / r)
+    # interpolation indices and weights
+    i0 = np.clip(np.searchsorted(radial, r, side='right') - 1, 0,
+                 max(NP - 2, 0))
+    i1 = np.minimum(i0 + 1, NP - 1)
+    dr = radial[i1] - radial[i0]
+    w1 = np.zeros_like(r)
+    np.divide(r - radial[i0], dr, out=w1, where=dr > 0)
+    np.clip(w1, 0, 1, out=w1)  # (constant beyond the last sphere)
+    w0 = 1 - w1
+    # (zero inside the first sphere)
+    w0[r < radial[0]] = 0
+    w1[r < radial[0]] = 0
 
-    # normalize: division by sphere area
-    Slice /= 4 * np.pi * r**2
+    # angular parts, -row / r = cos θ, normalized: division by sphere area
+    angular = [eval_legendre(order, -row / r) / (4 * np.pi * r**2)
+               for order in legendre_orders]
 
-    return Slice, Beta_convol
+    _slices = (i0, i1, w0, w1, angular)
+    _slices_cfg = (tuple(legendre_orders), radial.copy())
+
+    return _slices
 
 
 def mean_beta(radial, Beta, regions):
@@ -380,6 +472,74 @@ def _single_Beta_norm(Beta, threshold=0.2, norm_range=(0, -1)):
     return Beta_norm
 
 
+def _bs_proj(cols, proj_angles):
+    """
+    Sparse operator that projects the (flattened) image onto the vertical axis
+    of the image rotated by each projection angle (as
+    ``scipy.ndimage.rotate(IM, angle, reshape=False).sum(axis=1)``, but without
+    interpolation). Each pixel (as a unit square) contributes to the nearest
+    projection bins with weights equal to its projected profile (a trapezoid)
+    at the bin centers, which avoids moiré patterns for arbitrary angles.
+    Pixels rotated outside the image frame are discarded.
+    """
+    R = cols // 2
+    y, x = np.indices((cols, cols)) - R
+    y = y.reshape(-1)
+    x = x.reshape(-1)
+    pixels = np.arange(cols * cols)
+
+    bins, cols_idx, weights = [], [], []
+    for u, angle in enumerate(proj_angles):
+        # (rounding makes axis-aligned projections exact plain sums)
+        c, s = np.round([np.cos(angle), np.sin(angle)], 12)
+        # pixel coordinates in the rotated image
+        p = R + y * c - x * s  # row = projection coordinate
+        q = R + x * c + y * s  # column
+        inside = (-0.5 <= q) & (q < cols - 0.5)
+        p = p[inside]
+        pix = pixels[inside]
+        # projected pixel profile (relative to its center), which is a
+        # convolution of two rectangles with widths a ⩽ b
+        a, b = sorted([abs(c), abs(s)])
+        if a < 1e-6:  # rectangle with width b ≈ 1
+            def f(t):
+                return ((-b / 2 <= t) & (t < b / 2)) / b
+        else:  # trapezoid
+            def f(t):
+                return np.clip(((a + b) / 2 - np.abs(t)) / a, 0, 1) / b
+        # (width a + b ⩽ √2, thus the 3 nearest bins are enough)
+        k = np.rint(p).astype(int)
+        for dk in [-1, 0, 1]:
+            kb = k + dk
+            w = f(kb - p)
+            use = (0 <= kb) & (kb < cols) & (w > 0)
+            bins.append(u * cols + kb[use])
+            cols_idx.append(pix[use])
+            weights.append(w[use])
+
+    return csr_matrix((np.concatenate(weights),
+                       (np.concatenate(bins), np.concatenate(cols_idx))),
+                      shape=(len(proj_angles) * cols, cols * cols))
+
+
+def _get_proj_cached(cols, proj_angles):
+    """
+    Internal function.
+
+    Returns the projection operator (see :func:`_bs_proj`) for the image
+    width and projection angles, computing it if they differ from those in
+    the previous call.
+    """
+    global _proj, _proj_cfg
+
+    cfg = (cols, tuple(proj_angles))
+    if _proj_cfg != cfg:
+        _proj = _bs_proj(cols, proj_angles)
+        _proj_cfg = cfg
+
+    return _proj
+
+
 def _bas(order, angle, COS, TRI):
     """Define basis vectors for a given polynomial order "order" and a
        given projection angle "angle".
@@ -491,7 +651,7 @@ def get_bs_cached(cols, basis_dir=None, legendre_orders=[0, 2],
 
     if _basis is not None:
         # check basis array sizes, warning may not be unique
-        if _basis.shape == (2*cols, cols+1):
+        if _basis.shape[0] == len(proj_angles) * cols:
             if _los == los and _pas == pas and _radial_step == radial_step and\
                _clip == clip:
                 if verbose:
@@ -549,13 +709,20 @@ def cache_cleanup():
     None
     """
 
-    global _basis, _los, _pas, _radial_step, _clip
+    global _basis, _los, _pas, _radial_step, _clip, _proj, _proj_cfg, \
+           _pinv, _pinv_cfg, _slices, _slices_cfg
 
     _basis = None
     _los = None
     _pas = None
     _radial_step = None
     _clip = None
+    _proj = None
+    _proj_cfg = None
+    _pinv = None
+    _pinv_cfg = None
+    _slices = None
+    _slices_cfg = None
 
 
 def basis_dir_cleanup(basis_dir=''):
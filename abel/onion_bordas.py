@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.ndimage import shift
+from scipy.linalg import solve_triangular
 
 ################################################################################
 #
@@ -21,6 +22,10 @@ from scipy.ndimage import shift
 #
 ################################################################################
 
+# cache transform matrix
+_tr = None
+
+
 def _init_abel_vec(xc, yc):
     # vectorized 
     i = np.arange(xc, dtype=int)
@@ -36,19 +41,65 @@ def _init_abel_vec(xc, yc):
 
     return val1, val2
 
-def _init_abel(xc, yc):
-    # this seems like it could be vectorized pretty easily
-    val1 = np.zeros((xc, xc))
-    val2 = np.zeros((xc, yc))
+def get_bs_cached(cols):
+    """
+    Internal function.
 
-    for ii in range(xc):
-        for jj in range(ii, xc):
-            val1[ii, jj] = np.arcsin((ii+1)/(jj+1)) - \
-                           np.arcsin((ii)/(jj+1))
+    Gets the onion-peeling transform matrix for the given image width (before
+    scaling by ``1/(2 dr)``) from the cache or calculates it.
 
-        val2[ii, :] = 1.0/(ii+1)
+    The onion peeling is a back substitution with the upper-triangular matrix
+    ``val1``: the outermost column is deconvolved first and its contribution
+    is subtracted from all inner columns, and so on. This linear operation is
+    the same for all rows, so it is precomputed once and applied to the whole
+    image as a single matrix product.
 
-    return val1, val2
+    Parameters
+    ----------
+    cols : int
+        image width
+
+    Returns
+    -------
+    M : cols × cols numpy array
+        transform matrix (image rows are multiplied by it from the right)
+    """
+    global _tr
+
+    if _tr is not None and _tr.shape[0] == cols:
+        return _tr
+
+    M = np.zeros((cols, cols))
+    if cols > 1:
+        val1, val2 = _init_abel_vec(cols, 1)
+        # peeling = back substitution with the triangular matrix (the 0-th
+        # column is never peeled); M = (val1^-1)^T / (radius + 1)
+        V = val1[1:, 1:]
+        M[1:, 1:] = solve_triangular(V, np.eye(cols - 1)).T * val2[1:, 0]
+        # the innermost value is duplicated
+        M[:, 0] = M[:, 1]
+    _tr = M
+
+    return _tr
+
+
+def cache_cleanup():
+    """
+    Utility function.
+
+    Frees the memory cache created by :func:`get_bs_cached`.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    global _tr
+
+    _tr = None
 
 
 def onion_bordas_transform(IM, dr=1, direction="inverse", shift_grid=True,
@@ -123,43 +174,8 @@ def onion_bordas_transform(IM, dr=1, direction="inverse", shift_grid=True,
     if shift_grid:
         IM = shift(IM, (0,-0.5), mode='nearest')
 
-    # we would like to work from the outside to the inside of the image, 
-    # so flip the image to put the "outside" at low index values.
-    IM = np.fliplr(IM)
-
-    h, w = np.shape(IM)
-
-    # calculate val1 and val2, which are 2D arrays
-    # of what appear to be scaling factors
-    val1, val2 = _init_abel(w, h) 
-
-    abel_arr = np.zeros_like(IM)
-    # initialize 2D array for final transform
-    rest_arr = IM
-    # initialize 2D array that will be manipulated during the transform
-    vect = np.zeros(h)
-    # initialize a 1D array that is temporarily used to store scaling factors
-
-    for col_index in range(1, w):
-        # iterate over the columns (x-values) in the slice space
-
-        idist = w - col_index
-        # this is basically the x-coordinate
-        # or "distance in i direction", I guess
-        rest_col = rest_arr[:, col_index-1]
-        # a 1D column. This is the piece of the onion we are on.
-        normfac = 1 / val1[idist, idist]
-
-        for i in range(idist)[::-1]:
-            rest_arr[:, w-i-1] -= rest_col * normfac * val1[i, idist]
-
-        for row_index in range(h):  # for row_index =1:ymax
-            vect[row_index] = val2[idist, h-row_index-1]
-
-        abel_arr[:, col_index] = normfac * rest_col * vect.transpose()
-
-    abel_arr = np.c_[abel_arr[:, 1:],abel_arr[:, -1]]
-    abel_arr = np.fliplr(abel_arr) # flip back
+    # transform all rows by the cached matrix of the onion peeling
+    abel_arr = IM.dot(get_bs_cached(IM.shape[1]))
 
     # shift back to pixel grid
     if shift_grid:
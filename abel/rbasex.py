@@ -2,12 +2,14 @@ import os.path
 from os import listdir
 import re
 from glob import glob
+from collections import OrderedDict
+import hashlib
 
 import numpy as np
 from scipy.linalg import inv, solve_triangular, svd, pascal, invpascal
-from scipy.optimize import nnls
 
 import abel
+from abel.tools.math import nnls
 from abel.tools.vmi import Distributions
 from abel.tools.symmetry import put_image_quadrants
 
@@ -38,21 +40,28 @@ from abel.tools.symmetry import put_image_quadrants
 
 
 # Caches and their parameters
-_prm = None  # [shape, origin, rmax, order, odd]
-_weights = None  # weights — pixel weights
+_prm = None  # (shape, origin, rmax, order, odd, weights hash)
 _dst = None  # Distributions object
 _bs_prm = None  # [Rmax, order, odd]
 _bs = None  # [P[n]] — projected functions
+_ibs_prm = None  # [height, width, row]
 _ibs = None  # [rbin, wl, wu, cos^n] — arrays for image construction
 _trf = None  # [Af[n]] — forward transform matrices
 _tri_full = None  # [Ai[n]] — inverse-transform matrices without mask and reg
 _tri_prm = None  # [reg] — regularization parameters
 _tri = None  # [Ai[n]] — inverse-transform matrices (or Af for reg='pos')
+_pos = None  # (Af, cs) — last reg='pos' solution (initial guess for next)
+# Caches above for recently used configurations other than the current
+_cfg_vars = ['_dst', '_ibs_prm', '_ibs', '_bs_prm', '_bs',
+             '_trf', '_tri_full', '_tri_prm', '_tri', '_pos']
+_cfg = OrderedDict()  # {_prm: {var: value}}, from least to most recently used
+_cfg_size = 4  # max. number of configurations, including the current
 
 
 def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
                      weights=None, direction='inverse', reg=None, out='same',
-                     basis_dir=None, verbose=False):
+                     basis_dir=None, verbose=False, lazy=False,
+                     low_memory=False, var=None):
     r"""
     :doc:`rBasex <transform_methods/rbasex>` Abel transform for
     velocity-mapping images, operating in polar coordinates.
@@ -85,7 +94,9 @@ def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
         weighting factors for each pixel. The array shape must match the image
         shape. Parts of the image can be excluded from analysis by assigning
         zero weights to their pixels. By default is `None`, which applies equal
-        weight to all pixels.
+        weight to all pixels. Computations for several recently used
+        configurations (including weights) are cached, see
+        :func:`set_cache_size`.
     direction : str: ``'forward'`` or ``'inverse'``
         type of Abel transform to be performed (by default, inverse)
     reg : None or str or tuple (str, float), optional
@@ -157,30 +168,120 @@ def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
         will not be loaded from or saved to disk.
     verbose : bool
         print information about processing (for debugging), disabled by default
+    lazy : bool
+        return the transformed image as a :class:`LazyImage` object instead of
+        a numpy array (by default, `False`). The pixel values are then computed
+        only when the image (or its part) is accessed, which is useful if the
+        images are needed only occasionally, or only some rows or regions are
+        needed.
+    low_memory : bool
+        for the inverse transform without regularization, do not compute and
+        store the inverse-transform matrices, but solve the triangular
+        equations for each transform (by default, `False`). This reduces the
+        memory usage by about 3 times (important for large **rmax** and
+        **order**), but makes each transform slower.
+    var : m × n numpy array, optional
+        variances of the input image pixels (for example, ``var=IM`` for
+        Poisson statistics), assumed to be independent. If given, the
+        variances of the transformed distributions (see
+        :attr:`~abel.tools.vmi.Distributions.Results.cov`) and the transformed
+        image are also calculated by linear error propagation. This is much
+        faster than resampling but also takes about as much time as the
+        transform itself. Not implemented for ``reg='pos'`` (nonlinear) and
+        ``low_memory=True``.
 
     Returns
     -------
-    recon : 2D numpy array or None
+    recon : 2D numpy array or LazyImage or None
         the transformed image. Is centered and might have different dimensions
         than the input image.
     distr : Distributions.Results object
         the object from which various distributions for the transformed image
         can be retrieved, see :class:`abel.tools.vmi.Distributions.Results`
+    recon_var : 2D numpy array or LazyImage or None
+        variances of the transformed image pixels (returned only if **var** is
+        given)
     """
+    return _transform(IM, IM.shape, origin, rmax, order, odd, weights,
+                      direction, reg, out, lazy, low_memory, var, basis_dir,
+                      verbose)
+
+
+def rbasex_transform_events(x, y, w=None, shape=None, origin='center',
+                            rmax='MIN', order=2, odd=False, weights=None,
+                            direction='inverse', reg=None, out='same',
+                            lazy=False, low_memory=False, basis_dir=None,
+                            verbose=False):
+    """
+    :doc:`rBasex <transform_methods/rbasex>` Abel transform for event data
+    (centroided particle hits).
+
+    This function is equivalent to :func:`rbasex_transform` applied to the
+    image formed by the events, but the events are binned directly into the
+    radial distributions (see :meth:`abel.tools.vmi.Distributions.events`),
+    without building this image. For sparse data this is much faster and also
+    avoids the pixelization errors.
+
+    Parameters
+    ----------
+    x, y : 1D numpy arrays
+        event coordinates in pixels, such that the center of the pixel [*i*,
+        *j*] has *x* = *j*, *y* = *i*. Events outside the image frame are
+        ignored.
+    w : 1D numpy array, optional
+        event weights (by default, all events have unit weights)
+    shape : tuple of int
+        (rows, columns) shape of the image frame (can be omitted if **weights**
+        are given)
+
+    Other parameters are the same as in :func:`rbasex_transform` (except
+    **var**).
+
+    Returns
+    -------
+    recon : 2D numpy array or LazyImage or None
+        the transformed image
+    distr : Distributions.Results object
+        the object from which various distributions for the transformed image
+        can be retrieved, see :class:`abel.tools.vmi.Distributions.Results`
+    """
+    if shape is None:
+        if weights is None:
+            raise ValueError('Image shape must be specified')
+        shape = weights.shape
+    return _transform((x, y, w), tuple(shape), origin, rmax, order, odd,
+                      weights, direction, reg, out, lazy, low_memory, None,
+                      basis_dir, verbose)
+
+
+def _transform(data, shape, origin, rmax, order, odd, weights, direction, reg,
+               out, lazy, low_memory, var, basis_dir, verbose):
+    """
+    Transform an image or event data (x, y, w) with given frame shape.
+    """
+    global _pos
+
     if order == 0:
         odd = False  # (to eliminate additional checks)
     elif order % 2:
         odd = True  # enable automatically for odd orders
 
-    # extract radial profiles from input image
-    p = _profiles(IM, origin, rmax, order, odd, weights, verbose)
+    if var is not None:
+        if reg == 'pos':
+            raise ValueError('Variances cannot be calculated for reg="pos"')
+        if direction == 'inverse' and reg is None and low_memory:
+            raise ValueError('Variances cannot be calculated with '
+                             'low_memory=True')
+
+    # extract radial profiles from input data
+    p = _profiles(data, shape, origin, rmax, order, odd, weights, verbose)
     # (caches Distributions as _dst)
 
     Rmax = _dst.rmax
 
     # get appropriate transform matrices
     A = get_bs_cached(Rmax, order, odd, direction, reg, _dst.valid,
-                      basis_dir, verbose)
+                      basis_dir, verbose, low_memory)
 
     # transform radial profiles
     if reg == 'pos':
@@ -188,7 +289,9 @@ def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
             print('Solving NNLS equations...')
         N = len(p)
         p = np.hstack(p)
-        cs = nnls(A, p)[0]
+        # start from the previous solution for the same matrix, if any
+        cs = nnls(A, p, _pos[1] if _pos is not None and _pos[0] is A else None)
+        _pos = (A, cs)
         cs = np.split(cs, N)
         if odd:
             # (1 ± cos) / 2 → cos^0, cos^1
@@ -197,18 +300,39 @@ def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
             # cossin → cos transform
             C = np.flip(invpascal(N, 'upper'))
             c = C.dot(cs)
+    elif direction == 'inverse' and reg is None and low_memory:
+        if verbose:
+            print('Solving triangular equations...')
+        # A = [P[n]], Ai[n] = inv(P[n].T)
+        c = np.array([solve_triangular(Pn, pn, trans='T', lower=True)
+                      for Pn, pn in zip(A, p)])
+        # zero output radii without data (as masked Ai[n] do)
+        c[:, ~_dst.valid] = 0
     else:
         if verbose:
             print('Applying radial transforms...')
         c = [An.dot(pn) for An, pn in zip(A, p)]
 
+    # propagate variances
+    if var is None:
+        cov = None
+    else:
+        if verbose:
+            print('Propagating variances...')
+        cov, cov1 = _propagate(A, *_dst._cov(var))
+
     # construct output (transformed) distributions
     distr = Distributions.Results(np.arange(Rmax + 1), np.array(c),
                                   order, odd,
-                                  _dst.valid)
+                                  _dst.valid, cov)
+
+    def result(recon, recon_var=None):
+        if var is None:
+            return recon, distr
+        return recon, distr, recon_var
 
     if out is None:
-        return None, distr
+        return result(None)
 
     # output size
     if out == 'same':
@@ -225,50 +349,221 @@ def rbasex_transform(IM, origin='center', rmax='MIN', order=2, odd=False,
         row = Rmax if odd else 0
     else:
         raise ValueError(f'Wrong output shape "{out}"')
+    # arrays for image construction
+    ibs = _get_image_bs(height, width, row, verbose)
+
+    if lazy:
+        # shape and origin of the output image
+        if out == 'same':
+            origin = (_dst.row, _dst.col)
+        elif out in ['fold', 'full-unique']:
+            shape = (height, width)
+            origin = (row, 0) if odd else (height - 1, 0)
+        else:  # 'unfold', 'full'
+            shape = (height if odd else 2 * height - 1, 2 * width - 1)
+            origin = (row if odd else height - 1, width - 1)
+
+        def lazy_image(quadrant):
+            return LazyImage(quadrant, odd, row, shape, origin)
+
+        return result(lazy_image(lambda idx=...: _image(c, ibs, idx)),
+                      None if var is None else
+                      lazy_image(lambda idx=...: _image_var(cov, cov1, ibs,
+                                                            idx)))
+
+    def assemble(Q):
+        # bottom right quadrant or right half → output image
+        if odd:
+            if out not in ['fold', 'full-unique']:
+                # combine with left half (mirrored without central column)
+                Q = np.hstack((Q[:, :0:-1], Q))
+        else:  # even only
+            Q = Q[::-1]  # flip to Q0
+            if out not in ['fold', 'full-unique']:
+                # assemble full image
+                Q = put_image_quadrants((Q, Q, Q, Q),
+                                        (2 * height - 1, 2 * width - 1))
+        if out == 'same':
+            # crop as needed
+            row = 0 if odd else _dst.VER - _dst.row
+            col = _dst.HOR - _dst.col
+            H, W = shape
+            Q = Q[row:row + H, col:col + W]
+        return Q
+
     # construct output image from transformed radial profiles
     if verbose:
         print('Constructing output image...')
-    # bottom right quadrant or right half
-    recon = _image(height, width, row, c, verbose)
-    if odd:
-        if out not in ['fold', 'full-unique']:
-            # combine with left half (mirrored without central column)
-            recon = np.hstack((recon[:, :0:-1], recon))
-    else:  # even only
-        recon = recon[::-1]  # flip to Q0
-        if out not in ['fold', 'full-unique']:
-            # assemble full image
-            recon = put_image_quadrants((recon, recon, recon, recon),
-                                        (2 * height - 1, 2 * width - 1))
-    if out == 'same':
-        # crop as needed
-        row = 0 if odd else _dst.VER - _dst.row
-        col = _dst.HOR - _dst.col
-        H, W = IM.shape
-        recon = recon[row:row + H, col:col + W]
+    recon = assemble(_image(c, ibs))
+    if var is None:
+        return result(recon)
+    return result(recon, assemble(_image_var(cov, cov1, ibs)))
 
-    return recon, distr
 
+def _propagate(A, cov0, cov1):
+    """
+    Propagate covariances of radial profiles through transform matrices.
 
-def _profiles(IM, origin, rmax, order, odd, weights, verbose):
+    A : [A[n]] — transform matrices for each order
+    cov0, cov1 : N × N covariance matrices of input profiles
+        cov0[r] = Cov(c(r), c(r)), cov1[r] = Cov(c(r), c(r + 1))
+    Returns the covariance matrices of output profiles in the same format.
     """
-    Get radial profiles of cos^n theta terms from the input image.
+    # The input covariance matrix for orders n, m is tridiagonal; for each
+    # pair of orders, T = A[n]·Cov_nm·A[m]^T is computed only where needed
+    # (main and first diagonals), without forming dense products.
+    N = len(A)
+    cov = np.empty((A[0].shape[0], N, N))
+    cov1_out = np.empty((A[0].shape[0] - 1, N, N))
+    for n in range(N):
+        for m in range(n, N):
+            # A[n]·Cov_nm
+            T = A[n] * cov0[:, n, m]
+            T[:, 1:] += A[n][:, :-1] * cov1[:, n, m]
+            T[:, :-1] += A[n][:, 1:] * cov1[:, m, n]
+            # diagonal blocks
+            cov[:, n, m] = cov[:, m, n] = np.einsum('ij,ij->i', T, A[m])
+            # off-diagonal blocks
+            cov1_out[:, n, m] = np.einsum('ij,ij->i', T[:-1], A[m][1:])
+            cov1_out[:, m, n] = np.einsum('ij,ij->i', T[1:], A[m][:-1])
+    return cov, cov1_out
+
+
+class LazyImage:
+    """
+    Transformed image computed on demand.
+
+    Objects of this class are returned by :func:`rbasex_transform` (and
+    :func:`abel.linbasex.linbasex_transform_full`) with ``lazy=True``. They
+    hold only the transformed radial profiles (or their covariances) and
+    references to the cached pixel-interpolation arrays, so creating them
+    costs almost nothing. The whole image is computed (once) when the object
+    is converted to a numpy array::
+
+        recon, distr = rbasex_transform(IM, lazy=True)
+        ...
+        plt.imshow(recon)  # or np.asarray(recon), or recon.image()
+
+    Indexing the object by integers and slices computes only the requested
+    region::
+
+        row = recon[origin_row]  # one row
+        center = recon[100:200, 100:200]  # central part
+
+    Attributes
+    ----------
+    shape : tuple of int
+        (rows, columns) shape of the image
+    origin : tuple of int
+        (row, column) of the image origin
+    """
+    def __init__(self, quadrant, odd, row, shape, origin):
+        # function(idx) computing the quadrant (or half) or its part; must
+        # hold own references to the data, not affected by cache resets
+        self._quadrant = quadrant
+        self._odd = odd
+        self._row = row  # origin row in ibs arrays
+        self.shape = shape
+        self.origin = origin
+        self._IM = None
+
+    ndim = 2
+
+    def _index(self, rows, cols):
+        """
+        Indices in ibs arrays (lower right quadrant for even-only, right half
+        for odd) corresponding to given image rows and columns.
+        """
+        row, col = self.origin
+        if self._odd:
+            rows = rows - row + self._row
+        else:
+            rows = np.abs(rows - row)
+        cols = np.abs(cols - col)
+        return np.ix_(rows, cols)
+
+    def image(self):
+        """
+        Compute the whole image.
+
+        Returns
+        -------
+        IM : 2D numpy array
+            the transformed image (computed only at the first call)
+        """
+        if self._IM is None:
+            # bottom right quadrant or right half
+            Q = self._quadrant()
+            # unfold and crop
+            self._IM = Q[self._index(np.arange(self.shape[0]),
+                                     np.arange(self.shape[1]))]
+        return self._IM
+
+    def __array__(self, dtype=None, copy=None):
+        IM = self.image()
+        if dtype is not None:
+            IM = IM.astype(dtype)
+        return IM
+
+    def __getitem__(self, key):
+        if self._IM is not None:
+            return self._IM[key]
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 2 or \
+           not all(isinstance(k, (int, np.integer, slice)) for k in key):
+            # (general indexing is not worth implementing separately)
+            return self.image()[key]
+        key += (slice(None),) * (2 - len(key))
+        # requested rows and columns
+        rows, cols = [np.arange(n)[k] for n, k in zip(self.shape, key)]
+        IM = self._quadrant(self._index(np.atleast_1d(rows),
+                                        np.atleast_1d(cols)))
+        # remove dimensions indexed by integers
+        return IM[tuple(0 if np.ndim(k) == 0 else slice(None)
+                        for k in (rows, cols))]
+
+
+def _profiles(data, shape, origin, rmax, order, odd, weights, verbose):
+    """
+    Get radial profiles of cos^n theta terms from the input image or events.
     """
     # the Distributions object is cached to speed up further calculations,
     # plus its cos^n theta matrices are used later to construct the transformed
     # image
-    global _prm, _weights, _dst, _ibs, _trf, _tri_prm, _tri
+    global _prm, _dst, _ibs, _trf, _tri_prm, _tri, _pos
 
     old_valid = None if _dst is None else _dst.valid
 
     if verbose:
         print('Extracting radial profiles...')
-    prm = [IM.shape, origin, rmax, order, odd]
-    if _prm != prm or _weights is not weights:
+    if np.ndim(origin) == 1:  # (make hashable)
+        origin = tuple(origin)
+    if weights is None:
+        whash = None
+    else:  # (by content, since the array can be modified in place)
+        whash = (weights.dtype.str,
+                 hashlib.sha1(np.ascontiguousarray(weights)).hexdigest())
+    prm = (shape, origin, rmax, order, odd, whash)
+    if _prm != prm:
+        # move current configuration to the cache...
+        if _prm is not None and _cfg_size > 1:
+            _cfg[_prm] = {var: globals()[var] for var in _cfg_vars}
+            while len(_cfg) >= _cfg_size:
+                _cfg.popitem(last=False)  # (least recently used)
         _prm = prm
-        _weights = weights
+        # ...and take the requested from it, if available
+        cfg = _cfg.pop(prm, None)
+        if cfg is not None:
+            globals().update(cfg)
+            if verbose:
+                print('(reusing cached configuration)')
+            return _distr(data, shape).cos()
+        # (a copy of weights is used, so that the cache stays consistent)
         _dst = Distributions(origin=origin, rmax=rmax, order=order, odd=odd,
-                             weights=weights, use_sin=False, method='linear')
+                             weights=None if weights is None else
+                                     weights.copy(),
+                             use_sin=False, method='linear')
         if verbose:
             print('(new Distributions object created)')
         # reset image basis
@@ -277,24 +572,36 @@ def _profiles(IM, origin, rmax, order, odd, weights, verbose):
         if verbose:
             print('(reusing cached Distributions object)')
 
-    c = _dst(IM).cos()
+    c = _distr(data, shape).cos()
 
     if not np.array_equal(_dst.valid, old_valid):
         # reset transforms
         _trf = None
         _tri_prm = None
         _tri = None
+        _pos = None
 
     return c
 
 
+def _distr(data, shape):
+    """
+    Analyze image or events (x, y, w) with the current Distributions object.
+    """
+    if isinstance(data, tuple):
+        return _dst.events(*data, shape=shape)
+    return _dst(data)
+
+
 def _get_image_bs(height, width, row, verbose):
-    global _ibs
+    global _ibs_prm, _ibs
 
-    if _ibs is not None:
+    prm = [height, width, row]
+    if _ibs is not None and _ibs_prm == prm:
         if verbose:
             print('(using cached image basis)')
         return _ibs
+    _ibs_prm = prm
 
     # _dst quadrant has the minimal size, so height and width either equal its
     # dimensions, or at least one of them is larger
@@ -338,12 +645,16 @@ def _get_image_bs(height, width, row, verbose):
     return _ibs
 
 
-def _image(height, width, row, c, verbose):
+def _image(c, ibs, idx=...):
     """
     Create transformed image (lower right quadrant for even-only,
     right half for odd) from its cos^n theta radial profiles.
+
+    ibs : arrays for image construction (see _get_image_bs())
+    idx : index applied to these arrays to construct only a part of the image
     """
-    rbin, wl, wu, cos = _get_image_bs(height, width, row, verbose)
+    rbin, wl, wu, cos = ibs
+    rbin, wl, wu = rbin[idx], wl[idx], wu[idx]
 
     # 0th order (isotropic)
     IM = (wl * np.append(c[0], [0])[rbin] +  # lower bins
@@ -351,13 +662,44 @@ def _image(height, width, row, c, verbose):
     # add all other orders
     for cn, cosn in zip(c[1:], cos[1:]):
         IM += (wl * np.append(cn, [0])[rbin] +
-               wu * np.append(cn[1:], [0, 0])[rbin]) * cosn
+               wu * np.append(cn[1:], [0, 0])[rbin]) * cosn[idx]
     # (weighting for each order is somehow faster than processing lower and
     #  upper bins separately and then combining)
 
     return IM
 
 
+def _image_var(cov, cov1, ibs, idx=...):
+    """
+    Create variance image for _image() from covariance matrices of its cos^n
+    theta radial profiles: cov[r] = Cov(c(r), c(r)),
+    cov1[r] = Cov(c(r), c(r + 1)).
+    """
+    rbin, wl, wu, cos = ibs
+    rbin, wl, wu = rbin[idx], wl[idx], wu[idx]
+    wl2, wu2, wlu = wl**2, wu**2, wl * wu
+    cos = [None] + [cosn[idx] for cosn in cos[1:]]
+
+    N = cov.shape[1]
+    IM = 0
+    for n in range(N):
+        for m in range(n, N):
+            cnm = cov[:, n, m]
+            cnm1 = cov1[:, n, m] + cov1[:, m, n]
+            V = (wl2 * np.append(cnm, [0])[rbin] +  # lower bins
+                 wu2 * np.append(cnm[1:], [0, 0])[rbin] +  # upper bins
+                 wlu * np.append(cnm1, [0, 0])[rbin])  # lower × upper
+            if n != m:
+                V *= 2  # (for n, m and m, n)
+            if n > 0:
+                V *= cos[n]
+            if m > 0:
+                V *= cos[m]
+            IM = IM + V
+
+    return IM
+
+
 def _bs_rbasex(Rmax, order, odd):
     """
     Compute radial parts of basis projections for R and radii up to Rmax.
@@ -542,7 +884,7 @@ def _save_bs(basis_dir, Rmax, order, odd, bs, tri=False, verbose=False):
 
 
 def get_bs_cached(Rmax, order=2, odd=False, direction='inverse', reg=None,
-                  valid=None, basis_dir=None, verbose=False):
+                  valid=None, basis_dir=None, verbose=False, low_memory=False):
     """
     Internal function.
 
@@ -570,6 +912,12 @@ def get_bs_cached(Rmax, order=2, odd=False, direction='inverse', reg=None,
         loaded from or saved to disk.
     verbose : bool
         print some debug information
+    low_memory : bool
+        for the inverse transform without regularization, return the
+        (lower triangular) basis projection matrices *P* instead of the
+        inverse-transform matrices, which are not computed and not cached
+        (the inverse transform must be then performed by solving the
+        triangular equations :math:`P^T c = p`)
 
     Returns
     -------
@@ -589,7 +937,8 @@ def get_bs_cached(Rmax, order=2, odd=False, direction='inverse', reg=None,
         _bs_prm = prm
         # try to load basis set and maybe inverse-transform matrices
         _bs, _tri_full = _load_bs(basis_dir, Rmax, order, odd,
-                                  direction == 'inverse' and reg is None,
+                                  direction == 'inverse' and reg is None and
+                                  not low_memory,
                                   verbose)
         if _bs is None:
             if verbose:
@@ -632,6 +981,14 @@ def get_bs_cached(Rmax, order=2, odd=False, direction='inverse', reg=None,
                 print('Creating forward-transform matrices...')
             _trf = Af()
         return _trf
+    elif reg is None and low_memory:  # 'inverse' with triangular solutions
+        # free memory used by inverse-transform matrices
+        _tri_full = None
+        _tri_prm = None
+        _tri = None
+        if new_bs:
+            _save_bs(basis_dir, Rmax, order, odd, _bs, None, verbose)
+        return _bs
     else:  # 'inverse'
         if _tri_prm != [reg]:
             _tri_prm = [reg]
@@ -657,7 +1014,7 @@ def get_bs_cached(Rmax, order=2, odd=False, direction='inverse', reg=None,
                 # Construct forward transform matrix cossin → cos projections.
                 # Notes:
                 # 1. By reversing orders, it also could be made triangular for
-                #    more effective inversion, but nnls() does not care.
+                #    more effective inversion, but nnls() works with A^T A.
                 # 2. This code is not optimized, but its execution time is
                 #    still negligible compared to nnls().
                 if odd:
@@ -724,7 +1081,8 @@ def cache_cleanup(select='all'):
     """
     Utility function.
 
-    Frees the memory caches created by :func:`get_bs_cached`.
+    Frees the memory caches created by :func:`get_bs_cached` and
+    :func:`rbasex_transform`.
     This is usually pointless, but might be required after working
     with very large images, if more RAM is needed for further tasks.
 
@@ -744,7 +1102,8 @@ def cache_cleanup(select='all'):
     -------
     None
     """
-    global _prm, _dst, _bs_prm, _bs, _ibs, _trf, _tri_full, _tri_prm, _tri
+    global _prm, _dst, _bs_prm, _bs, _ibs, _trf, _tri_full, _tri_prm, _tri, \
+           _pos
 
     if select == 'all':
         _prm = None
@@ -752,12 +1111,50 @@ def cache_cleanup(select='all'):
         _bs_prm = None
         _bs = None
         _ibs = None
+        _cfg.clear()
     if select in ('all', 'forward'):
         _trf = None
+        for cfg in _cfg.values():
+            cfg['_trf'] = None
     if select in ('all', 'inverse'):
         _tri_full = None
         _tri_prm = None
         _tri = None
+        _pos = None
+        for cfg in _cfg.values():
+            cfg.update(_tri_full=None, _tri_prm=None, _tri=None, _pos=None)
+
+
+def set_cache_size(size):
+    """
+    Utility function.
+
+    Sets the number of recently used configurations (image shape, **origin**,
+    **rmax**, **order**, **odd** and **weights**) for which
+    :func:`rbasex_transform` keeps all cached data in memory. This allows
+    switching between several configurations (for example, analyzing several
+    regions of each image with different origins or masks) without
+    recalculations. The pixel weights are identified by their content, so
+    modifying the same array in place is handled correctly.
+
+    Parameters
+    ----------
+    size : int
+        maximal number of configurations, ≥ 1 (by default, 4). Notice that
+        each configuration might require several image-sized arrays and, for
+        different **rmax**, its own basis set.
+
+    Returns
+    -------
+    None
+    """
+    global _cfg_size
+
+    if size < 1:
+        raise ValueError(f'Incorrect cache {size=}')
+    _cfg_size = size
+    while len(_cfg) >= size:
+        _cfg.popitem(last=False)
 
 
 def basis_dir_cleanup(basis_dir=''):
@@ -203,6 +203,26 @@ def test_basex_forward_gaussian_07():
     basex_forward_gaussian(sigma=0.7, reg=1e-6, atol=1e-3, rtol=1e-2)
 
 
+def test_basex_var():
+    """Check variance propagation against explicit linear transform"""
+    n = 21
+    rng = np.random.RandomState(0)
+    data = rng.rand(5, n)
+    var = rng.rand(5, n)
+    for direction in ['inverse', 'forward']:
+        recon, recon_var = abel.basex.basex_transform(data, var=var,
+                                                      basis_dir=None,
+                                                      verbose=False,
+                                                      direction=direction)
+        assert_allclose(recon, abel.basex.basex_transform(
+                                   data, basis_dir=None, verbose=False,
+                                   direction=direction))
+        # Jacobian from unit rows
+        J = abel.basex.basex_transform(np.eye(n), basis_dir=None,
+                                       verbose=False, direction=direction)
+        assert_allclose(recon_var, var.dot(J**2))
+
+
 if __name__ == '__main__':
     test_basex_basis_sets_cache()
     test_basex_basis_sets_resize_1()
@@ -217,3 +237,4 @@ if __name__ == '__main__':
     test_basex_forward_gaussian()
     test_basex_forward_gaussian_3()
     test_basex_forward_gaussian_07()
+    test_basex_var()
@@ -57,6 +57,43 @@ def test_dasch_deconvolution_array_sources():
     os.remove(fn)
 
 
+def test_dasch_forward_array_sources():
+    im = abel.tools.analytical.SampleImage(101).func
+    q = abel.tools.symmetry.get_image_quadrants(im)[0]
+
+    # clean up any old deconvolution array files
+    abel.dasch.basis_dir_cleanup('three_point', DATA_DIR)
+    abel.dasch.cache_cleanup()
+
+    gb = abel.dasch.three_point_transform(q, basis_dir=DATA_DIR,
+                                          direction='forward')
+    assert_equal(abel.dasch._source, 'generated')
+    D = abel.dasch.get_bs_cached('three_point', q.shape[1], basis_dir=None)
+    assert_allclose(gb, abel.dasch.dasch_transform_forward(q, D))
+
+    cb = abel.dasch.three_point_transform(q, basis_dir=DATA_DIR,
+                                          direction='forward')
+    assert_equal(abel.dasch._source, 'cache')
+    assert_allclose(gb, cb)
+
+    abel.dasch.cache_cleanup()
+    fb = abel.dasch.three_point_transform(q, basis_dir=DATA_DIR,
+                                          direction='forward')
+    assert_equal(abel.dasch._source, 'file')
+    assert_allclose(gb, fb)
+
+    # different size
+    q = q[:, :-1]
+    sb = abel.dasch.three_point_transform(q, basis_dir=None,
+                                          direction='forward')
+    assert_equal(abel.dasch._source, 'generated')
+    D = abel.dasch.get_bs_cached('three_point', q.shape[1], basis_dir=None)
+    assert_allclose(sb, abel.dasch.dasch_transform_forward(q, D))
+
+    abel.dasch.basis_dir_cleanup('three_point', DATA_DIR)
+    abel.dasch.cache_cleanup()
+
+
 def test_dasch_1d_gaussian(n=101):
     ref = GaussianAnalytical(n, r_max=10, symmetric=False, sigma=3)
 
@@ -110,6 +147,7 @@ if __name__ == "__main__":
     test_dasch_shape()
     test_dasch_zeros()
     test_dasch_deconvolution_array_sources()
+    test_dasch_forward_array_sources()
     test_dasch_1d_gaussian()
     test_dasch_1d_gaussian_forward()
     test_dasch_cyl_gaussian()
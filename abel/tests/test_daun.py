@@ -55,6 +55,17 @@ def test_daun_bs():
         Aref = daun_bs(n, degree)
         assert_allclose(A, Aref, err_msg=f'-> {degree=}')
 
+    # generation by small blocks
+    chunk = abel.daun._chunk
+    abel.daun._chunk = 1
+    try:
+        for degree in range(4):
+            A = _bs_daun(n, degree)
+            Aref = daun_bs(n, degree)
+            assert_allclose(A, Aref, err_msg=f'-> {degree=}, blocks')
+    finally:
+        abel.daun._chunk = chunk
+
 
 def test_daun_bs_cache():
     """Check basis-set cache handling"""
@@ -215,6 +226,18 @@ def test_daun_gaussian():
     assert_allclose(recon, 2 * ref.func, atol=3e-3, err_msg='-> dr = 0.5')
 
 
+def test_daun_inverse_degree3():
+    """Check that inverse degree-3 transform undoes the forward one"""
+    rnd = np.random.RandomState(0)
+    for n in [2, 3, 10, 100]:
+        cache_cleanup()
+        src = rnd.randn(5, n)
+        proj = daun_transform(src, degree=3, direction='forward',
+                              verbose=False)
+        recon = daun_transform(proj, degree=3, verbose=False)
+        assert_allclose(recon, src, atol=1e-12, err_msg=f'-> {n=}')
+
+
 def test_daun_forward_gaussian():
     """Check forward Daun transform of a gaussian"""
     n = 100
@@ -242,4 +265,5 @@ if __name__ == '__main__':
     test_daun_shape()
     test_daun_zeros()
     test_daun_gaussian()
+    test_daun_inverse_degree3()
     test_daun_forward_gaussian()
@@ -141,11 +141,61 @@ def test_direct_c_python_correspondence():
 
     for correction in [0, 1]:
         out1 = abel.direct._pyabel_direct_integral(x, r, correction, trapezoid)
-        out2 = abel.direct._cabel_direct_integral(x, r, correction)
+        W = abel.direct._get_weights_cached(r, correction)
+        out2 = abel.direct._cabel_direct_integral(x, W)
         assert_allclose(out1, out2, rtol=1e-9, atol=1e-9,
                         err_msg=f'-> {correction=}')
 
 
+@pytest.mark.skipif(not direct.cython_ext,
+                    reason='abel.direct C extension not installed')
+def test_direct_c_shapes_dtypes():
+    """ Check C backend for various image shapes and single precision """
+    rnd = np.random.RandomState(0)
+    for shape in [(1, 100), (3, 50), (37, 20), (100, 3)]:
+        IM = rnd.uniform(size=shape)
+        for direction in ['forward', 'inverse']:
+            ref = direct_transform(IM, direction=direction, backend='Python')
+            out = direct_transform(IM, direction=direction, backend='C')
+            assert_allclose(out, ref, rtol=1e-9, atol=1e-9,
+                            err_msg=f'-> {shape}, {direction}')
+            out = direct_transform(IM.astype(np.float32), direction=direction,
+                                   backend='C')
+            assert out.dtype == np.float32
+            assert_allclose(out, ref, rtol=1e-4, atol=1e-4 * abs(ref).max(),
+                            err_msg=f'-> {shape}, {direction}, float32')
+
+
+def test_direct_python_matrix():
+    """ Check that the matrix trapezoidal integration in the Python backend
+        is identical to the column-by-column integration """
+    rnd = np.random.RandomState(0)
+    g = rnd.uniform(size=(5, 30))
+    for r in [np.arange(30.), np.sort(rnd.uniform(0, 30, size=30))]:
+        for correction in [0, 1]:
+            out1 = direct._pyabel_direct_integral(g, r, correction, trapezoid)
+            out2 = direct._pyabel_direct_integral(
+                g, r, correction, lambda f, x: trapezoid(f, x))  # (looped)
+            assert_allclose(out1, out2, rtol=1e-12, atol=1e-12,
+                            err_msg=f'-> {correction=}')
+    direct.cache_cleanup()
+
+
+@pytest.mark.parametrize('backend', ['C', 'Python'])
+def test_direct_geometry_cache(backend):
+    """ Check that the cached integration geometry follows the grid """
+    f = np.exp(-np.arange(20.)**2 / 50)
+    r = np.arange(20.)**1.1  # non-uniform
+    for kwargs in [dict(), dict(dr=0.5), dict(r=r), dict(r=r[:-1] * 2)]:
+        x = f[:len(kwargs.get('r', f))]
+        direct.cache_cleanup()
+        ref = direct_transform(x, backend=backend, **kwargs)
+        direct_transform(f[:-2], r=r[1:-1], backend=backend)  # other grid
+        assert_allclose(direct_transform(x, backend=backend, **kwargs), ref,
+                        err_msg=f'-> {kwargs}')
+    direct.cache_cleanup()
+
+
 if __name__ == "__main__":
     test_direct_shape()
     test_direct_zeros()
@@ -153,3 +203,7 @@ if __name__ == "__main__":
     test_direct_preserve()
     test_direct_background()
     test_direct_c_python_correspondence()
+    test_direct_c_shapes_dtypes()
+    test_direct_python_matrix()
+    test_direct_geometry_cache('C')
+    test_direct_geometry_cache('Python')
@@ -1,7 +1,11 @@
+import warnings
+
 import numpy as np
 from numpy.testing import assert_allclose, assert_array_less
+import pytest
 
 import abel
+from abel import hansenlaw
 from abel.hansenlaw import hansenlaw_transform
 from abel.tools.analytical import GaussianAnalytical, SampleImage, \
                                   TransformPair
@@ -165,6 +169,59 @@ def test_hansenlaw_background():
     assert_allclose(recon9[:-2], 1, atol=4e-2)
 
 
+@pytest.mark.skipif(not hansenlaw.cython_ext,
+                    reason='abel.hansenlaw C extension not installed')
+def test_hansenlaw_c_python_correspondence():
+    """ Check that both the C and Python backends are identical """
+    rnd = np.random.RandomState(0)
+    IM = rnd.uniform(size=(5, 20))
+    for direction in ['forward', 'inverse']:
+        for hold_order in [0, 1]:
+            for background in [0, None]:
+                kwargs = dict(direction=direction, hold_order=hold_order,
+                              background=background)
+                out1 = hansenlaw_transform(IM, **kwargs, backend='Python')
+                out2 = hansenlaw_transform(IM, **kwargs, backend='C')
+                assert_allclose(out1, out2, rtol=1e-12, atol=1e-12,
+                                err_msg=f'-> {kwargs}')
+
+
+def test_hansenlaw_matrix():
+    """ Check that the matrix mode reproduces the recursion """
+    rnd = np.random.RandomState(0)
+    IM = rnd.uniform(size=(5, 20))
+    for direction in ['forward', 'inverse']:
+        for hold_order in [0, 1]:
+            for background in [0, None, 0.5]:
+                kwargs = dict(dr=0.5, direction=direction,
+                              hold_order=hold_order, background=background)
+                out1 = hansenlaw_transform(IM, **kwargs, backend='Python')
+                out2 = hansenlaw_transform(IM, **kwargs, backend='matrix')
+                assert_allclose(out1, out2, rtol=1e-10, atol=1e-10,
+                                err_msg=f'-> {kwargs}')
+    # 1D input
+    assert_allclose(hansenlaw_transform(IM[0], backend='matrix'),
+                    hansenlaw_transform(IM[0], backend='Python'),
+                    rtol=1e-10, atol=1e-10)
+    hansenlaw.cache_cleanup()
+
+
+def test_hansenlaw_backend_fallback():
+    """ Check that only an explicit C backend warns without the extension """
+    IM = np.ones((3, 10))
+    cython_ext = hansenlaw.cython_ext
+    hansenlaw.cython_ext = False
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            ref = hansenlaw_transform(IM)  # default: silent Python backend
+        with pytest.warns(RuntimeWarning, match='Cython extensions'):
+            out = hansenlaw_transform(IM, backend='C')
+    finally:
+        hansenlaw.cython_ext = cython_ext
+    assert_allclose(out, ref)
+
+
 if __name__ == "__main__":
     test_hansenlaw_shape()
     test_hansenlaw_zeros()
@@ -174,3 +231,6 @@ if __name__ == "__main__":
     test_hansenlaw_inverse_transform_curveA()
     test_hansenlaw_forward_dribinski_image()
     test_hansenlaw_background()
+    test_hansenlaw_c_python_correspondence()
+    test_hansenlaw_matrix()
+    test_hansenlaw_backend_fallback()
@@ -164,6 +164,95 @@ def test_linbasex_mean_beta():
     check(0.03, 0.03, radial_step=2, clip=10)
 
 
+def test_linbasex_projections():
+    """ Check projections for axis-aligned and arbitrary angles
+    """
+    n = 51
+    R = n // 2
+    y, x = np.indices((n, n)) - R
+    im = np.exp(-((x - 10)**2 + (y + 5)**2) / 8)
+    angles = [0, np.pi / 2, 0.955, 3 * np.pi / 4]
+    P = abel.linbasex._get_proj_cached(n, angles)
+    Q = P.dot(im.reshape(-1)).reshape((len(angles), n))
+    # plain sums
+    assert_allclose(Q[0], im.sum(axis=1), atol=1e-12)
+    assert_allclose(Q[1], im.sum(axis=0)[::-1], atol=1e-12)
+    # rotated: total intensity and centroid
+    k = np.arange(n) - R
+    for q, a in zip(Q[2:], angles[2:]):
+        assert_allclose(q.sum(), im.sum(), rtol=1e-2)
+        assert_allclose(q.dot(k) / q.sum(), -5 * np.cos(a) - 10 * np.sin(a),
+                        atol=1e-2)
+    abel.linbasex.cache_cleanup()
+
+
+def test_linbasex_beta_solve():
+    """ Check cached pseudo-inverse solution for one and several images
+    """
+    n = 21
+    pol = 2
+    Basis = abel.linbasex.get_bs_cached(n, proj_angles=[0, 0.955, np.pi/2],
+                                        legendre_orders=[0, 2])
+    bb = np.random.RandomState(0).uniform(size=(3, Basis.shape[0]))
+    for rcond in [0.0005, 0.1, 0]:
+        ref = [np.linalg.lstsq(Basis, b, rcond)[0].reshape((pol, -1))
+               for b in bb]
+        for b, r in zip(bb, ref):
+            assert_allclose(abel.linbasex._beta_solve(Basis, b, pol, rcond), r,
+                            err_msg=f'{rcond=}')
+        assert_allclose(abel.linbasex._beta_solve(Basis, bb, pol, rcond), ref,
+                        err_msg=f'{rcond=}, stack')
+    abel.linbasex.cache_cleanup()
+
+
+def test_linbasex_stack():
+    """ Check transform of a stack of images against transforms of each image
+    """
+    n = 41
+    im = abel.tools.analytical.SampleImage(n=n).func
+    rnd = np.random.RandomState(0)
+    ims = im + rnd.uniform(size=(3, n, n))
+    kwargs = dict(proj_angles=[0, np.pi/4, np.pi/2],
+                  legendre_orders=[0, 1, 2], smoothing=1)
+    recon, radial, beta, proj = linbasex_transform_full(ims, **kwargs)
+    assert recon.shape == ims.shape
+    for i, frame in enumerate(ims):
+        ref = linbasex_transform_full(frame, **kwargs)
+        for name, res, r in zip(['recon', 'radial', 'beta', 'proj'],
+                                [recon[i], radial, beta[i], proj[i]], ref):
+            assert_allclose(res, r, atol=1e-10, err_msg=f'-> {name}, {i}')
+    # list of frames, lazy images
+    lazy, _, beta_, _ = linbasex_transform_full(list(ims), lazy=True,
+                                                **kwargs)
+    assert_allclose(beta_, beta)
+    for i in range(len(ims)):
+        assert_allclose(np.asarray(lazy[i]), recon[i], atol=1e-10)
+    abel.linbasex.cache_cleanup()
+
+
+def test_linbasex_lazy():
+    """ Check lazy and omitted image synthesis
+    """
+    n = 41
+    im = abel.tools.analytical.SampleImage(n=n).func
+    kwargs = dict(legendre_orders=[0, 1, 2], smoothing=1)
+    recon, radial, beta, proj = linbasex_transform_full(im, **kwargs)
+    # lazy
+    lazy, radial_, beta_, proj_ = linbasex_transform_full(im, lazy=True,
+                                                          **kwargs)
+    assert_allclose(beta_, beta)
+    assert_allclose(lazy[5], recon[5])
+    assert_allclose(lazy[:, 30], recon[:, 30])
+    assert_allclose(lazy[3:10, 20:35], recon[3:10, 20:35])
+    assert_allclose(np.asarray(lazy), recon)
+    # no image
+    none, radial_, beta_, proj_ = linbasex_transform_full(im, image=False,
+                                                          **kwargs)
+    assert none is None
+    assert_allclose(beta_, beta)
+    abel.linbasex.cache_cleanup()
+
+
 if __name__ == "__main__":
     test_linbasex_shape()
     test_linbasex_shape_radial_step()
@@ -172,3 +261,7 @@ if __name__ == "__main__":
     test_linbasex_forward_dribinski_image()
     test_linbasex_odd_sign()
     test_linbasex_mean_beta()
+    test_linbasex_projections()
+    test_linbasex_beta_solve()
+    test_linbasex_stack()
+    test_linbasex_lazy()
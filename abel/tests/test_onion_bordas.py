@@ -37,6 +37,36 @@ def test_onion_bordas_zeros():
     assert_allclose(recon, 0)
 
 
+def test_onion_bordas_peeling():
+    """Check matrix implementation against explicit onion peeling"""
+    rnd = np.random.RandomState(0)
+    for w in [1, 2, 3, 20]:
+        IM = rnd.randn(5, w)
+
+        # peel from the outside, as in the original Bordas algorithm
+        ref = np.zeros_like(IM)
+        rest = IM.copy()
+        for k in range(w - 1, 0, -1):
+            norm = np.arcsin(1) - np.arcsin(k / (k + 1))  # diagonal
+            s = rest[:, k] / norm
+            ref[:, k] = s / (k + 1)
+            for i in range(k):
+                rest[:, i] -= s * (np.arcsin((i + 1) / (k + 1)) -
+                                   np.arcsin(i / (k + 1)))
+        if w > 1:
+            ref[:, 0] = ref[:, 1]
+
+        abel.onion_bordas.cache_cleanup()
+        recon = abel.onion_bordas.onion_bordas_transform(IM, shift_grid=False)
+        assert_allclose(recon, ref / 2, atol=1e-12, err_msg=f'-> {w=}')
+        # cached
+        M = abel.onion_bordas.get_bs_cached(w)
+        assert abel.onion_bordas.get_bs_cached(w) is M
+        recon = abel.onion_bordas.onion_bordas_transform(IM, shift_grid=False)
+        assert_allclose(recon, ref / 2, atol=1e-12,
+                        err_msg=f'-> {w=}, cached')
+
+
 def test_onion_bordas_inverse_transform_gaussian():
     """Check onion_bordas inverse transform with a Gaussian function"""
     n = 501   
@@ -126,6 +156,7 @@ def test_onion_bordas_2d_gaussian(n=100):
 if __name__ == "__main__":
     test_onion_bordas_shape()
     test_onion_bordas_zeros()
+    test_onion_bordas_peeling()
     test_onion_bordas_1d_gaussian()
     test_onion_bordas_inverse_transform_gaussian()
     test_onion_bordas_inverse_transform_curveA()
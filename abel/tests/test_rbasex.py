@@ -4,7 +4,9 @@ import numpy as np
 from numpy.testing import assert_allclose, assert_array_less
 
 from abel.rbasex import rbasex_transform, cache_cleanup
+from abel.rbasex import rbasex_transform_events
 from abel.rbasex import get_bs_cached, cache_cleanup
+import abel.rbasex
 from abel.tools.analytical import GaussianAnalytical
 from abel.hansenlaw import hansenlaw_transform
 from abel import Transform
@@ -304,6 +306,156 @@ def test_rbasex_out_odd():
     run_out(odd=True)
 
 
+def run_lazy(odd=False):
+    """
+    Test lazy output images against regular output images.
+    """
+    rmax = 30
+    # asymmetric image with off-center origin
+    IM = np.random.RandomState(0).rand(2 * rmax + 5, 2 * rmax - 3)
+    origin = (rmax + 3, rmax - 4)
+
+    for out in ['same', 'fold', 'unfold', 'full', 'full-unique']:
+        param = f'-> {odd=}, {out=}, '
+        ref, _ = rbasex_transform(IM, origin=origin, odd=odd, out=out)
+        lazy, _ = rbasex_transform(IM, origin=origin, odd=odd, out=out,
+                                   lazy=True)
+        assert lazy.shape == ref.shape, param + 'shape'
+        # parts
+        assert_allclose(lazy[3], ref[3], err_msg=param + 'row')
+        assert_allclose(lazy[:, -2], ref[:, -2], err_msg=param + 'column')
+        assert_allclose(lazy[5:-5:2, 3:], ref[5:-5:2, 3:],
+                        err_msg=param + 'region')
+        assert_allclose(lazy[-1, 0], ref[-1, 0], err_msg=param + 'pixel')
+        # whole image
+        assert_allclose(np.asarray(lazy), ref, err_msg=param + 'image')
+
+
+def test_rbasex_lazy():
+    run_lazy()
+
+
+def test_rbasex_lazy_odd():
+    run_lazy(odd=True)
+
+
+def test_rbasex_cfg_cache():
+    """
+    Test switching between cached configurations.
+    """
+    IM = np.random.RandomState(0).rand(51, 61)
+    weights = np.ones_like(IM)
+    weights[:10] = 0
+    cfgs = [dict(),
+            dict(origin=(20, 30), rmax=15),
+            dict(origin=(30, 25), order=4, weights=weights)]
+
+    # reference results from clean caches
+    ref = []
+    for cfg in cfgs:
+        cache_cleanup()
+        ref.append(rbasex_transform(IM, **cfg)[0])
+
+    cache_cleanup()
+    dst = []
+    for i in range(2):
+        for j, (cfg, r) in enumerate(zip(cfgs, ref)):
+            recon, _ = rbasex_transform(IM, **cfg)
+            assert_allclose(recon, r)
+            if i == 0:
+                dst.append(abel.rbasex._dst)
+            else:  # must be reused
+                assert abel.rbasex._dst is dst[j]
+
+    # modified weights (same array) must not be reused
+    weights[:20] = 0
+    recon, _ = rbasex_transform(IM, **cfgs[2])
+    assert abel.rbasex._dst is not dst[2]
+    cache_cleanup()
+    assert_allclose(recon, rbasex_transform(IM, **cfgs[2])[0])
+
+    cache_cleanup()
+
+
+def test_rbasex_low_memory():
+    """
+    Test low-memory inverse transform against the default.
+    """
+    IM = np.random.RandomState(0).rand(51, 61)
+    # zero weights for some radii (making them invalid)
+    row, col = np.indices(IM.shape)
+    r = np.sqrt((row - 25)**2 + (col - 30)**2)
+    weights = 1.0 - ((5 < r) & (r < 9))
+    for order, odd in [(0, False), (2, False), (3, True), (4, False)]:
+        param = f'-> {order=}, {odd=}'
+        for w in [None, weights]:
+            ref, ref_distr = rbasex_transform(IM, origin=(25, 30),
+                                              order=order, odd=odd, weights=w)
+            recon, distr = rbasex_transform(IM, origin=(25, 30),
+                                            order=order, odd=odd, weights=w,
+                                            low_memory=True)
+            assert_allclose(recon, ref, atol=1e-10, err_msg=param)
+            assert_allclose(distr.cos(), ref_distr.cos(), atol=1e-10,
+                            err_msg=param)
+            assert abel.rbasex._tri_full is None
+        assert not distr.valid.all()
+
+
+def test_rbasex_var():
+    """
+    Test variance propagation against explicit linear transform.
+    """
+    rng = np.random.RandomState(0)
+    h, w = 13, 15
+    IM = rng.rand(h, w)
+    var = rng.rand(h, w)
+    weights = rng.rand(h, w)
+    for param in [dict(),
+                  dict(order=3),
+                  dict(order=4, direction='forward'),
+                  dict(reg=('L2', 1), out='unfold'),
+                  dict(weights=weights, out='full'),
+                  dict(odd=True, out='fold', lazy=True)]:
+        recon, distr, recon_var = rbasex_transform(IM, origin=(5, 8),
+                                                   var=var, **param)
+        # Jacobians for image and cos^n distributions from unit images
+        J, Jc = [], []
+        for i in range(h * w):
+            E = np.zeros(h * w)
+            E[i] = 1
+            r, d = rbasex_transform(E.reshape(h, w), origin=(5, 8), **param)
+            J.append(np.asarray(r).ravel())
+            Jc.append(d.cn.ravel())
+        J = np.array(J).T
+        Jc = np.array(Jc).T
+        N, R = distr.cn.shape
+        cov = ((Jc * var.ravel()).dot(Jc.T)).reshape(N, R, N, R)
+        cov = np.array([cov[:, r, :, r] for r in range(R)])
+        assert_allclose(distr.cov, cov, atol=1e-12, err_msg=f'-> {param}')
+        assert_allclose(np.asarray(recon_var).ravel(), (J**2).dot(var.ravel()),
+                        atol=1e-12, err_msg=f'-> {param}')
+
+
+def test_rbasex_events():
+    """
+    Test events at pixel centers against the image.
+    """
+    IM = np.random.RandomState(0).rand(51, 61)
+    row, col = np.indices(IM.shape)
+    events = (col.ravel(), row.ravel(), IM.ravel())
+    for odd in [False, True]:
+        for direction in ['forward', 'inverse']:
+            param = f'-> {odd=}, {direction=}'
+            ref, ref_distr = rbasex_transform(IM, origin=(20, 30), odd=odd,
+                                              direction=direction)
+            recon, distr = rbasex_transform_events(*events, shape=IM.shape,
+                                                   origin=(20, 30), odd=odd,
+                                                   direction=direction)
+            assert_allclose(recon, ref, atol=1e-10, err_msg=param)
+            assert_allclose(distr.cos(), ref_distr.cos(), atol=1e-10,
+                            err_msg=param)
+
+
 def get_basis_file_name(rmax, order, odd, inv):
     o = 'o' if odd else ''
     i = 'i' if inv else ''
@@ -410,6 +562,12 @@ if __name__ == '__main__':
     test_rbasex_pos()
     test_rbasex_out()
     test_rbasex_out_odd()
+    test_rbasex_lazy()
+    test_rbasex_lazy_odd()
+    test_rbasex_cfg_cache()
+    test_rbasex_low_memory()
+    test_rbasex_var()
+    test_rbasex_events()
     test_rbasex_bs_cache()
     test_rbasex_bs_crop_rmax()
     test_rbasex_bs_crop_order()
@@ -5,7 +5,8 @@ from numpy.testing import assert_equal, assert_allclose
 from scipy.ndimage import shift
 
 import abel
-from abel.tools.center import find_origin, center_image, set_center
+from abel.tools.center import find_origin, center_image, set_center, \
+                              find_origins, center_images, set_centers
 
 
 def test_find_origin():
@@ -26,12 +27,77 @@ def test_find_origin():
                 origin = find_origin(data, method, axes)
                 ref = (row if 0 in axes else rows // 2,
                        col if 1 in axes else cols // 2)
-                tol = 0.2  # 'convolution' rounds to 0.5 pixels
+                tol = 0.1
                 assert_allclose(origin, ref, atol=tol, verbose=False,
                                 err_msg=f'-> {rows} x {cols}, {method=},'
                                         f' {axes=}: {origin=} not equal {ref}')
 
 
+def test_find_origin_subpixel():
+    """
+    Test sub-pixel precision of FFT-based find_origin methods.
+    """
+    IM = abel.tools.analytical.SampleImage(n=201, name='dribinski').func
+    for d in [(0.3, -0.6), (-4.25, 2.75), (10.4, 20.8)]:
+        IMx = shift(IM, d)
+        ref = (100 + d[0], 100 + d[1])
+        for method in ['convolution', 'slice']:
+            origin = find_origin(IMx, method)
+            assert_allclose(origin, ref, atol=0.05,
+                            err_msg=f'-> {d=}, {method=}')
+
+
+def test_find_origins():
+    """
+    Test vectorized find_origins() against find_origin() for each image.
+    """
+    IM = abel.tools.analytical.SampleImage(n=101, name='dribinski').func
+    rnd = np.random.RandomState(0)
+    IMs = np.array([shift(IM, d) for d in rnd.uniform(-3, 3, size=(5, 2))])
+    for method in ['image_center', 'com', 'convolution', 'slice', 'gaussian']:
+        for axes in [0, 1, (0, 1)]:
+            origins = find_origins(IMs, method, axes)
+            ref = [find_origin(IM, method, axes) for IM in IMs]
+            assert_allclose(origins, ref, rtol=1e-12,
+                            err_msg=f'-> {method=}, {axes=}')
+    # rounding
+    for method in ['com', 'gaussian']:
+        origins = find_origins(IMs, method, round_output=True)
+        ref = [find_origin(IM, method, round_output=True) for IM in IMs]
+        assert_equal(origins, ref, err_msg=f'-> {method=}')
+        assert np.issubdtype(origins.dtype, np.integer), method
+
+
+def test_set_centers():
+    """
+    Test batch set_centers() and center_images() against set_center().
+    """
+    rnd = np.random.RandomState(0)
+    data = rnd.uniform(size=(4, 12, 15))
+    origins = rnd.uniform(3, 10, size=(4, 2))
+    origins[1] = (-5.5, -7.25)  # negative coordinates
+    origins[2] = (6, 8)  # whole pixels
+    for order in [0, 1, 3]:
+        for axes in [0, 1, (0, 1)]:
+            result = set_centers(data, origins, axes=axes, order=order)
+            ref = [set_center(IM, origin, axes=axes, order=order)
+                   for IM, origin in zip(data, origins)]
+            assert_allclose(result, ref, atol=1e-12,
+                            err_msg=f'-> {order=}, {axes=}')
+    # integer data
+    IMs = (100 * data).astype(int)
+    for order in [0, 1]:
+        result = set_centers(IMs, origins, order=order)
+        assert_equal(result.dtype, IMs.dtype)
+        assert_equal(result, [set_center(IM, origin, order=order)
+                              for IM, origin in zip(IMs, origins)],
+                     err_msg=f'-> int, {order=}')
+    # find origins and center
+    result = center_images(data, 'com')
+    ref = [center_image(IM, 'com', order=1) for IM in data]
+    assert_allclose(result, ref, atol=1e-12)
+
+
 def test_set_center_int():
     """
     Test whole-pixel shifts.
@@ -288,6 +354,9 @@ def test_center_image():
 
 if __name__ == "__main__":
     test_find_origin()
+    test_find_origin_subpixel()
+    test_find_origins()
+    test_set_centers()
     test_set_center_axes()
     test_set_center_int()
     test_set_center_float()
@@ -1,8 +1,13 @@
+import os
+import tempfile
+
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
+from scipy.ndimage import map_coordinates
 
 import abel
-from abel.tools.circularize import circularize, circularize_image
+from abel.tools.circularize import circularize, circularize_image, \
+                                   DistortionMap
 
 
 def test_circularize_image():
@@ -31,5 +36,60 @@ def test_circularize_image():
     assert_allclose(scalefactor[4], 0.97, atol=0.05)
 
 
+def test_circularize_xcorr():
+    """ Check "xcorr" radial correction factors for a noisy image """
+    IM = abel.tools.analytical.SampleImage(n=301, name='Ominus').func
+
+    def flower_scaling(theta, freq=2, amp=0.2):
+        return 1 + amp * np.sin(freq * theta)**4
+
+    IMdist = circularize(IM, radial_correction_function=flower_scaling)
+    IMdist += 0.05 * IM.max() * np.random.RandomState(0).normal(size=IM.shape)
+
+    IMcirc, angle, scalefactor, spline = \
+        circularize_image(IMdist, method='xcorr', dr=0.5, dt=0.05,
+                          return_correction=True)
+
+    assert_allclose(scalefactor,
+                    flower_scaling(angle[0]) / flower_scaling(angle),
+                    atol=5e-3)
+
+
+def test_distortion_map():
+    """ Check DistortionMap for image stacks, interpolation orders and I/O """
+    rnd = np.random.RandomState(0)
+    IMs = rnd.uniform(size=(3, 25, 30))
+
+    def flower_scaling(theta, freq=2, amp=0.1):
+        return 1 + amp * np.sin(freq * theta)**4
+
+    for order in [0, 1, 3]:
+        dmap = DistortionMap(IMs.shape[1:], flower_scaling, ref_angle=0.5,
+                             order=order)
+        Y, X = np.indices(dmap.shape) - np.array([12, 15])[:, None, None]
+        coords = [12 + Y * dmap.scale, 15 + X * dmap.scale]
+        IMcircs = dmap(IMs)
+        for IM, IMcirc in zip(IMs, IMcircs):
+            assert_allclose(IMcirc, map_coordinates(IM, coords, order=order),
+                            atol=1e-12, err_msg=f'-> order = {order}')
+            if order == 3:
+                assert_allclose(IMcirc, circularize(IM, flower_scaling, 0.5))
+        # floating-point dtypes are preserved, integers give floats
+        assert_equal(dmap(IMs.astype(np.float32)).dtype, np.float32)
+        assert_equal(dmap((100 * IMs).astype(np.int32)).dtype, float)
+
+    # determined from image, saved and loaded
+    dmap = DistortionMap.from_image(IMs[0], dt=0.5, order=1)
+    fname = os.path.join(tempfile.gettempdir(), 'test_distortion_map.npz')
+    dmap.save(fname)
+    loaded = DistortionMap.load(fname)
+    os.remove(fname)
+    assert_equal(loaded.order, 1)
+    assert_allclose(loaded.radial_correction, dmap.radial_correction)
+    assert_allclose(loaded(IMs), dmap(IMs))
+
+
 if __name__ == "__main__":
     test_circularize_image()
+    test_circularize_xcorr()
+    test_distortion_map()
@@ -578,6 +578,78 @@ def test_remap_random():
     #  odd vertical flip and "parts" differ)
 
 
+def test_events():
+    """
+    Test events at pixel centers against the image, and sub-pixel events
+    against a smooth distribution.
+    """
+    rng = np.random.RandomState(0)
+    m, n = 41, 51
+    IM = rng.rand(m, n)
+    weights = rng.rand(m, n)
+    row, col = np.indices(IM.shape)
+    for method, odd, origin in itertools.product(['nearest', 'linear'],
+                                                 [False, True],
+                                                 ['cc', (10, 30), 'cl']):
+        param = f'-> {method=}, {odd=}, {origin=}'
+        distr = Distributions(origin, order=4, odd=odd, weights=weights,
+                              method=method)
+        assert_allclose(distr.events(col.ravel(), row.ravel(),
+                                     IM.ravel()).cos(),
+                        distr(IM).cos(), atol=1e-12, err_msg=param)
+
+    # uniform isotropic distribution (all events within rmax)
+    rmax = 20
+    N = 100000
+    r = rmax * np.sqrt(rng.rand(N))
+    phi = 2 * np.pi * rng.rand(N)
+    x = rmax + r * np.cos(phi)
+    y = rmax + r * np.sin(phi)
+    distr = Distributions(order=2, method='linear')
+    P0, P2 = distr.events(x, y, shape=(2 * rmax + 1, 2 * rmax + 1)).harmonics()
+    P0ref = N / (np.pi * rmax**2)
+    assert_allclose(P0[3:-1], P0ref, rtol=0.1)
+    assert_allclose(P2[3:-1], 0, atol=0.1 * P0ref)
+
+
+def test_var():
+    """
+    Test variance propagation against explicit linear analysis.
+    """
+    rng = np.random.RandomState(0)
+    m, n = 15, 17
+    IM = rng.rand(m, n)
+    var = rng.rand(m, n)
+    weights = rng.rand(m, n)
+    for method, odd, order in itertools.product(['nearest', 'linear'],
+                                                [False, True], [2, 4]):
+        param = f'-> {method=}, {odd=}, {order=}'
+        distr = Distributions((6, 9), order=order, odd=odd, weights=weights,
+                              method=method)
+        res = distr(IM, var)
+        # Jacobian from unit images
+        J = []
+        for i in range(m * n):
+            E = np.zeros(m * n)
+            E[i] = 1
+            J.append(distr(E.reshape(m, n)).harmonics().ravel())
+        J = np.array(J).T
+        assert_allclose(res.harmonics_var().ravel(), (J**2).dot(var.ravel()),
+                        atol=1e-12, err_msg=param)
+        # first-order error propagation for Ibeta
+        I, *beta = res.Ibeta()
+        varI, *varbeta = res.Ibeta_var()
+        assert_allclose(varI, (4 * np.pi * res.r**2)**2 *
+                              res.harmonics_var()[0], err_msg=param)
+        P0 = res.harmonics()[0]
+        J = J.reshape(-1, len(P0), m * n)
+        for b, varb, Jn in zip(beta, varbeta, J[1:]):
+            # d beta = (d Pn - beta d P0) / P0
+            Jb = (Jn - b[:, None] * J[0]) / P0[:, None]
+            assert_allclose(varb, (Jb**2).dot(var.ravel()), rtol=1e-10,
+                            err_msg=param)
+
+
 if __name__ == '__main__':
     test_origin()
 
@@ -598,3 +670,6 @@ if __name__ == '__main__':
     test_remap()
     test_remap_odd()
     test_remap_random()
+
+    test_events()
+    test_var()
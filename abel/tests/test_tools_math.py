@@ -1,7 +1,8 @@
 from warnings import catch_warnings, simplefilter
 import numpy as np
 from numpy.testing import assert_allclose
-from abel.tools.math import gradient, trapezoid
+from scipy.optimize import nnls as scipy_nnls
+from abel.tools.math import gradient, trapezoid, nnls
 
 
 def test_gradient():
@@ -29,3 +30,26 @@ def test_trapezoid():
             out = trapezoid(f, x)
             ref = nptrapezoid(f, x)
             assert_allclose(out, ref, err_msg=f'-> {rows=}, {cols=}')
+
+
+def test_nnls():
+    rnd = np.random.RandomState(0)
+    n = 30
+    # triangular (like Abel transform) and general matrices, with zero column
+    for A in [np.triu(rnd.uniform(size=(n, n))) + np.eye(n),
+              rnd.randn(n + 10, n)]:
+        A[:, 3] = 0
+        B = rnd.randn(20, A.shape[0])
+        ref = np.array([scipy_nnls(A, b)[0] for b in B])
+        assert_allclose(nnls(A, B), ref, atol=1e-6)
+        # single row
+        assert_allclose(nnls(A, B[0]), ref[0], atol=1e-6)
+        # initial guesses: exact, shifted
+        assert_allclose(nnls(A, B, ref), ref, atol=1e-6)
+        assert_allclose(nnls(A, B, ref + 1), ref, atol=1e-6)
+    # not converged
+    with catch_warnings(record=True) as w:
+        simplefilter('always')
+        nnls(A, B, maxiter=2)
+    assert len(w) == 1 and issubclass(w[0].category, RuntimeWarning)
+    assert '20 of 20 rows' in str(w[0].message)
@@ -0,0 +1,48 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.ndimage import map_coordinates
+
+from abel.tools import polar
+
+
+def test_reproject_image_into_polar():
+    """ Check the cached reprojection against direct interpolation """
+    rnd = np.random.RandomState(0)
+    IM = rnd.uniform(size=(30, 41))
+    origin = (12.5, 25)
+    polarIM, R, T = polar.reproject_image_into_polar(IM, origin, dr=0.5,
+                                                     Jacobian=True)
+    X, Y = polar.polar2cart(R, T)
+    coords = np.array([origin[0] - Y, X + origin[1]])
+    assert_allclose(polarIM, map_coordinates(IM, coords) * R)
+    # cached grids must not be affected
+    R *= 2
+    polarIM2, R2, T2 = polar.reproject_image_into_polar(IM, origin, dr=0.5,
+                                                        Jacobian=True)
+    assert_allclose(R2, R / 2)
+    assert_allclose(polarIM2, polarIM)
+    polar.cache_cleanup()
+
+
+def test_polar_reprojector():
+    """ Check sparse reprojection (orders 0, 1) and stacks of images """
+    rnd = np.random.RandomState(0)
+    IMs = rnd.uniform(size=(3, 25, 20))
+    for origin in [None, (10.3, 5.6), (-3, -4)]:
+        for order in [0, 1, 3]:
+            reproject = polar.PolarReprojector(IMs.shape[1:], origin, dr=0.7,
+                                               dt=0.1, order=order)
+            X, Y = polar.polar2cart(reproject.r_grid, reproject.theta_grid)
+            row, col = np.array(origin or (12, 10)) % IMs.shape[1:]
+            coords = np.array([row - Y, X + col])
+            polarIMs = reproject(IMs)
+            for IM, polarIM in zip(IMs, polarIMs):
+                assert_allclose(reproject(IM), polarIM)
+                assert_allclose(polarIM, map_coordinates(IM, coords,
+                                                         order=order),
+                                atol=1e-12, err_msg=f'-> {origin}, {order}')
+
+
+if __name__ == "__main__":
+    test_reproject_image_into_polar()
+    test_polar_reprojector()
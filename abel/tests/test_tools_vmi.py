@@ -82,6 +82,20 @@ def test_radial_intensity():
     check('cos2', avg, 0.01, 'avg3D', cos2 * 3)
     check('sin2', avg, 0.01, 'avg3D', sin2 * 3/2)
 
+    # radial binning
+    for kind, ref in [('int2D', int2D), ('int3D', int3D),
+                      ('avg2D', avg), ('avg3D', avg)]:
+        k = 3 if kind.endswith('3D') else 2
+        check('ones', ref, 1e-12, kind, ones, method='bin')
+        check('ones', ref, 1e-12, kind, ones, dr=0.5, method='bin')
+        check('cos2', ref, 0.05, kind, cos2 * k, method='bin')
+        check('sin2', ref, 0.05, kind, sin2 * k / (k - 1), method='bin')
+        # same grid and similar results as for 'remap'
+        r, remap = vmi.radial_intensity(kind, cos2 * k)
+        r_, binned = vmi.radial_intensity(kind, cos2 * k, method='bin')
+        assert_allclose(r_, r)
+        assert_allclose(binned[2:R], remap[2:R], rtol=0.05)
+
 
 def test_anisotropy_parameter():
     """
@@ -141,6 +155,27 @@ def test_radial_integration():
                     err_msg='Amplitude')
 
 
+def test_radial_integration_linear_fit():
+    """
+    Check vectorized fitting against individual anisotropy fits.
+    """
+    IM = SampleImage(n=201, name='dribinski').func
+    IM += 0.01 * np.random.RandomState(0).normal(size=IM.shape)
+    ranges = [(20, 30), (30, 40), (35, 45), (60, 65)]
+    for theta_ranges in [None, [(-1, 1)]]:
+        for mode in ['raw', 'reject', 'bound']:
+            Beta, Amp, _, Intensity, theta = \
+                vmi.radial_integration(IM, radial_ranges=ranges,
+                                       theta_ranges=theta_ranges, mode=mode)
+            for beta, amp, intensity in zip(Beta, Amp, Intensity):
+                bref, aref = vmi.anisotropy_parameter(theta, intensity,
+                                                      theta_ranges, mode)
+                err_msg = f'-> {theta_ranges}, {mode}'
+                assert_allclose(beta, bref, rtol=1e-4, atol=1e-6,
+                                err_msg=err_msg)
+                assert_allclose(amp, aref, rtol=1e-4, err_msg=err_msg)
+
+
 def test_toPES():
     """
     Basic test of toPES conversion.
@@ -165,4 +200,5 @@ if __name__ == "__main__":
     test_average_radial_intensity()
     test_anisotropy_parameter()
     test_radial_integration()
+    test_radial_integration_linear_fit()
     test_toPES()
@@ -1,8 +1,8 @@
 import numpy as np
 from .math import fit_gaussian
 import warnings
+from scipy import fft
 from scipy.ndimage import center_of_mass, shift
-from scipy.optimize import minimize
 
 
 def find_origin(IM, method='image_center', axes=(0, 1), verbose=False,
@@ -326,6 +326,181 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
         raise ValueError(f'Invalid crop option "{crop}".')
 
 
+def find_origins(IMs, method='image_center', axes=(0, 1), **kwargs):
+    """
+    Find the origins of all images in a stack, using the specified method.
+
+    The methods ``image_center``, ``com``, ``convolution`` and ``slice`` are
+    vectorized (processing all images at once); other methods are applied to
+    each image by :func:`find_origin`.
+
+    Parameters
+    ----------
+    IMs : 3D np.array
+        stack of images (indexed by the first dimension)
+
+    method : str
+        determines how the origins should be found, see :func:`find_origin`
+
+    axes : int or tuple of int
+        find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
+        ``(0, 1)`` (both vertical and horizontal).
+
+    Returns
+    -------
+    origins : 2D np.array
+        (row, column) coordinates of the origin of each image.
+        For coordinates not in **axes**, the centers of the images are
+        returned.
+    """
+    IMs = np.asarray(IMs)
+    if IMs.ndim != 3:
+        raise ValueError('IMs must be a 3D array (stack of images)')
+    if method in stack_func_method:
+        return stack_func_method[method](IMs, axes, **kwargs)
+    return np.array([find_origin(IM, method, axes, **kwargs) for IM in IMs])
+
+
+def center_images(IMs, method='com', odd_size=True, axes=(0, 1), order=1,
+                  **kwargs):
+    """
+    Center all images in a stack, as :func:`center_image` with
+    ``crop='maintain_size'``, but processing all images at once.
+
+    Parameters
+    ----------
+    IMs : 3D np.array
+        stack of images (indexed by the first dimension)
+
+    method : str or array
+        either an array of (row, column) coordinates of the origins of all
+        images (or a single (row, column) tuple for all images), or a string to
+        specify an automatic centering method, see :func:`find_origins`
+
+    odd_size : boolean
+        if ``True``, the returned images will contain an odd number of
+        columns.
+
+    axes : int or tuple of int
+        center images with respect to axis ``0`` (vertical), ``1``
+        (horizontal), or both axes ``(0, 1)`` (default).
+
+    order : int
+        interpolation order, see :func:`set_centers` for details.
+
+    Returns
+    -------
+    out : 3D np.array
+        stack of centered images
+    """
+    IMs = np.asarray(IMs)
+    if odd_size and IMs.shape[2] % 2 == 0:
+        # drop rightside column
+        IMs = IMs[:, :, :-1]
+
+    if isinstance(method, str):
+        origins = find_origins(IMs, method, axes, **kwargs)
+    else:
+        origins = method
+
+    return set_centers(IMs, origins, axes, order)
+
+
+def set_centers(data, origins, axes=(0, 1), order=1):
+    """
+    Move the origins of all images in a stack to their mid-points (``rows //
+    2, cols // 2``), as :func:`set_center` with ``crop='maintain_size'``.
+
+    For **order** = 0 and 1, the images are shifted by whole pixels or with
+    bilinear interpolation, computed as weighted sums of whole-pixel shifts,
+    without padding copies and spline prefiltering. Higher orders use
+    :func:`set_center` for each image.
+
+    Parameters
+    ----------
+    data : 3D np.array
+        stack of images (indexed by the first dimension)
+
+    origins : 2D np.array or tuple of float
+        (row, column) coordinates of the origins of all images (or of all
+        images at once)
+
+    axes : int or tuple of int
+        center images with respect to axis ``0`` (vertical), ``1``
+        (horizontal), or both axes ``(0, 1)`` (default).
+
+    order : int
+        interpolation order (0–5). The default is 1 (linear), unlike in
+        :func:`set_center`, since it is much faster.
+
+    Returns
+    -------
+    out : 3D np.array
+        stack of centered images, with the same data type as the input (for
+        integer types, interpolated values are rounded as in
+        :func:`set_center`)
+    """
+    data = np.asarray(data)
+    if data.ndim != 3:
+        raise ValueError('data must be a 3D array (stack of images)')
+    shape = np.array(data.shape[1:])
+    origins = np.broadcast_to(np.asarray(origins, dtype=float),
+                              (len(data), 2)).copy()
+    if isinstance(axes, int):
+        axes = [axes]
+
+    if order > 1:
+        return np.array([set_center(IM, origin, axes=axes, order=order)
+                         for IM, origin in zip(data, origins)])
+
+    # to absolute coordinates
+    origins = np.where(origins < 0, origins + shape, origins)
+    if order == 0:
+        # round to whole pixels
+        origins = np.round(origins)
+    # interpolate integer data as floats, then round (as scipy.ndimage does)
+    dtype = data.dtype if np.issubdtype(data.dtype, np.inexact) or \
+        order == 0 else float
+
+    # shifts split into integer and fractional parts
+    delta = np.zeros_like(origins)
+    for a in axes:
+        delta[:, a] = shape[a] // 2 - origins[:, a]
+    whole = np.floor(delta).astype(int)
+    frac = delta - whole
+
+    # bilinear interpolation as a sum of 4 weighted whole-pixel shifts
+    out = np.zeros(data.shape, dtype=dtype)
+    for IM, IMout, (sr, sc), (fr, fc) in zip(data, out, whole, frac):
+        for dr, wr in [(0, 1 - fr), (1, fr)]:
+            for dc, wc in [(0, 1 - fc), (1, fc)]:
+                if wr * wc:
+                    _add_shifted(IMout, IM, sr + dr, sc + dc, wr * wc)
+    if dtype != data.dtype:
+        # round half away from zero
+        out = np.trunc(out + np.copysign(0.5, out)).astype(data.dtype)
+    return out
+
+
+def _add_shifted(out, IM, rows, cols, weight):
+    """
+    Internal function.
+
+    Adds the image **IM**, multiplied by **weight** and shifted by whole
+    **rows** and **cols**, to the image **out** (in place, with parts shifted
+    beyond the edges discarded).
+    """
+    n, m = IM.shape
+    if abs(rows) >= n or abs(cols) >= m:
+        return
+    dst = out[max(rows, 0):n + min(rows, 0), max(cols, 0):m + min(cols, 0)]
+    src = IM[max(-rows, 0):n + min(-rows, 0), max(-cols, 0):m + min(-cols, 0)]
+    if weight == 1:  # (exact whole-pixel shift, also for integer types)
+        dst += src
+    else:
+        dst += weight * src
+
+
 def find_origin_by_center_of_mass(IM, axes=(0, 1), verbose=False,
                                   round_output=False, **kwargs):
     """
@@ -377,7 +552,9 @@ def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
     Find the image origin as the maximum of autoconvolution of its projections
     along each axis.
 
-    Code from the ``linbasex`` juptyer notebook.
+    Code from the ``linbasex`` juptyer notebook. The autoconvolutions are
+    computed by FFT (for both axes at once), and their maxima are located with
+    sub-pixel precision by parabolic interpolation.
 
     Parameters
     ----------
@@ -399,24 +576,50 @@ def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
 
         `or` (row, column), conv_0, conv_1
     """
+    origins, conv = _origins_by_convolution(IM[np.newaxis], axes,
+                                            projections=True)
+    origin = tuple(origins[0])
+
+    if projections:
+        return origin, *(None if c is None else c[0] for c in conv)
+    else:
+        return origin
+
+
+def _origins_by_convolution(IMs, axes=(0, 1), projections=False, **kwargs):
+    """
+    Internal function.
+
+    Vectorized :func:`find_origin_by_convolution` for a stack of images.
+
+    Returns
+    -------
+    origins : numpy 2D array
+        (row, column) origins of all images
+    conv : list of 2 numpy 2D arrays or None
+        autoconvolutions of the projections along each axis for all images
+        (returned only if **projections** is ``True``)
+    """
     if isinstance(axes, int):
         axes = [axes]
 
     conv = [None, None]
-    origin = [IM.shape[0] // 2, IM.shape[1] // 2]
-    for a in axes:
-        # projection along the other axis
-        proj = IM.sum(axis=1 - a)
-        # autoconvolute projections
-        conv[a] = np.convolve(proj, proj, mode='full')
-        # take the first max, should there be several equal maxima
-        origin[a] = np.argmax(conv[a]) / 2
-    origin = tuple(origin)
+    origins = _image_centers(IMs)
+    # projections along the other axis
+    proj = [IMs.sum(axis=2 - a) for a in axes]
+    # autoconvolute projections (full convolutions, without wraparound)
+    n = fft.next_fast_len(2 * max(p.shape[-1] for p in proj) - 1, real=True)
+    F = fft.rfft(_stack_padded(proj, n), workers=-1)
+    F *= F
+    full = fft.irfft(F, n, workers=-1)
+    for a, p, c in zip(axes, proj, full):
+        conv[a] = c[:, :2 * p.shape[-1] - 1]
+        origins[:, a] = _peak_position(conv[a]) / 2
 
     if projections:
-        return origin, conv[0], conv[1]
+        return origins, conv
     else:
-        return origin
+        return origins
 
 
 def find_origin_by_center_of_image(IM, axes=(0, 1), verbose=False, **kwargs):
@@ -495,8 +698,8 @@ def axis_slices(IM, radial_range=(0, -1), slice_width=10):
 
     Parameters
     ----------
-    IM : 2D np.array
-        image data
+    IM : 2D or 3D np.array
+        image data or a stack of images (indexed by the first dimension)
 
     radial_range: tuple of float
         (rmin, rmax) range to limit data
@@ -507,9 +710,10 @@ def axis_slices(IM, radial_range=(0, -1), slice_width=10):
     Returns
     -------
     top, bottom, left, right : 1D np.arrays shape (rmin:rmax, 1)
-        image slices oriented in the same direction
+        image slices oriented in the same direction (2D arrays with slices
+        for each image in a stack)
     """
-    rows, cols = IM.shape   # image size
+    rows, cols = IM.shape[-2:]   # image size
 
     r2 = rows // 2
     c2 = cols // 2
@@ -518,15 +722,15 @@ def axis_slices(IM, radial_range=(0, -1), slice_width=10):
     rmin, rmax = radial_range
 
     # vertical slice
-    top = IM[:r2, c2-sw2:c2+sw2+1].sum(axis=1)
-    bottom = IM[r2 + rows % 2:, c2-sw2:c2+sw2+1].sum(axis=1)
+    top = IM[..., :r2, c2-sw2:c2+sw2+1].sum(axis=-1)
+    bottom = IM[..., r2 + rows % 2:, c2-sw2:c2+sw2+1].sum(axis=-1)
 
     # horizontal slice
-    left = IM[r2-sw2:r2+sw2+1, :c2].sum(axis=0)
-    right = IM[r2-sw2:r2+sw2+1, c2 + cols % 2:].sum(axis=0)
+    left = IM[..., r2-sw2:r2+sw2+1, :c2].sum(axis=-2)
+    right = IM[..., r2-sw2:r2+sw2+1, c2 + cols % 2:].sum(axis=-2)
 
-    return (top[::-1][rmin:rmax], bottom[rmin:rmax],
-            left[::-1][rmin:rmax], right[rmin:rmax])
+    return (top[..., ::-1][..., rmin:rmax], bottom[..., rmin:rmax],
+            left[..., ::-1][..., rmin:rmax], right[..., rmin:rmax])
 
 
 def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
@@ -555,53 +759,139 @@ def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
     origin : (float, float)
         (row, column)
 
+    Notes
+    -----
+    The shift that aligns opposite slice profiles is found (within ±50
+    pixels) as the minimum of the sum of squared differences between one
+    profile and the other shifted towards the center. It is evaluated from
+    cross-correlations, computed by FFT for both axes at once, and refined to
+    sub-pixel precision by parabolic interpolation.
     """
-    def _align(offset, sliceA, sliceB):
-        """
-        Intensity difference between an axial slice and its shifted opposite.
-        """
-        # always shift to the left (towards center)
-        if offset < 0:
-            diff = shift(sliceA, offset) - sliceB
-        else:
-            diff = sliceA - shift(sliceB, -offset)
-        fvec = (diff**2).sum()
-        return fvec
+    origins = _origins_by_slice(IM[np.newaxis], axes, slice_width,
+                                radial_range)
+    return tuple(origins[0])
 
+
+def _origins_by_slice(IMs, axes=(0, 1), slice_width=10, radial_range=(0, -1),
+                      **kwargs):
+    """
+    Internal function.
+
+    Vectorized :func:`find_origin_by_slice` for a stack of images.
+
+    Returns
+    -------
+    origins : numpy 2D array
+        (row, column) origins of all images
+    """
     if isinstance(axes, int):
         axes = [axes]
 
-    rows, cols = IM.shape
+    rows, cols = IMs.shape[1:]
 
-    r2 = (rows - 1) / 2
-    c2 = (cols - 1) / 2
-    top, bottom, left, right = axis_slices(IM, radial_range, slice_width)
-
-    xyoffset = [0.0, 0.0]
-    # determine shift to align both slices
-    # limit shift to +- 20 pixels
-    initial_shift = [0.1, ]
-
-    # vertical axis
-    if 0 in axes:
-        fit = minimize(_align, initial_shift, args=(top, bottom),
-                       bounds=((-50, 50), ), tol=0.1)
-        if fit["success"]:
-            xyoffset[0] = -fit['x'][0] / 2  # x1/2 for image shift
-        else:
-            raise RuntimeError("fit failure: axis 0, zero shift set", fit)
-
-    # horizontal axis
-    if 1 in axes:
-        fit = minimize(_align, initial_shift, args=(left, right),
-                       bounds=((-50, 50), ), tol=0.1)
-        if fit["success"]:
-            xyoffset[1] = -fit['x'][0] / 2  # x1/2 for image shift
-        else:
-            raise RuntimeError("fit failure: axis 1, zero shift set", fit)
+    origins = np.tile([(rows - 1) / 2, (cols - 1) / 2], (len(IMs), 1))
+    slices = axis_slices(IMs, radial_range, slice_width)
+
+    # cross-correlations c[k] = Σ_i sliceA[i] sliceB[i + k] for both axes
+    # (zero-padded to avoid wraparound)
+    n = fft.next_fast_len(2 * max(s.shape[-1] for s in slices) - 1, real=True)
+    F = fft.rfft(_stack_padded(slices, n), workers=-1)
+    corr = fft.irfft(np.conj(F[::2]) * F[1::2], n, workers=-1)
+
+    for a in axes:
+        sliceA, sliceB = slices[2 * a:2 * a + 2]
+        # limit shift to ±50 pixels
+        m = min(50, sliceA.shape[-1] - 1)
+        lags = np.arange(-m, m + 1)
+        # sum of squared differences (the shifted profile loses its outer
+        # part): Σ_i≥-k sliceA[i]² + Σ_i≥k sliceB[i]² - 2 c[k]
+        energyA = np.cumsum((sliceA**2)[:, ::-1], axis=1)[:, ::-1]
+        energyB = np.cumsum((sliceB**2)[:, ::-1], axis=1)[:, ::-1]
+        ssd = energyA[:, np.maximum(-lags, 0)] + \
+              energyB[:, np.maximum(lags, 0)] - 2 * corr[a][:, lags]
+        # shift that aligns both slices, x1/2 for image shift
+        origins[:, a] += (_peak_position(-ssd) - m) / 2
+
+    return origins
+
+
+def _image_centers(IMs, axes=(0, 1), **kwargs):
+    """
+    Internal function.
 
-    # this is the (row, col) shift to align the slice profiles
-    return r2 - xyoffset[0], c2 - xyoffset[1]
+    Returns the (row, column) centers (``rows // 2, cols // 2``) of all images
+    in a stack as a 2D array of floats.
+    """
+    return np.tile(np.array(IMs.shape[1:]) // 2, (len(IMs), 1)).astype(float)
+
+
+def _origins_by_center_of_mass(IMs, axes=(0, 1), verbose=False,
+                               round_output=False, **kwargs):
+    """
+    Internal function.
+
+    Vectorized :func:`find_origin_by_center_of_mass` for a stack of images.
+
+    Returns
+    -------
+    origins : numpy 2D array
+        (row, column) origins of all images (integers if **round_output** is
+        ``True``)
+    """
+    if isinstance(axes, int):
+        axes = [axes]
+
+    origins = _image_centers(IMs)
+    total = IMs.sum(axis=(1, 2))
+    for a in axes:
+        # projection along the other axis
+        proj = IMs.sum(axis=2 - a)
+        origins[:, a] = proj.dot(np.arange(proj.shape[1])) / total
+
+    if verbose:
+        print('Centers of mass at', origins.tolist())
+
+    if round_output:
+        origins = np.round(origins).astype(int)
+        if verbose:
+            print('... rounded to', origins.tolist())
+
+    return origins
+
+
+def _stack_padded(arrays, n):
+    """
+    Internal function.
+
+    Stacks arrays with equal shapes except the last dimension, which is
+    zero-padded to length **n**.
+    """
+    out = np.zeros((len(arrays),) + arrays[0].shape[:-1] + (n,))
+    for row, a in zip(out, arrays):
+        row[..., :a.shape[-1]] = a
+    return out
+
+
+def _peak_position(a):
+    """
+    Internal function.
+
+    Returns the position of the (first) maximum of an array along its last
+    axis, refined to sub-pixel precision by parabolic interpolation through
+    the maximum and its neighbors.
+    """
+    n = a.shape[-1]
+    k = np.argmax(a, axis=-1)
+
+    def at(i):
+        return np.take_along_axis(a, np.clip(i, 0, n - 1)[..., np.newaxis],
+                                  axis=-1)[..., 0]
+
+    am, a0, ap = at(k - 1), at(k), at(k + 1)
+    curv = am - 2 * a0 + ap
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step = (am - ap) / (2 * curv)
+    return k + np.where((0 < k) & (k < n - 1) & (curv < 0), step, 0)
 
 
 func_method = {
@@ -611,3 +901,11 @@ func_method = {
     "gaussian": find_origin_by_gaussian_fit,
     "slice": find_origin_by_slice
 }
+
+# vectorized methods for stacks of images, see find_origins()
+stack_func_method = {
+    "image_center": _image_centers,
+    "com": _origins_by_center_of_mass,
+    "convolution": _origins_by_convolution,
+    "slice": _origins_by_slice
+}
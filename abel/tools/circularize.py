@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import fft
 from scipy.ndimage import map_coordinates
 from scipy.interpolate import UnivariateSpline, splrep, splev
 from scipy.optimize import leastsq
@@ -72,6 +73,13 @@ def circularize_image(IM, method="lsq", origin=None, radial_range=None,
             may be applied to images with any (circular) structure.
             It aligns the slices with sub-pixel precision.
 
+        ``xcorr``
+            align all slice intensity-profiles with their common average,
+            using cross-correlation in the logarithmic radial coordinate,
+            refined to sub-pixel precision.
+            This method is much faster than ``lsq`` and also may be applied to
+            images with any (circular) structure.
+
     origin : float tuple, str or None
         Pre-center image using :func:`abel.tools.center.center_image`.
         May be an explicit (row, column) tuple or a method name: ``'com'``,
@@ -163,6 +171,34 @@ def circularize_image(IM, method="lsq", origin=None, radial_range=None,
         # convenience function for the case image is not centered
         IM = abel.tools.center.center_image(IM, method=origin)
 
+    angles, radcorr, radial_correction_function = \
+        _radial_correction(IM, method, radial_range, dr, dt, inverse, tol)
+
+    # apply the correction
+    IMcirc = circularize(IM, radial_correction_function, ref_angle=ref_angle)
+
+    if return_correction:
+        return IMcirc, angles, radcorr, radial_correction_function
+    else:
+        return IMcirc
+
+
+def _radial_correction(IM, method, radial_range, dr, dt, inverse, tol):
+    """
+    Internal function.
+
+    Determines the radial correction for a centered image, see
+    :func:`circularize_image` for the parameters.
+
+    Returns
+    -------
+    angles : numpy 1D array
+        mid-point angle (radians) of each image slice
+    radcorr : numpy 1D array
+        radial correction scale factor at each angular slice
+    radial_correction_function : function(numpy 1D array)
+        periodic spline function of the radial correction vs angle
+    """
     # map image into polar coordinates - much easier to slice
     # cartesian (Y, X) -> polar (Radius, Theta)
     polarIM, radial_coord, angle_coord = \
@@ -195,19 +231,16 @@ def circularize_image(IM, method="lsq", origin=None, radial_range=None,
     def radial_correction_function(angle):
         return splev(angle, spl)
 
-    # apply the correction
-    IMcirc = circularize(IM, radial_correction_function, ref_angle=ref_angle)
-
-    if return_correction:
-        return IMcirc, angles, radcorr, radial_correction_function
-    else:
-        return IMcirc
+    return angles, radcorr, radial_correction_function
 
 
 def circularize(IM, radial_correction_function, ref_angle=None):
     """
     Remap image from its distorted grid to the true cartesian grid.
 
+    For correcting many images with the same distortion, use
+    :class:`DistortionMap`.
+
     Parameters
     ----------
     IM : numpy 2D array
@@ -220,33 +253,208 @@ def circularize(IM, radial_correction_function, ref_angle=None):
     ref_angle : None or float
         Reference angle at which the radial correction function is renormalized
         to unity. If ``None``, the angular average is used for renormalization.
+
+    Returns
+    -------
+    IMcirc : numpy 2D array
+        Circularized image, same size as input (same floating-point dtype,
+        or floats for integer input).
     """
-    # cartesian coordinate system
-    Y, X = np.indices(IM.shape)
+    return DistortionMap(IM.shape, radial_correction_function, ref_angle)(IM)
 
-    row, col = IM.shape
-    origin = (col // 2, row // 2)  # odd image
 
-    # coordinates relative to center
-    X -= origin[0]
-    Y = origin[1] - Y   # negative values below the axis
-    theta = np.arctan2(X, Y)  # referenced to vertical direction
+class DistortionMap:
+    """
+    Image distortion correction, as in :func:`circularize`, for images with a
+    given shape, but with all coordinate calculations done once, at the object
+    creation. For interpolation orders 0 and 1, the remapping is precomputed
+    as a sparse matrix, so that correcting each image costs only one sparse
+    matrix product.
+
+    The distortion map can be created from a known radial correction function
+    or determined from a reference image (see :meth:`from_image`), saved to a
+    file and loaded later. Example::
+
+        dmap = DistortionMap.from_image(IMref, method='xcorr', dt=0.1)
+        dmap.save('distortion.npz')
+        ...
+        dmap = DistortionMap.load('distortion.npz')
+        for IM in images:
+            IMcirc = dmap(IM)
+            ...
+        # or, for a 3D array with a stack of images:
+        IMcircs = dmap(images)
 
-    # radial scale factor at angle = ref_angle
-    if ref_angle is None:
-        factor = np.mean(radial_correction_function(theta))
-    else:
-        factor = radial_correction_function(ref_angle)
+    Parameters
+    ----------
+    shape : tuple of int
+        (rows, columns) shape of the images, which must be centered (the
+        origin is at ``(rows // 2, columns // 2)``)
 
-    # radial correction
-    Xactual = X * factor / radial_correction_function(theta)
-    Yactual = Y * factor / radial_correction_function(theta)
+    radial_correction_function : function(numpy 1D array)
+        A function returning the radial correction for a given angle. It
+        should accept a numpy 1D array of angles.
 
-    # @DanHickstein magic
-    # https://github.com/PyAbel/PyAbel/issues/186#issuecomment-275471271
-    IMcirc = map_coordinates(IM, (origin[1] - Yactual, Xactual + origin[0]))
+    ref_angle : None or float
+        Reference angle at which the radial correction function is renormalized
+        to unity. If ``None``, the angular average is used for renormalization.
 
-    return IMcirc
+    order : int
+        order of the spline interpolation (see
+        :func:`scipy.ndimage.map_coordinates`), from 0 to 5. The default is 3
+        (cubic), as in :func:`circularize`.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        shape of the images
+    order : int
+        interpolation order
+    scale : numpy 2D array
+        ratio of the distorted radius to the true radius for each pixel
+    angles : numpy 1D array or None
+        mid-point angles of image slices (only for :meth:`from_image`)
+    radial_correction : numpy 1D array or None
+        radial correction scale factors at these angles (only for
+        :meth:`from_image`)
+    """
+    def __init__(self, shape, radial_correction_function, ref_angle=None,
+                 order=3):
+        row, col = shape[:2]
+        # coordinates relative to center, referenced to vertical direction
+        Y, X = np.indices((row, col))
+        theta = np.arctan2(X - col // 2, row // 2 - Y)
+
+        # radial scale factor at angle = ref_angle
+        correction = radial_correction_function(theta)
+        if ref_angle is None:
+            factor = np.mean(correction)
+        else:
+            factor = radial_correction_function(ref_angle)
+
+        self.angles = None
+        self.radial_correction = None
+        self._setup(factor / correction, order)
+
+    def _setup(self, scale, order):
+        """
+        Precompute the remapping for the given radial scaling.
+        """
+        self.scale = np.asarray(scale, dtype=float)
+        self.shape = self.scale.shape
+        self.order = order
+        row, col = self.shape
+        origin = (col // 2, row // 2)  # odd image
+
+        # cartesian coordinate system relative to center,
+        # with negative Y values below the axis
+        Y, X = np.indices(self.shape)
+        X = X - origin[0]
+        Y = origin[1] - Y
+
+        # radial correction
+        # @DanHickstein magic
+        # https://github.com/PyAbel/PyAbel/issues/186#issuecomment-275471271
+        rowi = (origin[1] - Y * self.scale).flatten()
+        coli = (X * self.scale + origin[0]).flatten()
+
+        if order > 1:
+            self._coords = np.vstack((rowi, coli))
+        else:
+            self._M = abel.tools.polar._interpolation_matrix(rowi, coli,
+                                                             self.shape, order)
+
+    @classmethod
+    def from_image(cls, IM, method='lsq', radial_range=None, dr=0.5, dt=0.5,
+                   ref_angle=None, inverse=False, tol=0, order=3):
+        """
+        Determine the distortion map from a (centered) reference image, as in
+        :func:`circularize_image`, see its documentation for the parameters.
+
+        Returns
+        -------
+        dmap : DistortionMap
+            the distortion map for images with the shape of **IM**
+        """
+        angles, radcorr, radial_correction_function = \
+            _radial_correction(IM, method, radial_range, dr, dt, inverse, tol)
+        dmap = cls(IM.shape, radial_correction_function, ref_angle, order)
+        dmap.angles = angles
+        dmap.radial_correction = radcorr
+        return dmap
+
+    def save(self, fname):
+        """
+        Save the distortion map to a file.
+
+        Parameters
+        ----------
+        fname : str or file
+            file name (the ``.npz`` extension is added if needed) or object,
+            see :func:`numpy.savez`
+        """
+        data = {'scale': self.scale, 'order': self.order}
+        if self.angles is not None:
+            data.update(angles=self.angles,
+                        radial_correction=self.radial_correction)
+        np.savez(fname, **data)
+
+    @classmethod
+    def load(cls, fname):
+        """
+        Load a distortion map saved by :meth:`save`.
+
+        Parameters
+        ----------
+        fname : str or file
+            file name or object
+
+        Returns
+        -------
+        dmap : DistortionMap
+            the loaded distortion map
+        """
+        dmap = cls.__new__(cls)
+        with np.load(fname) as data:
+            dmap._setup(data['scale'], int(data['order']))
+            dmap.angles = data.get('angles')
+            dmap.radial_correction = data.get('radial_correction')
+        return dmap
+
+    def __call__(self, IM):
+        """
+        Correct the image or a stack of images.
+
+        Parameters
+        ----------
+        IM : numpy 2D or 3D array
+            the image or an array of images (with images indexed by the first
+            dimension)
+
+        Returns
+        -------
+        IMcirc : numpy 2D or 3D array
+            circularized image or array of images (with the same floating-point
+            dtype as the input, or as floats for integer input)
+        """
+        IM = np.asarray(IM)
+        if IM.shape[-2:] != self.shape:
+            raise ValueError(f'image shape {IM.shape} does not match '
+                             f'distortion map shape {self.shape}')
+        images = IM.reshape((-1,) + self.shape)
+        dtype = IM.dtype if np.issubdtype(IM.dtype, np.inexact) else float
+
+        if self.order > 1:
+            IMcirc = np.array([map_coordinates(image, self._coords,
+                                               output=dtype, order=self.order)
+                               for image in images], dtype=dtype)
+        else:
+            # (the interpolation matrix has doubles, cast it for float32 etc.)
+            M = self._M.astype(dtype, copy=False)
+            IMcirc = M.dot(images.reshape((len(images), -1)).T
+                           .astype(dtype, copy=False)).T
+
+        return IMcirc.reshape(IM.shape)
 
 
 def _residual(param, radial, profile, previous):
@@ -292,6 +500,11 @@ def correction(polarIMTrans, angles, radial, method):
             least-squares determine a radial correction factor that will align
             a radial intensity profile with the previous, adjacent slice.
 
+        ``xcorr``
+            radial correction factor from the cross-correlation of each radial
+            intensity profile with the average (aligned) profile, see
+            :func:`_xcorr_correction`.
+
     Returns
     -------
     radcorr : numpy 1D array
@@ -337,8 +550,107 @@ def correction(polarIMTrans, angles, radial, method):
             # for the next slice
             fitpar = result[0]
 
+    elif method == "xcorr":
+        radcorr = _xcorr_correction(polarIMTrans, radial)
+
     else:
-        raise ValueError('method argument must be "argmax" or "lsq",'
+        raise ValueError('method argument must be "argmax", "lsq" or "xcorr",'
                          f' not "{method}"')
 
     return np.asarray(radcorr)
+
+
+def _xcorr_correction(polarIMTrans, radial, iterations=2):
+    r"""
+    Radial correction factors from cross-correlations of radial intensity
+    profiles.
+
+    Radial scaling becomes a shift in the logarithmic radial coordinate
+    :math:`u = \ln r`, so all profiles are resampled to a uniform grid in
+    :math:`u` (weighted by :math:`\sqrt{r}` to preserve the relative weights
+    of radii) and cross-correlated with a reference profile using the FFT
+    (computed in parallel for all profiles). The correlation peaks are then
+    refined by Newton iterations on the band-limited cross-correlation
+    functions. The reference profile is initially the first slice and then the
+    average of all aligned profiles.
+
+    Parameters
+    ----------
+    polarIMTrans : numpy 2D array
+        Polar coordinate image, transposed :math:`(\theta, r)` so that each
+        row is a single angle.
+
+    radial : numpy 1D array
+        Radial coordinates for one column of `polarIMTrans`.
+
+    iterations : int
+        number of alignments with the average profile
+
+    Returns
+    -------
+    radcorr : numpy 1D array
+        radial correction factors for angles, relative to the first slice
+    """
+    # logarithmic radial grid (with the outer resolution of the radial grid)
+    subr = radial > 0
+    radial = radial[subr]
+    profiles = polarIMTrans[:, subr]
+    if radial.size < 2:
+        raise ValueError('at least 2 positive radii are required')
+    du = (radial[-1] - radial[-2]) / radial[-1]
+    n = int(np.log(radial[-1] / radial[0]) / du) + 1
+    r = radial[0] * np.exp(du * np.arange(n))
+    # linear interpolation to this grid, weighted by sqrt(r)
+    i = np.clip(np.searchsorted(radial, r), 1, radial.size - 1)
+    w = (r - radial[i - 1]) / (radial[i] - radial[i - 1])
+    logprof = (profiles[:, i - 1] * (1 - w) + profiles[:, i] * w) * np.sqrt(r)
+    logprof -= logprof.mean(axis=1, keepdims=True)
+
+    # Fourier transforms of zero-padded profiles
+    N = fft.next_fast_len(2 * n)
+    F = fft.rfft(logprof, N, workers=-1)
+    omega = 2 * np.pi * fft.rfftfreq(N)  # (per grid step)
+    # weights of the one-sided spectrum
+    weight = np.full_like(omega, 2)
+    weight[0] = weight[-1] = 1
+
+    ref = F[0]
+    for it in range(iterations + 1):
+        # cross-correlations with the reference: c(d) = Σ_u ref(u) prof(u + d)
+        cross = np.conj(ref) * F
+        c = fft.irfft(cross, N, workers=-1)
+        k = c.argmax(axis=1)
+        # parabolic estimate of the peak position
+        c0, cm, cp = (c[np.arange(len(k)), (k + j) % N] for j in (0, -1, 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = (cm - cp) / (2 * (cm - 2 * c0 + cp))
+        d = k + np.where(np.isfinite(step), np.clip(step, -0.5, 0.5), 0)
+        d = (d + N // 2) % N - N // 2  # shifts are signed
+        if it < iterations:
+            # new reference: the average of aligned profiles
+            ref = np.mean(F * _shift_factors(d, N), axis=0)
+
+    # Newton refinement of the band-limited correlation maxima
+    for _ in range(3):
+        phase = cross * _shift_factors(d, N)
+        # derivatives of c(d) (up to a common factor)
+        dc = -np.sum(weight * omega * phase.imag, axis=1)
+        d2c = -np.sum(weight * omega**2 * phase.real, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = -dc / d2c
+        d += np.where((d2c < 0) & np.isfinite(step),
+                      np.clip(step, -0.5, 0.5), 0)
+
+    # profile(r e^d) matches the reference
+    return np.exp((d[0] - d) * du)
+
+
+def _shift_factors(d, N):
+    """
+    Factors exp(iωd) shifting the rfft spectra (length N) of signals by d.
+    """
+    # (powers of exp(iω₁d) are much faster than exp() for each frequency)
+    z = np.empty((len(d), N // 2 + 1), dtype=complex)
+    z[:, 0] = 1
+    z[:, 1:] = np.exp(2j * np.pi / N * d)[:, None]
+    return np.cumprod(z, axis=1, out=z)
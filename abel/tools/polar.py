@@ -1,5 +1,12 @@
+from collections import OrderedDict
+
 import numpy as np
 from scipy.ndimage import map_coordinates
+from scipy.sparse import csr_matrix
+
+# Cache of recently used reprojectors, see _get_reprojector()
+_reprojectors = OrderedDict()
+_reprojectors_size = 4
 
 
 def reproject_image_into_polar(data, origin=None, Jacobian=False,
@@ -10,6 +17,10 @@ def reproject_image_into_polar(data, origin=None, Jacobian=False,
     the upward direction. The resulting array has rows corresponding to the
     radial grid, and columns corresponding to the angular grid.
 
+    The coordinate grids for recently used image shapes and reprojection
+    parameters are cached (see :class:`PolarReprojector`, which can also be
+    used directly for reprojecting many images).
+
     Parameters
     ----------
     data : 2D np.array
@@ -44,50 +55,214 @@ def reproject_image_into_polar(data, origin=None, Jacobian=False,
     https://stackoverflow.com/questions/3798333/image-information-along-a-polar-coordinate-system
 
     """
-    ny, nx = data.shape[:2]
-    if origin is None:
-        origin = (ny // 2, nx // 2)
-    else:
-        origin = list(origin)
-        # wrap negative coordinates
-        if origin[0] < 0:
-            origin[0] += ny
-        if origin[1] < 0:
-            origin[1] += nx
+    reprojector = _get_reprojector(data.shape[:2], origin, dr, dt)
+    output = reprojector(data, Jacobian)
+    # (copies, since the cached grids must not be modified)
+    return output, reprojector.r_grid.copy(), reprojector.theta_grid.copy()
+
 
-    # Determine what the min and max r and theta coords will be...
-    x, y = index_coords(data, origin=origin)  # (x,y) coordinates of each pixel
-    r, theta = cart2polar(x, y)  # convert (x,y) -> (r,θ), note θ=0 is vertical
+class PolarReprojector:
+    """
+    Reprojection of images with a given shape into a polar coordinate system,
+    as in :func:`reproject_image_into_polar`, but with all coordinate
+    calculations done once, at the object creation. For interpolation orders
+    0 and 1, the reprojection is precomputed as a sparse matrix, so that
+    reprojecting each image costs only one sparse matrix product.
 
-    nr = int(np.ceil((r.max() - r.min()) / dr))
+    Example::
 
-    if dt is None:
-        nt = max(nx, ny)
-    else:
-        # dt in radians
-        nt = int(np.ceil((theta.max() - theta.min()) / dt))
-
-    # Make a regular (in polar space) grid based on the min and max r & theta
-    r_i = np.linspace(r.min(), r.max(), nr, endpoint=False)
-    theta_i = np.linspace(theta.min(), theta.max(), nt, endpoint=False)
-    theta_grid, r_grid = np.meshgrid(theta_i, r_i)
-
-    # Convert the r and theta grids to Cartesian coordinates
-    X, Y = polar2cart(r_grid, theta_grid)
-    # then to a 2×n array of row and column indices for np.map_coordinates()
-    rowi = (origin[0] - Y).flatten()
-    coli = (X + origin[1]).flatten()
-    coords = np.vstack((rowi, coli))
-
-    # Remap with interpolation
-    # (making an array of floats even if the data has an integer type)
-    zi = map_coordinates(data, coords, output=float)
-    output = zi.reshape((nr, nt))
-
-    if Jacobian:
-        output *= r_i[:, np.newaxis]
-
-    return output, r_grid, theta_grid
+        reproject = PolarReprojector(IM.shape, origin, order=1)
+        for IM in images:
+            polarIM = reproject(IM)
+            ...
+        # or, for a 3D array with a stack of images:
+        polarIMs = reproject(images)
+
+    Parameters
+    ----------
+    shape : tuple of int
+        (rows, columns) shape of the images
+    origin : tuple or None
+        (row, column) coordinates of the image origin. If ``None``, the
+        geometric center of the image is used.
+    dr : float
+        radial coordinate spacing for the grid interpolation
+    dt : float or None
+        angular coordinate spacing (in radians).
+        If ``None``, the number of angular grid points will be set to the
+        largest dimension (the height or the width) of the image.
+    order : int
+        order of the spline interpolation (see
+        :func:`scipy.ndimage.map_coordinates`), from 0 to 5. The default is 3
+        (cubic), as in :func:`reproject_image_into_polar`.
+
+    Attributes
+    ----------
+    r_grid : 2D np.array
+        meshgrid of radial coordinates
+    theta_grid : 2D np.array
+        meshgrid of angular coordinates
+    """
+    def __init__(self, shape, origin=None, dr=1, dt=None, order=3):
+        ny, nx = shape[:2]
+        if origin is None:
+            origin = (ny // 2, nx // 2)
+        else:
+            origin = list(origin)
+            # wrap negative coordinates
+            if origin[0] < 0:
+                origin[0] += ny
+            if origin[1] < 0:
+                origin[1] += nx
+        self.shape = (ny, nx)
+        self.order = order
+
+        # Determine what the min and max r and theta coords will be...
+        # (x,y) coordinates of each pixel
+        x, y = index_coords(np.empty(self.shape), origin=origin)
+        r, theta = cart2polar(x, y)  # (x,y) -> (r,θ), note θ=0 is vertical
+
+        nr = int(np.ceil((r.max() - r.min()) / dr))
+
+        if dt is None:
+            nt = max(nx, ny)
+        else:
+            # dt in radians
+            nt = int(np.ceil((theta.max() - theta.min()) / dt))
+
+        # Make a regular (in polar space) grid based on the min and max r & θ
+        self._r_i = np.linspace(r.min(), r.max(), nr, endpoint=False)
+        theta_i = np.linspace(theta.min(), theta.max(), nt, endpoint=False)
+        self.theta_grid, self.r_grid = np.meshgrid(theta_i, self._r_i)
+        self.theta_grid.flags.writeable = False
+        self.r_grid.flags.writeable = False
+
+        # Convert the r and theta grids to Cartesian coordinates
+        X, Y = polar2cart(self.r_grid, self.theta_grid)
+        # then to a 2×n array of row and column indices for map_coordinates()
+        rowi = (origin[0] - Y).flatten()
+        coli = (X + origin[1]).flatten()
+
+        if order > 1:
+            self._coords = np.vstack((rowi, coli))
+            return
+
+        # Sparse matrix with interpolation weights
+        self._M = _interpolation_matrix(rowi, coli, self.shape, order)
+
+    def __call__(self, data, Jacobian=False):
+        """
+        Reproject the image or a stack of images.
+
+        Parameters
+        ----------
+        data : 2D or 3D np.array
+            the image array or an array of images (with images indexed by the
+            first dimension)
+        Jacobian : bool
+            include `r` intensity scaling in the coordinate transform
+
+        Returns
+        -------
+        output : 2D or 3D np.array
+            the polar image (r, theta) or an array of polar images
+        """
+        data = np.asarray(data)
+        if data.shape[-2:] != self.shape:
+            raise ValueError(f'data shape {data.shape} does not match '
+                             f'reprojector shape {self.shape}')
+        images = data.reshape((-1,) + self.shape)
+        nr, nt = self.r_grid.shape
+
+        if self.order > 1:
+            # Remap with interpolation
+            # (making an array of floats even if the data has an integer type)
+            output = np.array([map_coordinates(IM, self._coords, output=float,
+                                               order=self.order)
+                               for IM in images])
+        else:
+            output = self._M.dot(images.reshape((len(images), -1)).T
+                                 .astype(float, copy=False)).T
+        output = output.reshape(data.shape[:-2] + (nr, nt))
+
+        if Jacobian:
+            output *= self._r_i[:, np.newaxis]
+
+        return output
+
+
+def _interpolation_matrix(rowi, coli, shape, order):
+    """
+    Internal function.
+
+    Returns a sparse matrix with interpolation weights (for orders 0 and 1)
+    that maps a flattened image with the given **shape** to the values at
+    points with (row, column) coordinates **rowi**, **coli** (1D arrays),
+    equivalently to :func:`scipy.ndimage.map_coordinates` in the 'constant'
+    mode (zero outside the image).
+    """
+    ny, nx = shape
+    n = len(rowi)
+    point = np.arange(n)
+    inside = (0 <= rowi) & (rowi <= ny - 1) & (0 <= coli) & (coli <= nx - 1)
+    point, rowi, coli = point[inside], rowi[inside], coli[inside]
+    if order == 0:  # nearest pixel
+        idx = [np.floor(rowi + 0.5).astype(int) * nx +
+               np.floor(coli + 0.5).astype(int)]
+        w = [np.ones_like(rowi)]
+        point = [point]
+    else:  # bilinear interpolation
+        row0 = np.minimum(np.floor(rowi).astype(int), max(ny - 2, 0))
+        col0 = np.minimum(np.floor(coli).astype(int), max(nx - 2, 0))
+        wr = rowi - row0
+        wc = coli - col0
+        idx, w = [], []
+        for dr, wr_ in [(0, 1 - wr), (1, wr)]:
+            for dc, wc_ in [(0, 1 - wc), (1, wc)]:
+                idx.append((row0 + dr) * nx + col0 + dc)
+                w.append(wr_ * wc_)
+        point = [point] * 4
+    idx, w, point = (np.concatenate(a) for a in (idx, w, point))
+    nonzero = w != 0
+    return csr_matrix((w[nonzero], (point[nonzero], idx[nonzero])),
+                      shape=(n, ny * nx))
+
+
+def _get_reprojector(shape, origin=None, dr=1, dt=None, order=3):
+    """
+    Internal function.
+
+    Returns a :class:`PolarReprojector` object for the given parameters,
+    reusing it if it was recently used.
+    """
+    if origin is not None:
+        origin = tuple(origin)  # (make hashable)
+    key = (tuple(shape), origin, dr, dt, order)
+    reprojector = _reprojectors.pop(key, None)
+    if reprojector is None:
+        reprojector = PolarReprojector(shape, origin, dr, dt, order)
+        while len(_reprojectors) >= _reprojectors_size:
+            _reprojectors.popitem(last=False)  # (least recently used)
+    _reprojectors[key] = reprojector  # (as most recently used)
+    return reprojector
+
+
+def cache_cleanup():
+    """
+    Utility function.
+
+    Frees the memory cache of polar reprojectors used by
+    :func:`reproject_image_into_polar`.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    _reprojectors.clear()
 
 
 def index_coords(data, origin=None):
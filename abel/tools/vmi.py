@@ -4,14 +4,19 @@ if hasattr(np, 'trapezoid'):  # numpy >= 2
     trapezoid = np.trapezoid
 else:
     trapezoid = np.trapz
-from abel.tools.polar import reproject_image_into_polar
+from abel.tools.polar import reproject_image_into_polar, index_coords, \
+                             cart2polar
 from scipy.ndimage import map_coordinates, uniform_filter1d, shift
 from scipy.optimize import curve_fit
 from scipy.linalg import hankel, inv, pascal, LinAlgError, LinAlgWarning
 from scipy.special import legendre
 
+# Cached radial bins for radial_intensity(method='bin')
+_bins = None
+_bins_cfg = None  # (shape, origin, dr)
 
-def radial_intensity(kind, IM, origin=None, dr=1, dt=None):
+
+def radial_intensity(kind, IM, origin=None, dr=1, dt=None, method='remap'):
     """
     Calculate the one-dimensional radial intensity profile by angular
     integration or averaging of the image, treated either as a two-dimensional
@@ -47,7 +52,24 @@ def radial_intensity(kind, IM, origin=None, dr=1, dt=None):
         angular grid spacing in radians.
         If ``None``, the number of theta values will be set to largest
         dimension (the height or the width) of the image, which should
-        typically ensure good sampling.
+        typically ensure good sampling. Not used by ``method='bin'``.
+
+    method : str
+        calculation method:
+
+        ``'remap'`` (default):
+            the image is resampled to a uniform polar grid (see
+            :func:`abel.tools.polar.reproject_image_into_polar`), then polar
+            pixels are summed over all angles for each radius.
+        ``'bin'``:
+            each pixel of the image is linearly distributed over the two
+            adjacent radial bins (as in :class:`Distributions`), giving average
+            intensities in each bin, to which the Jacobians are then applied.
+            The bins are cached for the same image shape, **origin** and
+            **dr**, so this is much faster. The results are very close to
+            those of ``'remap'``, except for the radii outside the largest
+            circle inscribed in the image (``'remap'`` treats the missing parts
+            as zero, while ``'bin'`` averages only over the existing pixels).
 
     Returns
     -------
@@ -57,6 +79,11 @@ def radial_intensity(kind, IM, origin=None, dr=1, dt=None):
     intensity : 1D numpy.array
         intensity profile as a function of the radial coordinate
     """
+    if method == 'bin':
+        return _radial_intensity_bin(kind, IM, origin, dr)
+    elif method != 'remap':
+        raise ValueError(f'Incorrect {method=}')
+
     polarIM, R, T = reproject_image_into_polar(IM, origin, dr=dr, dt=dt)
 
     # apply necessary Jacobian/normalization
@@ -80,50 +107,112 @@ def radial_intensity(kind, IM, origin=None, dr=1, dt=None):
     return R[:, 0], intensity
 
 
-def angular_integration_2D(IM, origin=None, dr=1, dt=None):
+def _radial_intensity_bin(kind, IM, origin, dr):
+    """
+    radial_intensity() for method='bin'.
+    """
+    global _bins, _bins_cfg
+
+    if kind not in ['int2D', 'int3D', 'avg2D', 'avg3D']:
+        raise ValueError(f'Incorrect {kind=}')
+
+    if origin is not None:
+        origin = tuple(origin)  # (make hashable)
+    cfg = (IM.shape, origin, dr)
+    if _bins_cfg != cfg:
+        # pixel coordinates (x, y), then polar (r, θ)
+        r, theta = cart2polar(*index_coords(IM, origin))
+        # radial grid, as in reproject_image_into_polar()
+        nr = int(np.ceil((r.max() - r.min()) / dr))
+        r_i = np.linspace(r.min(), r.max(), nr, endpoint=False)
+        # bins and weights for linear distribution over adjacent bins
+        u = (r - r.min()) / (r_i[1] - r_i[0] if nr > 1 else 1)
+        rbin = np.floor(u).astype(int).reshape(-1)
+        wu = (u - np.floor(u)).reshape(-1)
+        wl = 1 - wu
+        sin = np.abs(np.sin(theta)).reshape(-1)  # for 3D
+
+        def bincount(w):
+            # sum to lower and upper bins
+            res = np.bincount(rbin, wl * w, nr + 1)[:nr]
+            res[1:] += np.bincount(rbin, wu * w, nr)[:nr - 1]
+            return res
+
+        # normalization (numbers of pixels in bins, weighted for 3D)
+        N2D = bincount(1)
+        N3D = bincount(sin)
+        _bins = (r_i, bincount, sin, N2D, N3D)
+        _bins_cfg = cfg
+    r_i, bincount, sin, N2D, N3D = _bins
+
+    # average intensities in bins
+    IM = IM.reshape(-1)
+    if kind.endswith('2D'):
+        intensity = np.divide(bincount(IM), N2D, out=np.zeros_like(r_i),
+                              where=N2D > 0)
+    else:
+        intensity = np.divide(bincount(sin * IM), N3D, out=np.zeros_like(r_i),
+                              where=N3D > 0)
+
+    # apply necessary Jacobian
+    if kind == 'int2D':
+        intensity *= 2 * np.pi * r_i
+    elif kind == 'int3D':
+        intensity *= 4 * np.pi * r_i**2
+
+    return r_i, intensity
+
+
+def angular_integration_2D(IM, origin=None, dr=1, dt=None, method='remap'):
     """
     Angular integration of the image as a two-dimensional object.
 
-    Equivalent to :func:`radial_intensity('int2D', IM, origin, dr, dt)
+    Equivalent to :func:`radial_intensity('int2D', IM, origin, dr, dt, method)
     <radial_intensity>`.
     """
-    return radial_intensity('int2D', IM, origin=origin, dr=dr, dt=dt)
+    return radial_intensity('int2D', IM, origin=origin, dr=dr, dt=dt,
+                            method=method)
 
 
-def angular_integration_3D(IM, origin=None, dr=1, dt=None):
+def angular_integration_3D(IM, origin=None, dr=1, dt=None, method='remap'):
     """
     Angular integration of the three-dimensional cylindrically symmetric object
     represented by the image as its central slice. When applied to the inverse
     Abel transform of a velocity-mapping image, this yields the speed
     distribution.
 
-    Equivalent to :func:`radial_intensity('int3D', IM, origin, dr, dt)
+    Equivalent to :func:`radial_intensity('int3D', IM, origin, dr, dt, method)
     <radial_intensity>`.
     """
-    return radial_intensity('int3D', IM, origin=origin, dr=dr, dt=dt)
+    return radial_intensity('int3D', IM, origin=origin, dr=dr, dt=dt,
+                            method=method)
 
 
-def average_radial_intensity_2D(IM, origin=None, dr=1, dt=None):
+def average_radial_intensity_2D(IM, origin=None, dr=1, dt=None,
+                                method='remap'):
     """
     Calculate the average radial intensity of the image as a two-dimensional
     object.
 
-    Equivalent to :func:`radial_intensity('avg2D', IM, origin, dr, dt)
+    Equivalent to :func:`radial_intensity('avg2D', IM, origin, dr, dt, method)
     <radial_intensity>`.
     """
-    return radial_intensity('avg2D', IM, origin=origin, dr=dr, dt=dt)
+    return radial_intensity('avg2D', IM, origin=origin, dr=dr, dt=dt,
+                            method=method)
 
 
-def average_radial_intensity_3D(IM, origin=None, dr=1, dt=None):
+def average_radial_intensity_3D(IM, origin=None, dr=1, dt=None,
+                                method='remap'):
     """
     Calculate the average radial intensity of the three-dimensional
     cylindrically symmetric object represented by the image as its central
     slice.
 
-    Equivalent to :func:`radial_intensity('avg3D', IM, origin, dr, dt)
+    Equivalent to :func:`radial_intensity('avg3D', IM, origin, dr, dt, method)
     <radial_intensity>`.
     """
-    return radial_intensity('avg3D', IM, origin=origin, dr=dr, dt=dt)
+    return radial_intensity('avg3D', IM, origin=origin, dr=dr, dt=dt,
+                            method=method)
 
 
 def radial_integration(IM, origin=None, radial_ranges=None, theta_ranges=None,
@@ -200,22 +289,29 @@ def radial_integration(IM, origin=None, radial_ranges=None, theta_ranges=None,
         # @DanHickstein clever code to map ranges
         radial_ranges = list(zip(rr[:-1], rr[1:]))
 
-    Intensity_vs_theta = []
-    radial_midpt = []
-    Beta = []
-    Amp = []
-    for rr in radial_ranges:
-        subr = np.logical_and(r >= rr[0], r <= rr[1])
+    radial_ranges = np.array(radial_ranges, dtype=float).reshape((-1, 2))
+    radial_midpt = list(radial_ranges.mean(axis=1))
 
-        # sum intensity across radius of spectral feature
-        intensity_vs_theta_at_R = np.sum(polarIM[subr], axis=0)
-        Intensity_vs_theta.append(intensity_vs_theta_at_R)
-        radial_midpt.append(np.mean(rr))
+    # sum intensity across radius of spectral features, for all ranges at once
+    # (r0 <= r <= r1 for each range, from cumulative sums over radii)
+    lo = np.searchsorted(r, radial_ranges[:, 0], side='left')
+    hi = np.maximum(np.searchsorted(r, radial_ranges[:, 1], side='right'), lo)
+    cumIM = np.zeros((len(r) + 1, len(theta)))
+    np.cumsum(polarIM, axis=0, out=cumIM[1:])
+    Intensity = cumIM[hi] - cumIM[lo]
+    Intensity_vs_theta = list(Intensity)
 
-        beta, amp = anisotropy_parameter(theta, intensity_vs_theta_at_R,
-                                         theta_ranges, mode)
-        Beta.append(beta)
-        Amp.append(amp)
+    if mode == 'bound':
+        # constrained fits cannot be linearized
+        fits = [anisotropy_parameter(theta, intensity, theta_ranges, mode)
+                for intensity in Intensity]
+        Beta = [fit[0] for fit in fits]
+        Amp = [fit[1] for fit in fits]
+    else:
+        beta, amp = _anisotropy_parameters(theta, Intensity, theta_ranges,
+                                           mode)
+        Beta = list(zip(*beta))
+        Amp = list(zip(*amp))
 
     return Beta, Amp, radial_midpt, Intensity_vs_theta, theta
 
@@ -308,6 +404,85 @@ def anisotropy_parameter(theta, intensity, theta_ranges=None, mode='reject'):
     return (beta, error_beta), (amplitude, error_amplitude)
 
 
+def _anisotropy_parameters(theta, intensities, theta_ranges=None,
+                           mode='reject'):
+    r"""
+    Vectorized :func:`anisotropy_parameter` for several intensity
+    distributions (in modes ``'raw'`` and ``'reject'``).
+
+    The PAD model :math:`A [1 + \beta P_2(\cos\theta)]` is linear in
+    :math:`A` and :math:`A\beta`, so all distributions are fitted by one
+    linear least-squares solution. The errors are computed as in
+    :func:`scipy.optimize.curve_fit` for the (nonlinear) parameters
+    :math:`\beta` and :math:`A`.
+
+    Parameters
+    ----------
+    theta : 1D numpy array
+        angle coordinates, referenced to the vertical direction.
+
+    intensities : 2D numpy array
+        intensity variations with angle, one per row
+
+    theta_ranges : list of tuples or None
+        angular ranges over which to fit, see :func:`anisotropy_parameter`
+
+    mode : str
+        ``'raw'`` or ``'reject'``, see :func:`anisotropy_parameter`
+
+    Returns
+    -------
+    beta : tuple of 1D numpy arrays
+        (anisotropy parameters, fit errors)
+
+    amplitude : tuple of 1D numpy arrays
+        (amplitudes of signal, fit errors)
+    """
+    intensities = np.atleast_2d(intensities)
+
+    # angular range of data to be included in the fit
+    if theta_ranges is not None:
+        subtheta = np.ones(len(theta), dtype=bool)
+        for rt in theta_ranges:
+            subtheta = np.logical_and(
+                subtheta, np.logical_and(theta >= rt[0], theta <= rt[1]))
+        theta = theta[subtheta]
+        intensities = intensities[:, subtheta]
+
+    P2 = (3 * np.cos(theta)**2 - 1) / 2  # 2nd-order Legendre polynomial
+    n = len(theta)
+    if n < 2:
+        raise ValueError('at least 2 angular points are required for fitting')
+
+    # linear fit I = A + (A beta) P2 for all distributions
+    X = np.stack([np.ones(n), P2], axis=1)
+    coef = np.linalg.lstsq(X, intensities.T, rcond=None)[0]
+    amplitude, Abeta = coef
+    resid = intensities - (X @ coef).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = Abeta / amplitude
+        # residual variance (as in curve_fit, with absolute_sigma=False)
+        s2 = np.sum(resid**2, axis=1) / (n - 2) if n > 2 else np.inf
+
+        # covariance of (beta, amplitude) from the Jacobian of the PAD model
+        # at the solution: dI/dbeta = A P2, dI/dA = 1 + beta P2
+        S1, S2 = np.sum(P2), np.sum(P2**2)
+        JbJb = amplitude**2 * S2
+        JbJa = amplitude * (S1 + beta * S2)
+        JaJa = n + 2 * beta * S1 + beta**2 * S2
+        det = JbJb * JaJa - JbJa**2
+        error_beta = np.sqrt(s2 * JaJa / det)
+        error_amplitude = np.sqrt(s2 * JbJb / det)
+
+    if mode == 'reject':
+        # physical range
+        bad = ~((beta >= -1) & (beta <= 2))
+        beta[bad] = np.nan
+        error_beta[bad] = np.nan
+
+    return (beta, error_beta), (amplitude, error_amplitude)
+
+
 def toPES(radial, intensity, energy_cal_factor, per_energy_scaling=True,
           photon_energy=None, Vrep=None, zoom=1):
     r"""
@@ -1083,8 +1258,14 @@ class Distributions:
         valid : bool array
             flags for each radius indicating whether it has valid data (radii
             that have zero weights for all pixels will have no valid data)
+        cov : (rmax + 1) × (# terms) × (# terms) numpy array or None
+            covariance matrices of the :math:`\cos^n \theta` terms at each
+            radius, if pixel variances were supplied for the analysis
+            (correlations between different radii are not included). The
+            variances of other distributions can be obtained using the
+            methods like :meth:`Ibeta_var`.
         """
-        def __init__(self, r, cn, order, odd, valid=None):
+        def __init__(self, r, cn, order, odd, valid=None, cov=None):
             self.r = r
             self.cn = cn
             self.order = order
@@ -1095,6 +1276,15 @@ class Distributions:
                 self.valid = np.full_like(r, True)
             else:
                 self.valid = valid
+            self.cov = cov
+
+        def _var(self, M):
+            """
+            Variances of the terms M·cn for conversion matrix M.
+            """
+            if self.cov is None:
+                raise ValueError('Variances were not calculated')
+            return np.einsum('ij,rjk,ik->ir', M, self.cov, M)
 
         def cos(self):
             r"""
@@ -1117,6 +1307,13 @@ class Distributions:
             """
             return np.vstack((self.r, self.cn))
 
+        def cos_var(self):
+            """
+            Variances of the distributions returned by :meth:`cos` (available
+            only if pixel variances were supplied for the analysis).
+            """
+            return self._var(np.eye(self.cn.shape[0]))
+
         def cossin(self):
             r"""
             Radial distributions of
@@ -1173,20 +1370,26 @@ class Distributions:
                 \theta` terms, ordered from lower to higher :math:`\cos \theta`
                 powers
             """
+            # apply conversion matrix to all radii
+            return self._cossin_matrix().dot(self.cn)
+
+        def _cossin_matrix(self):
+            """
+            Conversion matrix cos^n → cos^n sin^m.
+            """
             # conversion matrix (cos^k → cos^n sin^m) for even k
             CS = np.flip(pascal(1 + self.order // 2, 'upper'))
-            # apply to all radii
             if self.odd:
-                cs = np.empty_like(self.cn)
+                terms = self.cn.shape[0]
+                M = np.zeros((terms, terms))
                 # even powers
-                cs[::2] = CS.dot(self.cn[::2])
+                M[::2, ::2] = CS
                 # odd powers
                 if self.order % 2 == 0:  # even orders have
                     CS = CS[1:, 1:]  # one less odd term
-                cs[1::2] = CS.dot(self.cn[1::2])
-            else:
-                cs = CS.dot(self.cn)
-            return cs
+                M[1::2, 1::2] = CS
+                return M
+            return CS
 
         def rcossin(self):
             """
@@ -1194,6 +1397,13 @@ class Distributions:
             """
             return np.vstack((self.r, self.cossin()))
 
+        def cossin_var(self):
+            """
+            Variances of the distributions returned by :meth:`cossin`
+            (available only if pixel variances were supplied for the analysis).
+            """
+            return self._var(self._cossin_matrix())
+
         def harmonics(self):
             r"""
             Radial distributions of spherical harmonics
@@ -1215,8 +1425,16 @@ class Distributions:
             Pn : (# terms) × (rmax + 1) numpy array
                 radial dependences of the :math:`P_n(\cos \theta)` terms
             """
+            # apply conversion matrix to all radii
+            harm = self._harmonics_matrix().dot(self.cn)
+            return harm
+
+        def _harmonics_matrix(self):
+            """
+            Conversion matrix cos^k → P_n.
+            """
             terms = self.cn.shape[0]
-            # conversion matrix (cos^k → P_n)
+            # inverse conversion matrix (P_n → cos^k)
             CH = np.zeros((terms, terms))
             for i in range(terms):
                 if self.odd:
@@ -1224,10 +1442,7 @@ class Distributions:
                 else:
                     c = legendre(2 * i).c[::-2]
                 CH[:len(c), i] = c
-            CH = inv(CH)
-            # apply to all radii
-            harm = CH.dot(self.cn)
-            return harm
+            return inv(CH)
 
         def rharmonics(self):
             """
@@ -1235,6 +1450,13 @@ class Distributions:
             """
             return np.vstack((self.r, self.harmonics()))
 
+        def harmonics_var(self):
+            """
+            Variances of the distributions returned by :meth:`harmonics`
+            (available only if pixel variances were supplied for the analysis).
+            """
+            return self._var(self._harmonics_matrix())
+
         def Ibeta(self, window=1):
             r"""
             Radial intensity and anisotropy distributions.
@@ -1312,7 +1534,31 @@ class Distributions:
             """
             return np.vstack((self.r, self.Ibeta(window)))
 
-    def image(self, IM):
+        def Ibeta_var(self):
+            r"""
+            Variances of the distributions returned by :meth:`Ibeta` (with
+            **window** = 1; available only if pixel variances were supplied for
+            the analysis). For the anisotropy parameters, the first-order
+            (linear) error propagation is used, which is valid only when their
+            relative errors are small.
+            """
+            if self.cov is None:
+                raise ValueError('Variances were not calculated')
+            M = self._harmonics_matrix()
+            P0, Pn = np.vsplit(M.dot(self.cn), [1])
+            # covariance matrices of harmonics
+            cov = np.einsum('ij,rjk,lk->ril', M, self.cov, M)
+            var00 = cov[:, 0, 0]
+            varI = (4 * np.pi * self.r**2)**2 * var00
+            # beta = Pn / P0
+            beta = np.divide(Pn, P0, out=np.zeros_like(Pn), where=P0 != 0)
+            varn0 = cov[:, 1:, 0].T
+            varnn = np.diagonal(cov, axis1=1, axis2=2)[:, 1:].T
+            varbeta = np.divide(varnn - 2 * beta * varn0 + beta**2 * var00,
+                                P0**2, out=np.zeros_like(Pn), where=P0 != 0)
+            return np.vstack((varI, varbeta))
+
+    def image(self, IM, var=None):
         """
         Analyze an image.
 
@@ -1326,6 +1572,11 @@ class Distributions:
         ----------
         IM : m × n numpy array
             the image to analyze
+        var : m × n numpy array, optional
+            variances of the image pixels (for example, ``var=IM`` for Poisson
+            statistics), assumed to be independent. If given, the variances of
+            the distributions are also calculated (not implemented for the
+            ``'remap'`` method), see :attr:`Results.cov`.
 
         Returns
         -------
@@ -1340,12 +1591,7 @@ class Distributions:
         if self.weights is not None:
             IM = self.weights * IM  # (not *=)
 
-        if self.fold:
-            Q = np.zeros((self.Qheight, self.Qwidth))
-            for src, dst in self.regions:
-                Q[dst] += IM[src]
-        else:  # quadrant
-            Q = IM[self.flip_row, self.flip_col]
+        Q = self._fold(IM)
 
         if self.method == 'remap':
             # resample to polar grid
@@ -1363,6 +1609,181 @@ class Distributions:
         else:  # 'remap'
             p = [self._int_remap(Q, c) for c in self.c]
 
+        res = self._results(p)
+        if var is not None:
+            res.cov = self._cov(var)[0]
+        return res
+
+    def _fold(self, IM):
+        """
+        Fold the image to one quadrant (or half).
+        """
+        if self.fold:
+            Q = np.zeros((self.Qheight, self.Qwidth))
+            for src, dst in self.regions:
+                Q[dst] += IM[src]
+        else:  # quadrant
+            Q = IM[self.flip_row, self.flip_col]
+        return Q
+
+    def _cov(self, var):
+        """
+        Calculate covariance matrices of cos^n terms from pixel variances.
+
+        var : pixel variances (independent)
+
+        Returns (cov0, cov1) with N × N matrices
+        cov0[r] = Cov(I(r), I(r)) for r = 0, ..., rmax and
+        cov1[r] = Cov(I(r), I(r + 1)) for r = 0, ..., rmax - 1.
+        """
+        if self.method == 'remap':
+            raise ValueError('Variances cannot be calculated with '
+                             'method="remap"')
+        self._precalc(var.shape)
+
+        # apply squared weighting and folding
+        if self.weights is not None:
+            var = self.weights**2 * var  # (not *=)
+        Qv = self._fold(var)
+        if self.use_sin:
+            Qv = self.Qsin**2 * Qv  # (not *=)
+
+        # all needed powers of cosine, up to 2 × order
+        c = self.c[:]
+        for n in range(self.N, 2 * self.N - 1):
+            c.append(c[1] * c[n - 1])
+
+        # integrals of squared (and cross) weights
+        rmax = self.rmax
+        if self.method == 'nearest':
+            s0 = [self._int_nearest(Qv, cn) for cn in c]
+            s1 = np.zeros((len(c), rmax))
+        else:  # 'linear'
+            wl2, wu2 = self.wl**2, self.wu**2
+            s0 = [self._int_linear(wl2, wu2, Qv, cn) for cn in c]
+            # lower and upper bins
+            wlu = self.wl * self.wu * Qv
+            s1 = [np.bincount(self.bin.reshape(-1),
+                              (wlu if cn is None else wlu * cn).reshape(-1),
+                              rmax + 2)[:rmax] for cn in c]
+        # Hankel matrices of integrals for each radius
+        k = np.add.outer(np.arange(self.N), np.arange(self.N))
+        S0 = np.array(s0).T[:, k]
+        S1 = np.array(s1).T[:, k]
+
+        # convert to coefficients (I(r) = C(r)·p(r) for each r)
+        cov0 = np.einsum('rij,rjk,rlk->ril', self.C, S0, self.C)
+        cov1 = np.einsum('rij,rjk,rlk->ril', self.C[:-1], S1, self.C[1:])
+        return cov0, cov1
+
+    def events(self, x, y, w=None, shape=None):
+        r"""
+        Analyze event data (centroided particle hits).
+
+        The events are binned directly into the radial distributions, without
+        building an image, using their exact (sub-pixel) coordinates. The
+        results are equivalent to analyzing the image formed by these events
+        (each event contributes its weight to the pixel containing it), but
+        avoid the pixelization errors and, for sparse data, are computed much
+        faster.
+
+        Parameters
+        ----------
+        x, y : 1D numpy arrays
+            event coordinates in the image frame: **x** along the columns,
+            **y** along the rows (downwards), in pixels, such that the center
+            of the pixel [*i*, *j*] has *x* = *j*, *y* = *i*. Events outside
+            the image frame are ignored.
+        w : 1D numpy array, optional
+            event weights (by default, all events have unit weights)
+        shape : tuple of int, optional
+            (rows, columns) shape of the image frame. Required unless it is
+            already known from the **weights** array or previously analyzed
+            images.
+
+        Returns
+        -------
+        results : Distributions.Results object
+            the object with analysis results, see :class:`Results`
+        """
+        if shape is None:
+            if self.shape is None:
+                raise ValueError('Image shape must be specified')
+            shape = self.shape
+        if self.method == 'remap':
+            raise ValueError('Events cannot be analyzed with method="remap"')
+        # do precalculations (if needed)
+        self._precalc(shape)
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        w = np.ones_like(x) if w is None else np.asarray(w, dtype=float)
+
+        # pixels containing the events
+        height, width = shape
+        i = np.rint(y).astype(np.intp)
+        j = np.rint(x).astype(np.intp)
+        inside = (i >= 0) & (i < height) & (j >= 0) & (j < width)
+        if not inside.all():
+            x, y, w = x[inside], y[inside], w[inside]
+            i, j = i[inside], j[inside]
+
+        # apply weighting
+        if self.weights is not None:
+            w = self.weights[i, j] * w  # (not *=)
+
+        # folding (see _precalc())
+        X = np.abs(x - self.col)
+        Y = self.row - y
+        if not self.odd:
+            Y = np.abs(Y)
+        r = np.sqrt(X**2 + Y**2)
+        center = (r == 0)
+        r[center] = np.inf  # (avoid division by zero)
+        if self.use_sin:
+            sin = X / r
+            sin[center] = 1  # (as in _precalc())
+            w = sin * w
+        # cos theta or cos^2 theta
+        c = Y / r if self.odd else (Y / r)**2
+        r[center] = 0  # (restore)
+
+        # radial bins (events beyond rmax are discarded)
+        if self.method == 'nearest':
+            rbin = r.round().astype(np.intp)
+        else:  # 'linear'
+            rbin = r.astype(np.intp)
+        rbin[rbin > self.rmax] = self.rmax + 1
+        if self.method == 'linear':
+            wu = w * (r - rbin)
+            wl = w - wu
+
+        # calculate integrals
+        def bincount(a):
+            return np.bincount(rbin, a, self.rmax + 2)[:-1]
+
+        p = []
+        cn = None  # cos^n, n = 0, 1, ...
+        for n in range(self.N):
+            if n == 1:
+                cn = c
+            elif n > 1:
+                cn = cn * c
+            if self.method == 'nearest':
+                p.append(bincount(w if cn is None else cn * w))
+            else:  # 'linear'
+                pn = bincount(wl if cn is None else cn * wl)
+                pn[1:] += bincount(wu if cn is None else cn * wu)[:-1]
+                p.append(pn)
+
+        return self._results(p)
+
+    def _results(self, p):
+        """
+        Convert angular integrals to Results object.
+
+        p : list of integrals for each power of cos
+        """
         # convert integrals to coefficients (I(r) = C(r)·p(r) for each r)
         I = np.einsum('jik,kj->ij', self.C, p)
 
@@ -1371,8 +1792,8 @@ class Distributions:
 
         return self.Results(r, I, self.order, self.odd, self.valid)
 
-    def __call__(self, IM):
-        return self.image(IM)
+    def __call__(self, IM, var=None):
+        return self.image(IM, var)
 
 
 def harmonics(IM, origin='cc', rmax='MIN', order=2, **kwargs):
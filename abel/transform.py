@@ -158,7 +158,8 @@ class Transform:
 
     angular_integration_options : dict
         Additional arguments passed to the angular integration functions,
-        see :func:`abel.tools.vmi.angular_integration_3D()`.
+        see :func:`abel.tools.vmi.angular_integration_3D()`. For example,
+        ``dict(method='bin')`` makes the integration much faster.
 
     recast_as_float64 : bool
         determines whether the input image should be recast to